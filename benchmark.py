@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+
+from datetime import datetime, timezone
+from random import Random
+from board import np
+from game import Game
+from game_state import GameState
+from utils import parse_list, percentile
+from enums.directions import Directions
+
+def create_game_state_dict(width, height, player_count, density, speed, seed):
+    """Creates a random game state in the format sent by the server
+
+    Args:
+        width (int): The width of the playing field
+        height (int): The height of the playing field
+        player_count (int): Amount of players, player 1 is controlled
+        density (float): Share of cells which are occupied
+        speed (int): The speed of all players
+        seed (int): Seed of the random board
+
+    Returns:
+        dict: The game state
+    """
+    rng = Random(seed)
+    cells = [[rng.randint(1, player_count) if rng.random() < density else 0 for _ in range(width)] for _ in range(height)]
+
+    players = dict()
+    positions = rng.sample(range(width * height), player_count)
+    for index, position in enumerate(positions):
+        x, y = position % width, position // width
+        cells[y][x] = index + 1
+        players[str(index + 1)] = {
+            'x': x,
+            'y': y,
+            'direction': str(Directions(rng.randint(0, 3))),
+            'speed': speed,
+            'active': True
+        }
+
+    return {
+        'width': width,
+        'height': height,
+        'cells': cells,
+        'players': players,
+        'you': 1,
+        'running': True,
+        'deadline': ''
+    }
+
+def measure(function, repeat):
+    """Calls the function repeatedly and measures latency and peak memory
+
+    Args:
+        function (callable): The function to measure, it returns the amount of expanded nodes or None
+        repeat (int): Amount of timed calls
+
+    Returns:
+        dict: p50 and p99 latency in milliseconds, nodes per second and peak memory in KiB
+    """
+    latencies = []
+    nodes = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        result = function()
+        latencies.append(time.perf_counter() - start)
+        nodes += result or 0
+
+    # a separate call, tracemalloc slows the measured code down
+    gc.collect()
+    tracemalloc.start()
+    function()
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'p50_ms': percentile(latencies, 0.5) * 1000,
+        'p99_ms': percentile(latencies, 0.99) * 1000,
+        'nodes_per_second': nodes / sum(latencies) if nodes else None,
+        'peak_memory_kib': peak_memory / 1024
+    }
+
+def run_case(width, height, player_count, density, speed, depth, repeat, seed=0):
+    """Benchmarks GameState.from_dict, Game.predict_move and Game._calculate_graph for one configuration
+
+    Returns:
+        dict: The configuration and the results of each measured function
+    """
+    game_state_dict = create_game_state_dict(width, height, player_count, density, speed, seed)
+    game_state = GameState.from_dict(game_state_dict)
+    snake = game_state.get_player()
+
+    def from_dict():
+        GameState.from_dict(game_state_dict)
+
+    def predict_move():
+        game = Game(depth=depth)
+        game.predict_move(game_state)
+        return game.get_search_stats()['nodes']
+
+    def calculate_graph():
+        game = Game(game_state=game_state, depth=depth)
+        game._move_counter = 1
+        game._calculate_graph(snake.get_pos(), snake.get_direction(), snake.get_speed(), depth)
+        return game._nodes_expanded
+
+    return {
+        'width': width,
+        'height': height,
+        'players': player_count,
+        'density': density,
+        'speed': speed,
+        'depth': depth,
+        'from_dict': measure(from_dict, repeat),
+        'predict_move': measure(predict_move, repeat),
+        'calculate_graph': measure(calculate_graph, repeat)
+    }
+
+def case_key(case):
+    return (case['width'], case['height'], case['players'], case['density'], case['speed'], case['depth'])
+
+def compare(results, baseline):
+    """Prints the p50 latency of each case relative to a baseline run
+
+    Args:
+        results (dict): The current results
+        baseline (dict): The results of an earlier run
+    """
+    baseline_cases = {case_key(case): case for case in baseline['cases']}
+    for case in results['cases']:
+        old_case = baseline_cases.get(case_key(case))
+        if old_case is None:
+            continue
+        ratios = ['%s %.2fx' % (name, case[name]['p50_ms'] / old_case[name]['p50_ms'])
+                  for name in ['from_dict', 'predict_move', 'calculate_graph'] if old_case[name]['p50_ms'] > 0]
+        print('%sx%s players=%s density=%s speed=%s depth=%s: %s' % (case_key(case) + (', '.join(ratios),)))
+
+def _git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def _parse_size(value):
+    width, height = value.split('x')
+    return int(width), int(height)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmarks the search for several board sizes, player counts, densities, speeds and depths')
+    parser.add_argument('--sizes', default='20x20,50x50,80x80')
+    parser.add_argument('--players', default='2,6')
+    parser.add_argument('--densities', default='0.1,0.3')
+    parser.add_argument('--speeds', default='1,5')
+    parser.add_argument('--depths', default='3,5,7')
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', default=None, help='results of an earlier run to compare with')
+    args = parser.parse_args()
+
+    cases = []
+    for width, height in parse_list(args.sizes, _parse_size):
+        for player_count in parse_list(args.players, int):
+            for density in parse_list(args.densities, float):
+                for speed in parse_list(args.speeds, int):
+                    for depth in parse_list(args.depths, int):
+                        case = run_case(width, height, player_count, density, speed, depth, args.repeat, seed=args.seed)
+                        print('%sx%s players=%s density=%s speed=%s depth=%s: predict_move p50 %.1f ms' % (
+                            case_key(case) + (case['predict_move']['p50_ms'],)), flush=True)
+                        cases.append(case)
+
+    results = {
+        'commit': _git_commit(),
+        'created': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'numpy': np is not None,
+        'cases': cases
+    }
+    with open(args.output, 'w') as output:
+        json.dump(results, output, indent=2)
+
+    if args.compare is not None:
+        with open(args.compare) as baseline:
+            compare(results, json.load(baseline))
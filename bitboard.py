@@ -0,0 +1,143 @@
+from board import np
+from enums.directions import Directions
+
+# moves with speed up to 11 are generated (speeding up at speed 10), faster ones are checked without table
+MAX_TABLE_SPEED = 11
+
+def _segment_mask(direction, speed, jump):
+    """Calculates the mask of the cells covered by a straight move
+
+    Args:
+        direction (Directions): The direction of the move
+        speed (int): The length of the move
+        jump (bool): Whether only the first and the last cell are covered
+
+    Returns:
+        (bool, int, int): Whether the move is vertical (checked against a column), the mask of the covered cells
+                          starting at the lowest cell and the offset of the lowest cell to the start of the move
+    """
+    mask = (1 | 1 << (speed - 1)) if jump else (1 << speed) - 1
+    offset = 1 if direction == Directions.RIGHT or direction == Directions.DOWN else -speed
+    return direction == Directions.UP or direction == Directions.DOWN, mask, offset
+
+# built once at import time, indexed by (direction, speed, jump)
+SEGMENT_MASKS = {(direction, speed, jump): _segment_mask(direction, speed, jump)
+                 for direction in Directions for speed in range(1, MAX_TABLE_SPEED + 1) for jump in (False, True)}
+
+class BitBoard:
+
+    def __init__(self, width, height, rows, columns):
+        """Creates a bitboard, the occupancy of each row and column as one int.
+        Bit x of a row and bit y of a column are set if the cell (x, y) is occupied.
+
+        Args:
+            width (int): The width of the board
+            height (int): The height of the board
+            rows (list): One int per row
+            columns (list): One int per column
+        """
+        self._width = width
+        self._height = height
+        self._rows = rows
+        self._columns = columns
+
+    def get_width(self):
+        """Returns the width of the board
+
+        Returns:
+            int: The width
+        """
+        return self._width
+
+    def get_height(self):
+        """Returns the height of the board
+
+        Returns:
+            int: The height
+        """
+        return self._height
+
+    def is_empty(self, x, y):
+        """Checks whether the specified cell is empty
+
+        Args:
+            x (int): The column of the cell
+            y (int): The row of the cell
+
+        Returns:
+            bool: True if the cell is empty, otherwise False
+        """
+        return not self._rows[y] >> x & 1
+
+    def fill(self, x, y):
+        """Marks the specified cell as occupied
+
+        Args:
+            x (int): The column of the cell
+            y (int): The row of the cell
+        """
+        self._rows[y] |= 1 << x
+        self._columns[x] |= 1 << y
+
+    def is_move_free(self, x, y, direction, speed, jump):
+        """Checks whether the cells covered by a straight move are empty. The move has to end on the board.
+
+        Args:
+            x (int): The column of the start
+            y (int): The row of the start
+            direction (Directions): The direction of the move
+            speed (int): The length of the move
+            jump (bool): Whether only the first and the last cell are covered
+
+        Returns:
+            bool: True if all covered cells are empty, otherwise False
+        """
+        segment = SEGMENT_MASKS.get((direction, speed, jump))
+        if segment is None:
+            segment = _segment_mask(direction, speed, jump)
+        vertical, mask, offset = segment
+        if vertical:
+            return not (self._columns[x] >> (y + offset)) & mask
+        return not (self._rows[y] >> (x + offset)) & mask
+
+    def __eq__(self, other):
+        """Compares the occupancy of two bitboards
+
+        Args:
+            other (BitBoard): The other bitboard
+
+        Returns:
+            bool: True if the same cells are occupied, otherwise False
+        """
+        return isinstance(other, BitBoard) and self._rows == other._rows and self._columns == other._columns
+
+    # the rows and columns are mutable (see fill), so bitboards can not be used as dict keys
+    __hash__ = None
+
+    @staticmethod
+    def from_board(board):
+        """Creates the bitboard of a board, every cell with a value other than 0 is occupied
+
+        Args:
+            board (Board): The board
+
+        Returns:
+            BitBoard: The created bitboard
+        """
+        width, height = board.get_width(), board.get_height()
+        if np is not None and board.is_numpy():
+            occupied = board.get_buffer() != 0
+            rows = [int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little') for row in occupied]
+            columns = [int.from_bytes(np.packbits(column, bitorder='little').tobytes(), 'little') for column in occupied.T]
+            return BitBoard(width, height, rows, columns)
+
+        rows = [0] * height
+        columns = [0] * width
+        cells = board.get_buffer()
+        for y in range(height):
+            offset = y * width
+            for x in range(width):
+                if cells[offset + x] != 0:
+                    rows[y] |= 1 << x
+                    columns[x] |= 1 << y
+        return BitBoard(width, height, rows, columns)
@@ -0,0 +1,208 @@
+from array import array
+from itertools import chain
+from enums.textures import Textures
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class Board:
+
+    def __init__(self, width, height, cells):
+        """Creates a board from a buffer which already holds the cell values
+
+        Args:
+            width (int): The width of the board
+            height (int): The height of the board
+            cells (numpy.ndarray or array): Either an int8 array with the shape height * width
+                                            or a flat array of type 'b' in row-major order
+        """
+        self._width = width
+        self._height = height
+        self._cells = cells
+        self._is_numpy = np is not None and isinstance(cells, np.ndarray)
+        # increased by every change of a cell, so structures derived from the board can detect that they are stale
+        self._version = 0
+
+    def get_width(self):
+        """Returns the width of the board
+
+        Returns:
+            int: The width
+        """
+        return self._width
+
+    def get_height(self):
+        """Returns the height of the board
+
+        Returns:
+            int: The height
+        """
+        return self._height
+
+    def get_buffer(self):
+        """Returns the raw buffer of the board
+
+        Returns:
+            numpy.ndarray or array: The int8 cell values (height * width or flat in row-major order)
+        """
+        return self._cells
+
+    def is_numpy(self):
+        """Returns whether the board is backed by a NumPy array
+
+        Returns:
+            bool: True if NumPy is used, otherwise False
+        """
+        return self._is_numpy
+
+    def get_version(self):
+        """Returns the amount of changes made with set_value
+
+        Returns:
+            int: The version of the cells
+        """
+        return self._version
+
+    def get_value(self, x, y):
+        """Returns the value of the specified cell
+
+        Args:
+            x (int): The column of the cell
+            y (int): The row of the cell
+
+        Returns:
+            int: The value of the cell (see Textures)
+        """
+        if self._is_numpy:
+            return int(self._cells[y, x])
+        return self._cells[y * self._width + x]
+
+    def set_value(self, x, y, value):
+        """Sets the value of the specified cell
+
+        Args:
+            x (int): The column of the cell
+            y (int): The row of the cell
+            value (int): The new value of the cell (see Textures)
+        """
+        if self._is_numpy:
+            self._cells[y, x] = value
+        else:
+            self._cells[y * self._width + x] = value
+        self._version += 1
+
+    def is_empty(self, x, y):
+        """Checks whether the specified cell is empty
+
+        Args:
+            x (int): The column of the cell
+            y (int): The row of the cell
+
+        Returns:
+            bool: True if the cell is empty, otherwise False
+        """
+        if self._is_numpy:
+            return self._cells[y, x] == 0
+        return self._cells[y * self._width + x] == 0
+
+    def is_row_segment_empty(self, y, x_from, x_to):
+        """Checks whether all cells of a row between two columns (both inclusive) are empty
+
+        Args:
+            y (int): The row of the segment
+            x_from (int): The first column of the segment
+            x_to (int): The last column of the segment, not smaller than x_from
+
+        Returns:
+            bool: True if all cells of the segment are empty, otherwise False
+        """
+        if self._is_numpy:
+            return not self._cells[y, x_from:x_to + 1].any()
+        offset = y * self._width
+        return not any(self._cells[offset + x_from:offset + x_to + 1])
+
+    def is_column_segment_empty(self, x, y_from, y_to):
+        """Checks whether all cells of a column between two rows (both inclusive) are empty
+
+        Args:
+            x (int): The column of the segment
+            y_from (int): The first row of the segment
+            y_to (int): The last row of the segment, not smaller than y_from
+
+        Returns:
+            bool: True if all cells of the segment are empty, otherwise False
+        """
+        if self._is_numpy:
+            return not self._cells[y_from:y_to + 1, x].any()
+        return not any(self._cells[y_from * self._width + x:y_to * self._width + x + 1:self._width])
+
+    def to_textures(self):
+        """Converts the board into a two dimensional array of Textures
+
+        Returns:
+            2d array: The cells of the board with the dimension height * width
+        """
+        values = self._cells.tolist()
+        if not self._is_numpy:
+            values = [values[y * self._width:(y + 1) * self._width] for y in range(self._height)]
+        return [[Textures(x) for x in row] for row in values]
+
+    def copy(self):
+        """Returns a copy of the board which does not share the buffer
+
+        Returns:
+            Board: The copied board
+        """
+        return Board(self._width, self._height, self._cells.copy() if self._is_numpy else array('b', self._cells))
+
+    def __eq__(self, other):
+        """Compares the size and the cells of two boards, independent of their buffer type
+
+        Args:
+            other (Board): The other board
+
+        Returns:
+            bool: True if both boards have the same size and cell values, otherwise False
+        """
+        if not isinstance(other, Board) or self._width != other._width or self._height != other._height:
+            return False
+        if self._is_numpy and other._is_numpy:
+            return bool(np.array_equal(self._cells, other._cells))
+        return list(self._iterate_values()) == list(other._iterate_values())
+
+    # the cells are mutable, so boards are compared by value but can not be used as dict keys
+    __hash__ = None
+
+    def _iterate_values(self):
+        """Iterates over the cell values row by row
+
+        Returns:
+            iterator: The values of all cells
+        """
+        return self._cells.flat if self._is_numpy else self._cells
+
+    @staticmethod
+    def from_cells(width, height, cells, use_numpy=None):
+        """Creates a compact board from a two dimensional array of cell values
+
+        Args:
+            width (int): The width of the board
+            height (int): The height of the board
+            cells (2d array): The cells as ints or Textures with the dimension height * width
+            use_numpy (bool, optional): Whether to use NumPy. Defaults to None (use it if installed).
+
+        Returns:
+            Board: The created Board object
+        """
+        if use_numpy is None:
+            use_numpy = np is not None
+        if height > 0 and width > 0 and isinstance(cells[0][0], Textures):
+            cells = [[x.value for x in y] for y in cells]
+
+        if use_numpy:
+            buffer = np.array(cells, dtype=np.int8).reshape(height, width)
+        else:
+            buffer = array('b', chain.from_iterable(cells))
+        return Board(width, height, buffer)
@@ -0,0 +1,118 @@
+from board import Board
+from game_state import GameState
+
+class BoardTracker:
+
+    def __init__(self, verify_interval=20):
+        """Keeps the board between the states of a game and only applies the changes of each tick
+
+        Args:
+            verify_interval (int, optional): Every how many updates the whole board is compared
+                                             with the received cells, 0 never compares. Defaults to 20.
+        """
+        self._verify_interval = verify_interval
+        self._board = None
+        self._positions = None
+        self._updates = 0
+        self._rebuilds = 0
+
+    def update(self, game_state_as_dict, load_board=None):
+        """Creates the GameState of the next tick. Only the cells between the previous and the
+        current position of each player are changed. If the moves of the players are not
+        consistent with the previous state, the board is created from all cells.
+
+        Args:
+            game_state_as_dict ([dict]): the game state as dictionary
+            load_board (callable, optional): Decodes the received cells into a board (see decoder.decode_board).
+                                             It is only called on ticks which verify or rebuild the board,
+                                             on the other ticks the moved cells get the id of their player.
+                                             Defaults to None (the cells of the dictionary are used).
+
+        Returns:
+            [GameState]: The created GameState object
+        """
+        self._updates += 1
+        board = self._apply_changes(game_state_as_dict, load_board)
+        game_state = GameState.from_dict(game_state_as_dict, board=board)
+        self._board = game_state.get_board()
+        self._positions = {player.get_id(): player.get_pos() for player in game_state.get_players()}
+        return game_state
+
+    def get_update_count(self):
+        """Returns the number of received states
+
+        Returns:
+            int: Amount of updates
+        """
+        return self._updates
+
+    def get_rebuild_count(self):
+        """Returns how often the board was created from all cells
+
+        Returns:
+            int: Amount of rebuilds
+        """
+        return self._rebuilds
+
+    def _apply_changes(self, game_state_as_dict, load_board=None):
+        """Copies the previous board and applies the moves of all players
+
+        Args:
+            game_state_as_dict ([dict]): the game state as dictionary
+            load_board (callable, optional): Decodes the received cells into a board. Defaults to None.
+
+        Returns:
+            Board: The board of the new state
+        """
+        width = game_state_as_dict['width']
+        height = game_state_as_dict['height']
+        players = game_state_as_dict['players']
+        cells = None
+        if load_board is None:
+            cells = game_state_as_dict['cells']
+            load_board = lambda: Board.from_cells(width, height, cells)
+
+        if (self._board is None or self._board.get_width() != width or self._board.get_height() != height
+                or set(self._positions) != set(int(key) for key in players)):
+            return self._rebuild(load_board)
+
+        board = self._board.copy()
+        for key, player in players.items():
+            x, y = self._positions[int(key)]
+            dx, dy = player['x'] - x, player['y'] - y
+            if dx == 0 and dy == 0:
+                continue
+            if dx != 0 and dy != 0:
+                return self._rebuild(load_board)
+
+            step_x = (dx > 0) - (dx < 0)
+            step_y = (dy > 0) - (dy < 0)
+            for _ in range(max(abs(dx), abs(dy))):
+                x += step_x
+                y += step_y
+                if 0 <= x < width and 0 <= y < height:
+                    # without the cells the id is used, collisions (-1) are only corrected by the verification
+                    board.set_value(x, y, cells[y][x] if cells is not None else int(key))
+
+            # an active player occupies the cell of its head
+            if player['active'] and (not 0 <= x < width or not 0 <= y < height or board.is_empty(x, y)):
+                return self._rebuild(load_board)
+
+        if self._verify_interval > 0 and self._updates % self._verify_interval == 0:
+            received_board = load_board()
+            if board != received_board:
+                self._rebuilds += 1
+                return received_board
+        return board
+
+    def _rebuild(self, load_board):
+        """Creates the board from all received cells
+
+        Args:
+            load_board (callable): Decodes the received cells into a board
+
+        Returns:
+            Board: The created board
+        """
+        self._rebuilds += 1
+        return load_board()
@@ -0,0 +1,117 @@
+import json
+import time
+import urllib.request
+
+from game_state import GameState
+
+# the time endpoint of the spe_ed server
+TIME_URL = 'https://msoll.de/spe_ed_time'
+
+def fetch_server_time(url=TIME_URL, timeout=5):
+    """Requests the current time of the server
+
+    Args:
+        url (str, optional): The time endpoint, which responds with {"time": "<ISO time>", "milliseconds": <int>}.
+                             Defaults to TIME_URL.
+        timeout (float, optional): Seconds to wait for the response. Defaults to 5.
+
+    Returns:
+        float: The server time in seconds since the epoch
+    """
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        server_time = json.loads(response.read())
+    parsed = GameState.parse_deadline(server_time['time'])
+    if parsed is None:
+        raise ValueError('invalid server time %s' % server_time['time'])
+    # the time string has whole seconds, the milliseconds are sent separately
+    return parsed.replace(microsecond=0).timestamp() + server_time.get('milliseconds', 0) / 1000
+
+class ServerClock:
+
+    def __init__(self, max_samples=8):
+        """Estimates the offset between the server clock and the local clock and the one way latency.
+        Time samples of the server are evaluated like NTP, the sample with the shortest round trip is trusted most.
+        Every received state bounds the offset, since its deadline can not have passed on the server when it was sent.
+
+        Args:
+            max_samples (int, optional): Amount of recent time samples which are kept. Defaults to 8.
+        """
+        self._max_samples = max_samples
+        # (round trip, offset) of each time sample
+        self._samples = []
+        self._offset_bound = None
+
+    def add_time_sample(self, server_time, sent, received):
+        """Adds a time sample of the server
+
+        Args:
+            server_time (float): The server time in seconds since the epoch
+            sent (float): Local time (time.time) at which the request was sent
+            received (float): Local time (time.time) at which the response was received
+        """
+        self._samples.append((received - sent, server_time - (sent + received) / 2))
+        del self._samples[:-self._max_samples]
+
+    def add_message(self, deadline, received):
+        """Adds the arrival of a state
+
+        Args:
+            deadline (str): The deadline of the state as sent by the server
+            received (float): Local time (time.time) at which the state was received
+        """
+        parsed = GameState.parse_deadline(deadline)
+        if parsed is None:
+            return
+        bound = parsed.timestamp() - received
+        if self._offset_bound is None or bound < self._offset_bound:
+            self._offset_bound = bound
+
+    def synchronize(self, fetch_time, samples=4):
+        """Takes time samples with the given function
+
+        Args:
+            fetch_time (callable): Returns the server time in seconds since the epoch, e.g. fetch_server_time,
+                                   or time.time as local stand-in
+            samples (int, optional): Amount of samples. Defaults to 4.
+        """
+        for _ in range(samples):
+            sent = time.time()
+            server_time = fetch_time()
+            self.add_time_sample(server_time, sent, time.time())
+
+    def get_offset(self):
+        """Returns the estimated offset of the server clock
+
+        Returns:
+            float: Seconds to add to the local time to get the server time
+        """
+        offset = min(self._samples)[1] if self._samples else 0.0
+        if self._offset_bound is not None and offset > self._offset_bound:
+            offset = self._offset_bound
+        return offset
+
+    def get_latency(self):
+        """Returns the estimated one way latency to the server
+
+        Returns:
+            float: Half of the shortest round trip in seconds, 0 without time samples
+        """
+        return min(self._samples)[0] / 2 if self._samples else 0.0
+
+    def get_usable_time(self, deadline, now=None):
+        """Returns the seconds which can be used for computing before the response has to be sent,
+        so it reaches the server before the deadline
+
+        Args:
+            deadline (str): The deadline of the state as sent by the server
+            now (float, optional): The local time (time.time). Defaults to None (current time).
+
+        Returns:
+            float: The usable seconds (negative if the response is already late), None if the deadline is not valid
+        """
+        parsed = GameState.parse_deadline(deadline)
+        if parsed is None:
+            return None
+        if now is None:
+            now = time.time()
+        return parsed.timestamp() - (now + self.get_offset()) - self.get_latency()
@@ -0,0 +1,139 @@
+import json
+import re
+
+from array import array
+from board import Board, np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# characters removed from the cells array, so only the comma separated values are left
+_CELLS_DELETE_TABLE = str.maketrans('', '', '[] \t\r\n')
+_EMPTY_ARRAY = re.compile(r'\[\s*\]')
+_ARRAY_END = re.compile(r'\]\s*\]')
+# the range of the int8 cells of a board
+CELL_MIN = -128
+CELL_MAX = 127
+
+def loads(json_string):
+    """Parses a json string with orjson if it is installed, otherwise with the json module
+
+    Args:
+        json_string (str): The json string
+
+    Returns:
+        The parsed object
+    """
+    if orjson is not None:
+        return orjson.loads(json_string)
+    return json.loads(json_string)
+
+def decode_game_state(json_string, decode_cells=True):
+    """Decodes a game state sent by the server. The cells array is parsed directly into
+    the buffer of a compact board, without creating nested lists. The rest of the message
+    is parsed with loads. If the cells can not be located, the whole message is parsed.
+
+    Args:
+        json_string (str): game state as json string
+        decode_cells (bool, optional): Whether the cells are decoded. Defaults to True. Otherwise the
+                                       board is None and can be decoded later with decode_board.
+
+    Returns:
+        (dict, Board): The game state as dictionary without cells and the board of the state
+
+    Raises:
+        ValueError: If a cell value does not fit into the int8 cells of the board
+    """
+    cells_start, cells_end = _find_cells(json_string)
+    if cells_start is None:
+        game_state_as_dict = loads(json_string)
+        if not decode_cells:
+            return game_state_as_dict, None
+        return game_state_as_dict, Board.from_cells(game_state_as_dict['width'], game_state_as_dict['height'], game_state_as_dict['cells'])
+
+    game_state_as_dict = loads(json_string[:cells_start] + '[]' + json_string[cells_end:])
+    if not decode_cells:
+        return game_state_as_dict, None
+    return game_state_as_dict, _decode_cells(json_string, cells_start, cells_end, game_state_as_dict['width'], game_state_as_dict['height'])
+
+def decode_board(json_string, width, height):
+    """Decodes only the cells of a game state sent by the server into a compact board
+
+    Args:
+        json_string (str): game state as json string
+        width (int): The width of the board
+        height (int): The height of the board
+
+    Returns:
+        Board: The board of the state
+
+    Raises:
+        ValueError: If a cell value does not fit into the int8 cells of the board
+    """
+    cells_start, cells_end = _find_cells(json_string)
+    if cells_start is None:
+        return Board.from_cells(width, height, loads(json_string)['cells'])
+    return _decode_cells(json_string, cells_start, cells_end, width, height)
+
+def _decode_cells(json_string, cells_start, cells_end, width, height):
+    """Parses the located cells array into a compact board
+
+    Args:
+        json_string (str): game state as json string
+        cells_start (int): Start of the cells array (see _find_cells)
+        cells_end (int): End of the cells array
+        width (int): The width of the board
+        height (int): The height of the board
+
+    Returns:
+        Board: The board of the state, created from the fully parsed message if the amount of cells does not match
+
+    Raises:
+        ValueError: If a cell value does not fit into the int8 cells of the board
+    """
+    values = json_string[cells_start:cells_end].translate(_CELLS_DELETE_TABLE)
+    # parsed wider than the int8 cells, so values out of range are detected instead of wrapped around
+    if np is not None:
+        buffer = np.array(values.split(','), dtype=np.int64) if values else np.zeros(0, dtype=np.int64)
+        if len(buffer) > 0 and (buffer.min() < CELL_MIN or buffer.max() > CELL_MAX):
+            raise ValueError('cell value out of range [%s, %s]' % (buffer.min(), buffer.max()))
+        buffer = buffer.astype(np.int8)
+    else:
+        parsed = [int(value) for value in values.split(',')] if values else []
+        if len(parsed) > 0 and (min(parsed) < CELL_MIN or max(parsed) > CELL_MAX):
+            raise ValueError('cell value out of range [%s, %s]' % (min(parsed), max(parsed)))
+        buffer = array('b', parsed)
+
+    if len(buffer) != width * height:
+        return Board.from_cells(width, height, loads(json_string)['cells'])
+
+    if np is not None:
+        buffer = buffer.reshape(height, width)
+    return Board(width, height, buffer)
+
+def _find_cells(json_string):
+    """Finds the array of the cells in the json string
+
+    Args:
+        json_string (str): game state as json string
+
+    Returns:
+        (int, int): Start (the opening bracket) and end (after the closing bracket) of the array, (None, None) if not found
+    """
+    key = json_string.find('"cells"')
+    if key == -1:
+        return None, None
+    start = json_string.find('[', key)
+    if start == -1 or json_string[key + len('"cells"'):start].strip() != ':':
+        return None, None
+
+    # the cells only contain ints, so the array ends at the first bracket which closes both levels
+    empty = _EMPTY_ARRAY.match(json_string, start)
+    if empty is not None:
+        return start, empty.end()
+    end = _ARRAY_END.search(json_string, start)
+    if end is None:
+        return None, None
+    return start, end.end()
@@ -21,3 +21,18 @@ class Commands(Enum):
         else:
             raise NotImplementedError
 
+    @staticmethod
+    def from_str(label):
+        if label == 'turn_left':
+            return Commands.TURN_LEFT
+        elif label == 'turn_right':
+            return Commands.TURN_RIGHT
+        elif label == 'slow_down':
+            return Commands.SLOW_DOWN
+        elif label == 'speed_up':
+            return Commands.SPEED_UP
+        elif label == 'change_nothing':
+            return Commands.CHANGE_NOTHING
+        else:
+            raise NotImplementedError
+
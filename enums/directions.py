@@ -6,6 +6,18 @@ class Directions(Enum):
     DOWN = 2
     LEFT = 3
 
+    def __str__(self):
+        if self == Directions.UP:
+            return 'up'
+        elif self == Directions.RIGHT:
+            return 'right'
+        elif self == Directions.DOWN:
+            return 'down'
+        elif self == Directions.LEFT:
+            return 'left'
+        else:
+            raise NotImplementedError
+
     @staticmethod
     def from_str(label):
         if label == 'up':
@@ -0,0 +1,236 @@
+from collections import deque
+from board import np
+
+# the score of a leaf is scaled to the range of the move count (0 to 5), so the collision penalty keeps its weight
+MAX_SCORE = 5
+
+class FloodFillEvaluator:
+
+    def __init__(self, radius=10):
+        """Scores a leaf by the amount of free cells reachable from it within the given amount of steps
+
+        Args:
+            radius (int, optional): Maximum amount of steps, which bounds the searched region. Defaults to 10.
+        """
+        self._radius = radius
+        self._board = None
+        self._cache = dict()
+
+    def prepare(self, game_state):
+        """Prepares the evaluator for the given state, must be called once per move
+
+        Args:
+            game_state (GameState): The current state of the game
+        """
+        self._board = game_state.get_board()
+        self._cache = dict()
+
+    def evaluate(self, pos):
+        """Calculates the score of a leaf at the given position
+
+        Args:
+            pos ([int, int]): The position of the snakes head at the leaf
+
+        Returns:
+            float: The score between 0 and MAX_SCORE
+        """
+        key = (pos[0], pos[1])
+        score = self._cache.get(key)
+        if score is None:
+            distances = calculate_distances(self._board, [key], self._radius, center=key)
+            reachable = _count_reachable(distances, self._radius)
+            score = MAX_SCORE * reachable / _max_cells(self._radius)
+            self._cache[key] = score
+        return score
+
+
+class VoronoiEvaluator:
+
+    def __init__(self, radius=10):
+        """Scores a leaf by the amount of free cells which the snake reaches strictly before every opponent.
+        The opponents start from their current positions, the snake from the leaf.
+
+        Args:
+            radius (int, optional): Maximum amount of steps, which bounds the searched region. Defaults to 10.
+        """
+        self._radius = radius
+        self._board = None
+        self._opponent_distances = None
+        self._cache = dict()
+
+    def prepare(self, game_state):
+        """Prepares the evaluator for the given state, must be called once per move.
+        The distances of the opponents are calculated here once for the whole board.
+
+        Args:
+            game_state (GameState): The current state of the game
+        """
+        self._board = game_state.get_board()
+        self._cache = dict()
+        opponents = [(player.get_x(), player.get_y()) for player in game_state.get_players()
+                     if player.get_id() != game_state.get_you() and player.is_active()]
+        # opponents have more steps, so they may also claim cells at the border of the leafs region
+        self._opponent_distances = calculate_distances(self._board, opponents, 3 * self._radius)
+
+    def evaluate(self, pos):
+        """Calculates the score of a leaf at the given position
+
+        Args:
+            pos ([int, int]): The position of the snakes head at the leaf
+
+        Returns:
+            float: The score between 0 and MAX_SCORE
+        """
+        key = (pos[0], pos[1])
+        score = self._cache.get(key)
+        if score is None:
+            distances = calculate_distances(self._board, [key], self._radius, center=key)
+            if np is not None and self._board.is_numpy():
+                own = (distances >= 1) & (distances <= self._radius) & (distances < self._opponent_distances)
+                territory = int(own.sum())
+            else:
+                territory = sum(1 for cell, distance in distances.items()
+                                if distance >= 1 and distance < self._opponent_distances.get(cell, self._radius * 3 + 1))
+            score = MAX_SCORE * territory / _max_cells(self._radius)
+            self._cache[key] = score
+        return score
+
+
+def create_evaluator(name):
+    """Creates a leaf evaluator by its name
+
+    Args:
+        name (str): 'flood_fill' or 'voronoi'
+
+    Returns:
+        The created evaluator
+
+    Raises:
+        ValueError: If there is no evaluator with the given name
+    """
+    if name == 'flood_fill':
+        return FloodFillEvaluator()
+    elif name == 'voronoi':
+        return VoronoiEvaluator()
+    else:
+        raise ValueError('unknown evaluator %r' % name)
+
+def calculate_distances(board, sources, radius, center=None):
+    """Calculates the amount of steps from the nearest source to every free cell (breadth first).
+    Sources are start cells even if they are occupied. Cells further away than radius are not reached.
+
+    Args:
+        board (Board): The board of the game
+        sources (list): The start cells as tuples
+        radius (int): Maximum amount of steps
+        center ((int, int), optional): Only cells within radius around this cell are searched. Defaults to None.
+
+    Returns:
+        NumPy boards: int array with the shape of the board, radius + 1 for unreached cells
+        Other boards: dict with the distance for each reached cell
+    """
+    if np is not None and board.is_numpy():
+        return _calculate_distances_numpy(board, sources, radius, center)
+    return _calculate_distances_bfs(board, sources, radius)
+
+def _calculate_distances_numpy(board, sources, radius, center):
+    """Calculates the distances by growing the reached cells one step at a time with array shifts
+
+    Args:
+        board (Board): The board of the game, backed by a NumPy array
+        sources (list): The start cells as tuples
+        radius (int): Maximum amount of steps
+        center ((int, int)): Only cells within radius around this cell are searched, None searches the whole board
+
+    Returns:
+        NumPy array: The distance of every cell, radius + 1 for unreached cells
+    """
+    height, width = board.get_height(), board.get_width()
+    distances = np.full((height, width), radius + 1, dtype=np.int16)
+    if len(sources) == 0:
+        return distances
+
+    # the region which can be reached within radius steps
+    if center is not None:
+        top, bottom = max(center[1] - radius, 0), min(center[1] + radius + 1, height)
+        left, right = max(center[0] - radius, 0), min(center[0] + radius + 1, width)
+    else:
+        top, bottom, left, right = 0, height, 0, width
+
+    free = board.get_buffer()[top:bottom, left:right] == 0
+    reached = np.zeros(free.shape, dtype=bool)
+    for x, y in sources:
+        if top <= y < bottom and left <= x < right:
+            reached[y - top, x - left] = True
+    window = distances[top:bottom, left:right]
+    window[reached] = 0
+
+    for step in range(1, radius + 1):
+        grown = reached.copy()
+        grown[1:, :] |= reached[:-1, :]
+        grown[:-1, :] |= reached[1:, :]
+        grown[:, 1:] |= reached[:, :-1]
+        grown[:, :-1] |= reached[:, 1:]
+        grown &= free
+        new = grown & ~reached
+        if not new.any():
+            break
+        window[new] = step
+        reached |= new
+    return distances
+
+def _calculate_distances_bfs(board, sources, radius):
+    """Calculates the distances with a breadth first search over the free cells
+
+    Args:
+        board (Board): The board of the game
+        sources (list): The start cells as tuples
+        radius (int): Maximum amount of steps
+
+    Returns:
+        dict: The distance for each reached cell as tuple
+    """
+    width, height = board.get_width(), board.get_height()
+    distances = dict()
+    queue = deque()
+    for source in sources:
+        distances[source] = 0
+        queue.append(source)
+
+    while queue:
+        x, y = queue.popleft()
+        distance = distances[(x, y)] + 1
+        if distance > radius:
+            continue
+        for neighbour in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if neighbour in distances or not (0 <= neighbour[0] < width and 0 <= neighbour[1] < height):
+                continue
+            if board.is_empty(neighbour[0], neighbour[1]):
+                distances[neighbour] = distance
+                queue.append(neighbour)
+    return distances
+
+def _count_reachable(distances, radius):
+    """Counts the cells reached in 1 to radius steps
+
+    Args:
+        distances (NumPy array or dict): The distances (see calculate_distances)
+        radius (int): Maximum amount of steps
+
+    Returns:
+        int: Amount of reached cells without the sources
+    """
+    if np is not None and not isinstance(distances, dict):
+        return int(((distances >= 1) & (distances <= radius)).sum())
+    return sum(1 for distance in distances.values() if distance >= 1)
+
+def _max_cells(radius):
+    """Returns the amount of cells within the manhattan distance radius around a cell, without the cell itself
+
+    Args:
+        radius (int): The radius
+
+    Returns:
+        int: Amount of cells
+    """
+    return 2 * radius * (radius + 1)
@@ -1,19 +1,75 @@
 from enums.commands import Commands
 from enums.directions import Directions
-from enums.textures import Textures
-from random import randint
+from evaluators import create_evaluator
+from mcts import MonteCarloSearch
+from minimax import MinimaxSearch
+from moves import get_move, get_moves
+from random import Random, randint
+from search_pool import SearchPool
+from transposition_table import TranspositionTable
+import time
+
+# reach tick of the cells no opponent can occupy within the searched plies
+UNREACHED = 255
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the time budget of the current turn is used up"""
+    pass
 
 class Game:
 
-    def __init__(self, game_state=None, depth=7, tau=0.1, xi=0.4):
+    def __init__(self, game_state=None, depth=7, tau=0.1, xi=0.4, iterative_deepening=False, max_depth=20, safety_margin=0.5, transposition_size=100000, track_own_trail=False, workers=0, opponent_plies=0, contested_weight=0.5, evaluator=None, engine='expectation', reuse_tree=False, clock=None):
         self._game_state = game_state
         self._depth = depth
         self._tau = tau
         self._xi = xi
         self._move_counter = 0
+        self._iterative_deepening = iterative_deepening
+        self._max_depth = max_depth
+        self._safety_margin = safety_margin
+        self._search_end = None
+        self._cancelled_move = None
+        self._best_move = None
+        self._nodes_expanded = 0
+        self._transposition_size = transposition_size
+        self._transpositions = TranspositionTable(transposition_size)
+        self._graph_transpositions = TranspositionTable(transposition_size)
+        self._track_own_trail = track_own_trail
+        self._trail = set()
+        # Zobrist hash of the own trail (xor of the keys of its cells), part of the transposition key
+        self._trail_hash = 0
+        self._trail_keys = []
+        self._workers = workers
+        self._search_pool = None
+        self._opponent_plies = opponent_plies
+        self._contested_weight = contested_weight
+        # earliest tick at which an opponent could occupy each cell, indexed by y * width + x (empty without plies)
+        self._opponent_reach = bytearray()
+        # name of the evaluator which scores the cells reached at the last level of the search, None counts the possible moves
+        self._evaluator_name = evaluator
+        self._evaluator = create_evaluator(evaluator) if evaluator is not None else None
+        self._root_depth = depth
+        # 'expectation' sums the discounted scores of all branches, 'minimax' searches against the nearest opponent,
+        # 'mcts' samples random games until the deadline
+        self._engine = engine
+        self._minimax = MinimaxSearch(self) if engine == 'minimax' else None
+        self._mcts = MonteCarloSearch(self, seed=randint(0, 2 ** 32)) if engine == 'mcts' else None
+        # graph of the last full depth search as (move, depth, graph), its subtree is extended in the next move
+        self._reuse_tree = reuse_tree
+        self._tree = None
+        # estimates the usable time per move from the deadline, None uses the local clock only
+        self._clock = clock
+        # seconds spent building the graph in the current search, None if no graph was built
+        self._graph_time = None
+        self._search_stats = {'move': 0, 'depth': 0, 'nodes': 0, 'time_left': None, 'cache_hits': 0, 'cache_misses': 0,
+                              'search_time': 0}
 
     def predict_move(self, new_game_state):
-        """Predicts the best possible move for the given state
+        """Predicts the best possible move for the given state.
+        If iterative deepening is enabled and the state has a valid deadline, the search
+        is deepened level by level until the deadline (minus the safety margin) is reached.
+        The 'mcts' engine always searches until that point in time. Otherwise a search which
+        is still running at that point returns the command of the first level.
 
         Args:
             new_game_state ([GameState]): The current state of the game
@@ -21,13 +77,238 @@ class Game:
         Returns:
             [Commands]: The calculated command for the next move
         """
+        # reset before the counter is increased, so the best move is never read from the previous move
+        self._best_move = None
         self._move_counter += 1
         self._game_state = new_game_state
+        self._nodes_expanded = 0
+        self._graph_time = None
+        search_start = time.perf_counter()
+        self._transpositions.clear()
+        self._graph_transpositions.clear()
 
         snake = self._game_state.get_player()
+        nearby_opponents = self._find_nearby_opponents(snake)
+        self._opponent_reach = self._calculate_opponent_reach(snake) if self._opponent_plies > 0 else bytearray()
+        if self._evaluator is not None:
+            self._evaluator.prepare(self._game_state)
+        time_left = self._calculate_time_left()
+
+        if self._mcts is not None:
+            search_end = time.monotonic() + time_left - self._safety_margin if time_left is not None else None
+            command = self._mcts.search(snake, search_end, nearby_opponents)
+            depth_reached = self._mcts.get_depth_reached()
+        elif self._iterative_deepening and time_left is not None:
+            command, depth_reached = self._search_iteratively(snake, nearby_opponents, time.monotonic() + time_left - self._safety_margin)
+        else:
+            # a cheap first level, which is used if the search gets cancelled or reaches the deadline
+            self._best_move = self._search(snake, 1, nearby_opponents, randomize=False)
+            # the search end also reaches the worker processes, which can not be cancelled
+            self._search_end = time.monotonic() + time_left - self._safety_margin if time_left is not None else None
+            try:
+                command, depth_reached = self._search(snake, self._depth, nearby_opponents), self._depth
+            except SearchTimeout:
+                command, depth_reached = self._best_move, 1
+            finally:
+                self._search_end = None
+
+        search_time = time.perf_counter() - search_start
+        self._search_stats = {
+            'move': self._move_counter,
+            'depth': depth_reached,
+            'nodes': self._nodes_expanded,
+            'time_left': self._calculate_time_left(),
+            'cache_hits': self._transpositions.get_hits(),
+            'cache_misses': self._transpositions.get_misses(),
+            'search_time': search_time
+        }
+        # only a reused graph separates building from scoring, the depth-first search does both at once
+        if self._graph_time is not None:
+            self._search_stats['graph_time'] = self._graph_time
+            self._search_stats['scoring_time'] = search_time - self._graph_time
+        return command
+
+    def get_move_counter(self):
+        """Returns the number of moves made in the game
 
-        graph = self._calculate_graph(snake.get_pos(), snake.get_direction(), snake.get_speed(), self._depth)
+        Returns:
+            int: Amount of moves
+        """
+        return self._move_counter
+
+    def get_search_stats(self):
+        """Returns statistics about the search of the last move
+
+        Returns:
+            dict: The number of the move ('move'), the reached depth ('depth'), the number of expanded nodes ('nodes'),
+                  the seconds left until the deadline ('time_left', None without deadline),
+                  the hits and misses of the transposition table ('cache_hits', 'cache_misses'),
+                  the seconds of the whole search ('search_time') and, only if a graph was built (reuse_tree),
+                  the seconds of building the graph ('graph_time') and of scoring it ('scoring_time')
+        """
+        return dict(self._search_stats)
+
+    def get_best_move(self, move):
+        """Returns the best command found so far for the given move.
+        Can be called from another thread while predict_move is running.
+
+        Args:
+            move (int): The number of the move (see get_move_counter)
+
+        Returns:
+            Commands: The best command so far, None if no search level of that move was finished yet
+        """
+        # the best move is reset before the counter is increased, so the counter has to be checked first
+        if self._move_counter != move:
+            return None
+        return self._best_move
+
+    def cancel(self, move):
+        """Cancels the search of the given move, which then returns the best command found so far.
+        If the search of that move has not started yet, it only finishes the first level.
+        Can be called from another thread. Searches running in worker processes are not interrupted,
+        they stop at the deadline of the state (minus the safety margin).
+
+        Args:
+            move (int): The number of the move (see get_move_counter)
+        """
+        self._cancelled_move = move
+
+    def get_fallback_move(self, game_state, move):
+        """Chooses a command for the given state without a search, like the first level of the search:
+        the first possible command which does not collide with a nearby opponent in the next step.
+        Only reads the given state, so it can be called from another thread while a search is running.
+
+        Args:
+            game_state (GameState): The state of the move
+            move (int): The number of the move (see get_move_counter)
+
+        Returns:
+            Commands: The chosen command, CHANGE_NOTHING if no command is possible
+        """
+        jump = move % 6 == 0
+        width, height = game_state.get_width(), game_state.get_height()
+        bitboard = game_state.get_bitboard()
+        snake = game_state.get_player()
+        x, y = snake.get_pos()
+
+        # the cells nearby opponents could occupy in the next step
+        opponent_cells = set()
+        for opponent in game_state.get_players():
+            opp_x, opp_y = opponent.get_pos()
+            if opponent.get_id() == snake.get_id() or not opponent.is_active():
+                continue
+            if abs(opp_x - x) > 10 + snake.get_speed() or abs(opp_y - y) > 10 + snake.get_speed():
+                continue
+            for opp_move in get_moves(opponent.get_direction(), opponent.get_speed()):
+                for dx, dy in opp_move.jump_offsets if jump else opp_move.offsets:
+                    opponent_cells.add((opp_x + dx, opp_y + dy))
+
+        possible = []
+        for command, own_move in zip(Commands, get_moves(snake.get_direction(), snake.get_speed())):
+            target_x, target_y = x + own_move.dx, y + own_move.dy
+            if own_move.speed < 1 or own_move.speed > 10 or not (0 <= target_x < width and 0 <= target_y < height):
+                continue
+            if not bitboard.is_move_free(x, y, own_move.direction, own_move.speed, jump):
+                continue
+            if all((x + dx, y + dy) not in opponent_cells for dx, dy in (own_move.jump_offsets if jump else own_move.offsets)):
+                return command
+            possible.append(command)
+        return possible[0] if len(possible) > 0 else Commands.CHANGE_NOTHING
+
+    def get_settings(self):
+        """Returns the parameters of the search, which are needed to recreate it in another process
+
+        Returns:
+            dict: The keyword arguments for the constructor of Game
+        """
+        return {
+            'depth': self._depth,
+            'tau': self._tau,
+            'xi': self._xi,
+            'transposition_size': self._transposition_size,
+            'track_own_trail': self._track_own_trail,
+            'opponent_plies': self._opponent_plies,
+            'contested_weight': self._contested_weight,
+            'evaluator': self._evaluator_name,
+            'engine': self._engine
+        }
+
+    def close(self):
+        """Shuts down the worker processes and releases the shared memory, if workers are used"""
+        if self._search_pool is not None:
+            self._search_pool.close()
+            self._search_pool = None
+
+    def _search_iteratively(self, snake, nearby_opponents, search_end):
+        """Searches with depth 1, 2, 3, ... until the search end or the maximum depth is reached.
+        The first level is always completed, so there is a command even if no time is left.
+
+        Args:
+            snake (Player): The controlled player
+            nearby_opponents (list): List of opponents that are near the player
+            search_end (float): Point in time (time.monotonic) at which the search is aborted
+
+        Returns:
+            (Commands, int): The command of the deepest finished level and that level
+        """
+        command = None
+        depth_reached = 0
+        for depth in range(1, self._max_depth + 1):
+            if depth > 1 and time.monotonic() >= search_end:
+                break
+            self._search_end = search_end if depth > 1 else None
+            try:
+                command = self._search(snake, depth, nearby_opponents)
+            except SearchTimeout:
+                break
+            finally:
+                self._search_end = None
+            self._best_move = command
+            depth_reached = depth
+        return command, depth_reached
+
+    def _search(self, snake, depth, nearby_opponents, randomize=True):
+        """Scores every command of the snake with a search of the given depth and chooses one of them
+
+        Args:
+            snake (Player): The controlled player
+            depth (int): Depth of the search
+            nearby_opponents (list): List of opponents that are near the player
+            randomize (bool, optional): Whether ties are broken randomly. Defaults to True.
+
+        Returns:
+            Commands: The chosen command
+        """
+        if self._minimax is not None:
+            return self._minimax.search(snake, depth)
+
+        pos, direction, speed = snake.get_pos(), snake.get_direction(), snake.get_speed()
+        self._trail = set()
+        self._trail_hash = 0
+        if self._reuse_tree and depth == self._depth:
+            graph_start = time.perf_counter()
+            graph = self._build_tree(pos, direction, speed, depth)
+            self._graph_time = (self._graph_time or 0) + time.perf_counter() - graph_start
+            option_scores = self._score_graph_options(graph, depth)
+        elif self._workers > 0 and depth > 1:
+            if self._search_pool is None:
+                self._search_pool = SearchPool(self._workers)
+            option_scores = self._search_pool.score_options(self, pos, direction, speed, depth)
+        else:
+            option_scores = self._score_options(pos, direction, speed, depth)
+        return self._choose_option(pos, direction, speed, option_scores, depth, nearby_opponents=nearby_opponents, randomize=randomize)
+
+    def _find_nearby_opponents(self, snake):
+        """Returns position, direction and speed of each player
+        within a radius of 10 blocks (plus the own speed) around the given snake
+
+        Args:
+            snake (Player): The controlled player
 
+        Returns:
+            list: A list of [pos, direction, speed] for each nearby player
+        """
         pos = snake.get_pos()
         speed = snake.get_speed()
 
@@ -37,60 +318,477 @@ class Game:
             opp_pos = s.get_pos()
             if abs(opp_pos[1] - pos[1]) <= 10 + speed and abs(opp_pos[0] - pos[0]) <= 10 + speed:
                 nearby_opponents.append([s.get_pos(), s.get_direction(), s.get_speed()])
-        
-        return self._choose_option(graph, self._depth, nearby_opponents=nearby_opponents)
+        return nearby_opponents
 
-    def get_move_counter(self):
-        """Returns the number of moves made in the game
+    def _calculate_opponent_reach(self, snake):
+        """Calculates for every cell the earliest tick at which a nearby opponent could occupy it.
+        The states (position, direction and speed) of each opponent are searched breadth first
+        for the configured amount of plies, with the board of the current tick.
+
+        Args:
+            snake (Player): The controlled player
 
         Returns:
-            int: Amount of moves
+            bytearray: The earliest tick (1 is the next move) for each cell, indexed by y * width + x,
+                       UNREACHED for cells which no opponent reaches
         """
-        return self._move_counter
+        pos = snake.get_pos()
+        radius = 10 + snake.get_speed() + 10 * self._opponent_plies
+        width = self._game_state.get_width()
+        reach = bytearray([UNREACHED]) * (width * self._game_state.get_height())
+        jump = self._is_move_six()
+
+        for opponent in self._game_state.get_players():
+            opp_pos = opponent.get_pos()
+            if opponent.get_id() == snake.get_id() or not opponent.is_active():
+                continue
+            if abs(opp_pos[1] - pos[1]) > radius or abs(opp_pos[0] - pos[0]) > radius:
+                continue
+
+            states = {(opp_pos[0], opp_pos[1], opponent.get_direction(), opponent.get_speed())}
+            for tick in range(1, self._opponent_plies + 1):
+                next_states = set()
+                for x, y, direction, speed in states:
+                    for move in get_moves(direction, speed):
+                        square = (x + move.dx, y + move.dy)
+                        if move.speed < 1 or move.speed > 10 or not self._check_if_reachable([x, y], square):
+                            continue
+                        for dx, dy in move.jump_offsets if jump else move.offsets:
+                            index = (y + dy) * width + x + dx
+                            if reach[index] > tick:
+                                reach[index] = tick
+                        next_states.add((square[0], square[1], move.direction, move.speed))
+                states = next_states
+        return reach
+
+    def _is_contested(self, start, move, tick):
+        """Checks whether an opponent could occupy a cell of the move at or before the given tick.
+        The move must stay inside the board.
+
+        Args:
+            start ([int, int]): starting position
+            move (Move): The move from the move table
+            tick (int): The tick of the move, 1 is the next move
+
+        Returns:
+            bool: True if the move is contested, otherwise False
+        """
+        reach = self._opponent_reach
+        width = self._game_state.get_width()
+        x, y = start[0], start[1]
+        for dx, dy in move.jump_offsets if self._is_move_six() else move.offsets:
+            if reach[(y + dy) * width + x + dx] <= tick:
+                return True
+        return False
+
+    def _calculate_time_left(self):
+        """Calculates the seconds left until the deadline of the current game state.
+        With a server clock, its offset and the latency of the response are taken into account.
+
+        Returns:
+            float: Seconds until the deadline (negative if it has passed), None if the state has no valid deadline
+        """
+        if self._clock is not None:
+            return self._clock.get_usable_time(self._game_state.get_deadline())
+        return self._game_state.get_time_left()
+
+    def _check_search_end(self):
+        """Aborts the search if the search was cancelled or the search end is reached
+
+        Raises:
+            SearchTimeout: If the search has to be aborted
+        """
+        if self._cancelled_move == self._move_counter or (self._search_end is not None and time.monotonic() >= self._search_end):
+            raise SearchTimeout()
 
     def _calculate_graph(self, pos, direction, speed, depth, sub_graph=False):
         # DO NOT use sub_graph flag, for method internal use only
 
-        graph = [pos, direction, speed, dict()]
-        graph_dict = graph[3]
-        
-        square_tl, square_tr, square_sd, square_su, square_cn = self._generate_possible_fields(
-            pos, direction, speed)
-        for index, square in enumerate([square_tl, square_tr, square_sd, square_su, square_cn]):
-            if self._check_if_reachable(pos, square):
-                new_speed = speed
-                new_direction = direction.value
-                command = Commands(index)
-                if command == Commands.SLOW_DOWN:
-                    new_speed -= 1
-                elif command == Commands.SPEED_UP:
-                    new_speed += 1
-                elif command == Commands.TURN_LEFT:
-                    new_direction -= 1
-                    if new_direction == -1:
-                        new_direction = 3
-                elif command == Commands.TURN_RIGHT:
-                    new_direction += 1
-                    if new_direction == 4:
-                        new_direction = 0
-                if depth == 1:
-                    graph_dict[Commands(index)] = [square, Directions(new_direction), new_speed, {}]
+        # subtrees only depend on this state and the jump phase, so they are shared between all paths reaching it
+        key = (pos[0], pos[1], direction, speed, depth, self._move_counter % 6)
+        graph_dict = self._graph_transpositions.get(key)
+
+        if graph_dict is None:
+            self._check_search_end()
+            self._nodes_expanded += 1
+
+            graph_dict = dict()
+            square_tl, square_tr, square_sd, square_su, square_cn = self._generate_possible_fields(
+                pos, direction, speed)
+            for index, square in enumerate([square_tl, square_tr, square_sd, square_su, square_cn]):
+                if self._check_if_reachable(pos, square):
+                    new_direction, new_speed = self._apply_command(direction, speed, Commands(index))
+                    if depth == 1:
+                        graph_dict[Commands(index)] = [square, new_direction, new_speed, {}]
+                    else:
+                        graph_dict[Commands(index)] = [square, new_direction, new_speed, self._calculate_graph(square, new_direction, new_speed, depth - 1, sub_graph=True)]
                 else:
-                    graph_dict[Commands(index)] = [square, Directions(new_direction), new_speed, self._calculate_graph(square, Directions(new_direction), new_speed, depth - 1, sub_graph=True)]
-            else:
-                graph_dict[Commands(index)] = None
+                    graph_dict[Commands(index)] = None
+            self._graph_transpositions.put(key, graph_dict)
+
         if sub_graph:
             return graph_dict
+        return [pos, direction, speed, graph_dict]
+
+    def _build_tree(self, pos, direction, speed, depth):
+        """Builds the graph of the given depth. The subtree of the previous move is reused
+        if the snake reached one of its states, otherwise a new graph is calculated.
+
+        Args:
+            pos ([int, int]): The position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            depth (int): Depth of the graph
+
+        Returns:
+            list: The graph (see _calculate_graph)
+        """
+        graph = self._reuse_subtree(pos, direction, speed, depth)
+        # a search aborted while building must not leave a partially extended graph
+        self._tree = None
+        if graph is None:
+            graph = self._calculate_graph(pos, direction, speed, depth)
+        else:
+            self._prune_graph(pos, graph[3], set())
+            self._extend_graph(graph[3], depth, set())
+        self._tree = (self._move_counter, depth, graph)
         return graph
 
-    def _choose_option(self, graph, depth, nearby_opponents=[]):
-        """Selects the best option from the given graph by calculating a score.
-        If 'nearby_opponents' is specified, collisions with nearby opponents are predicted and avoided.
+    def _reuse_subtree(self, pos, direction, speed, depth):
+        """Returns the subtree of the previous graph which starts at the given state
+
+        Args:
+            pos ([int, int]): The position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            depth (int): Depth of the graph
+
+        Returns:
+            list: The subtree as graph with depth - 1, None if it can not be reused
+        """
+        if self._tree is None or depth < 2:
+            return None
+        move, tree_depth, tree = self._tree
+        # the whole graph is built with the jump phase of its move, it is only valid if neither move jumps
+        if move != self._move_counter - 1 or tree_depth != depth or move % 6 == 0 or self._is_move_six():
+            return None
+        for child in tree[3].values():
+            if child is not None and child[0][0] == pos[0] and child[0][1] == pos[1] and child[1] == direction and child[2] == speed:
+                return [pos, direction, speed, child[3]]
+        return None
+
+    def _prune_graph(self, pos, graph_dict, visited):
+        """Removes the moves of the graph which are not reachable on the current board anymore
+
+        Args:
+            pos ([int, int]): The position of the state of the graph
+            graph_dict (dict): The options of the state
+            visited (set): Ids of the already pruned options, shared subtrees are pruned once
+        """
+        visited.add(id(graph_dict))
+        for command, child in graph_dict.items():
+            if child is None:
+                continue
+            if not self._check_if_reachable(pos, child[0]):
+                graph_dict[command] = None
+            elif id(child[3]) not in visited:
+                self._prune_graph(child[0], child[3], visited)
+
+    def _extend_graph(self, graph_dict, depth, visited):
+        """Extends a graph of depth - 1 to the given depth by calculating one more level below its leafs
+
+        Args:
+            graph_dict (dict): The options of the state
+            depth (int): The new depth of the graph
+            visited (set): Ids of the already extended options, shared subtrees are extended once
+        """
+        visited.add(id(graph_dict))
+        for child in graph_dict.values():
+            if child is None:
+                continue
+            if depth == 2:
+                child[3] = self._calculate_graph(child[0], child[1], child[2], 1, sub_graph=True)
+            elif id(child[3]) not in visited:
+                self._extend_graph(child[3], depth - 1, visited)
+
+    def _score_graph_options(self, graph, depth):
+        """Calculates the score of every command of the given graph.
+        Returns the same scores as _score_options, including the own trail, contested moves and the evaluator.
 
         Args:
             graph (list): The graph with all options
             depth (int): Depth of the graph
+
+        Returns:
+            dict: The score for each command, None if the command is not possible
+        """
+        self._root_depth = depth
+        if self._track_own_trail and len(self._trail_keys) != self._game_state.get_width() * self._game_state.get_height():
+            self._trail_keys = self._create_trail_keys(self._game_state.get_width(), self._game_state.get_height())
+        pos, direction, speed, graph_dict = graph
+        option_scores = dict()
+        for command in Commands:
+            child = graph_dict[command]
+            trail = self._graph_trail(pos, direction, speed, command) if child is not None else None
+            if trail is None:
+                option_scores[command] = None
+                continue
+            if trail:
+                self._trail.update(trail)
+                self._trail_hash ^= self._hash_cells(trail)
+            option_scores[command] = self._score_graph(child, depth - 1)
+            if trail:
+                self._trail.difference_update(trail)
+                self._trail_hash ^= self._hash_cells(trail)
+        return option_scores
+
+    def _score_graph(self, graph, depth):
+        """Recursively calculates the score of the state of the given graph.
+        Equals _evaluate for this state, but the reachable moves are read from the graph.
+
+        Args:
+            graph (list): The graph of the state
+            depth (int): Remaining depth of the search
+
+        Returns:
+            int: The calculated score
+        """
+        if depth < 1:
+            return 0
+
+        pos, direction, speed, graph_dict = graph
+        tick = self._root_depth - depth + 1
+        # the same key as in _evaluate, both calculate the same score for a state
+        key = (pos[0], pos[1], direction, speed, depth, self._move_counter % 6, tick if self._opponent_reach else None, self._trail_hash)
+        score = self._transpositions.get(key)
+        if score is not None:
+            return score
+        self._check_search_end()
+
+        score = 0
+        for command in Commands:
+            child = graph_dict[command]
+            if child is None:
+                continue
+            trail = self._graph_trail(pos, direction, speed, command)
+            if trail is None:
+                continue
+            if depth == 1:
+                option_score = 1 if self._evaluator is None else self._evaluator.evaluate(child[0])
+            else:
+                if trail:
+                    self._trail.update(trail)
+                    self._trail_hash ^= self._hash_cells(trail)
+                option_score = self._tau * self._score_graph(child, depth - 1)
+                if trail:
+                    self._trail.difference_update(trail)
+                    self._trail_hash ^= self._hash_cells(trail)
+            if self._opponent_reach and self._is_contested(pos, get_moves(direction, speed)[command.value], tick):
+                option_score *= self._contested_weight
+            score += option_score
+
+        self._transpositions.put(key, score)
+        return score
+
+    def _graph_trail(self, pos, direction, speed, command):
+        """Returns the cells filled by a move of the graph, which is reachable on the board.
+        If the own trail is tracked, the move must not cross a cell filled earlier on the current search path.
+
+        Args:
+            pos ([int, int]): The position of the state
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            command (Commands): The command of the move
+
+        Returns:
+            list: The filled cells as tuples (empty if the trail is not tracked), None if the move crosses the trail
+        """
+        if not self._track_own_trail:
+            return []
+        move = get_moves(direction, speed)[command.value]
+        trail = [(pos[0] + dx, pos[1] + dy) for dx, dy in (move.jump_offsets if self._is_move_six() else move.offsets)]
+        if self._trail.isdisjoint(trail):
+            return trail
+        return None
+
+    def _score_options(self, pos, direction, speed, depth):
+        """Calculates the score of every command at the given state without building the graph.
+        Returns the same scores as _score_graph_options for a graph of the same depth.
+
+        Args:
+            pos ([int, int]): The current position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            depth (int): Depth of the search
+
+        Returns:
+            dict: The score for each command, None if the command is not possible
+        """
+        option_scores = dict()
+        for command in Commands:
+            option_scores[command] = self._score_option(pos, direction, speed, command, depth)
+        return option_scores
+
+    def _score_option(self, pos, direction, speed, command, depth):
+        """Calculates the score of a single command at the given state without building the graph
+
+        Args:
+            pos ([int, int]): The current position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            command (Commands): The command to score
+            depth (int): Depth of the search
+
+        Returns:
+            float: The score of the command, None if the command is not possible
+        """
+        self._root_depth = depth
+        if self._track_own_trail and len(self._trail_keys) != self._game_state.get_width() * self._game_state.get_height():
+            self._trail_keys = self._create_trail_keys(self._game_state.get_width(), self._game_state.get_height())
+        square = self._generate_possible_fields(pos, direction, speed)[command.value]
+        trail = self._calculate_trail(pos, square)
+        if trail is None:
+            return None
+        new_direction, new_speed = self._apply_command(direction, speed, command)
+        if trail:
+            self._trail.update(trail)
+            self._trail_hash ^= self._hash_cells(trail)
+        score = self._evaluate(square, new_direction, new_speed, depth - 1)
+        if trail:
+            self._trail.difference_update(trail)
+            self._trail_hash ^= self._hash_cells(trail)
+        return score
+
+    def _evaluate(self, pos, direction, speed, depth):
+        """Recursively calculates the score of the given state while searching with the specified depth.
+        Equals _calculate_score for the graph of this state, but the graph is never stored.
+
+        Args:
+            pos ([int, int]): The position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            depth (int): Remaining depth of the search
+
+        Returns:
+            int: The calculated score
+        """
+        if depth < 1:
+            return 0
+
+        # the moves from this state happen at this tick, 1 is the next move of the snake
+        tick = self._root_depth - depth + 1
+
+        # with an own trail the score also depends on the cells filled on the path, which the trail hash identifies
+        key = (pos[0], pos[1], direction, speed, depth, self._move_counter % 6, tick if self._opponent_reach else None, self._trail_hash)
+        score = self._transpositions.get(key)
+        if score is not None:
+            return score
+
+        self._check_search_end()
+        self._nodes_expanded += 1
+
+        score = 0
+        for index, square in enumerate(self._generate_possible_fields(pos, direction, speed)):
+            trail = self._calculate_trail(pos, square)
+            if trail is None:
+                continue
+            if depth == 1:
+                option_score = 1 if self._evaluator is None else self._evaluator.evaluate(square)
+            else:
+                new_direction, new_speed = self._apply_command(direction, speed, Commands(index))
+                if trail:
+                    self._trail.update(trail)
+                    self._trail_hash ^= self._hash_cells(trail)
+                option_score = self._tau * self._evaluate(square, new_direction, new_speed, depth - 1)
+                if trail:
+                    self._trail.difference_update(trail)
+                    self._trail_hash ^= self._hash_cells(trail)
+            # moves into cells an opponent could reach until then count less
+            if self._opponent_reach and self._is_contested(pos, get_moves(direction, speed)[index], tick):
+                option_score *= self._contested_weight
+            score += option_score
+
+        self._transpositions.put(key, score)
+        return score
+
+    def _calculate_trail(self, start, target):
+        """Checks if the target is reachable from the start position and returns the cells filled by the move.
+        If the own trail is tracked, the move must not cross a cell filled earlier on the current search path.
+
+        Args:
+            start ([int, int]): starting position
+            target ([int, int]): target position
+
+        Returns:
+            list: The filled cells as tuples (empty if the trail is not tracked), None if the target is not reachable
+        """
+        if not self._check_if_reachable(start, target):
+            return None
+        if not self._track_own_trail:
+            return []
+        trail = [tuple(block) for block in self._calculate_path(start, target)[1:]]
+        if self._trail.isdisjoint(trail):
+            return trail
+        return None
+
+    def _hash_cells(self, cells):
+        """Calculates the Zobrist hash of the given cells, the xor of their random keys
+
+        Args:
+            cells (list): The cells as tuples
+
+        Returns:
+            int: The hash, 0 for no cells
+        """
+        width = self._game_state.get_width()
+        keys = self._trail_keys
+        value = 0
+        for x, y in cells:
+            value ^= keys[y * width + x]
+        return value
+
+    @staticmethod
+    def _create_trail_keys(width, height):
+        """Creates the random Zobrist keys of the cells of a board.
+        The keys are the same for every board size, so workers hash the trail like the main process.
+
+        Args:
+            width (int): The width of the board
+            height (int): The height of the board
+
+        Returns:
+            list: A 64 bit key for each cell, indexed by y * width + x
+        """
+        rng = Random(width * 1000 + height)
+        return [rng.getrandbits(64) for _ in range(width * height)]
+
+    def _apply_command(self, direction, speed, command):
+        """Calculates direction and speed of a snake after the given command
+
+        Args:
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            command (Commands): The executed command
+
+        Returns:
+            (Directions, int): The new direction and the new speed
+        """
+        move = get_move(direction, speed, command)
+        return move.direction, move.speed
+
+    def _choose_option(self, pos, direction, speed, option_scores, depth, nearby_opponents=[], randomize=True):
+        """Selects the best option based on the score of each command.
+        If 'nearby_opponents' is specified, collisions with nearby opponents are predicted and avoided.
+
+        Args:
+            pos ([int, int]): The current position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            option_scores (dict): The score for each command, None if the command is not possible
+            depth (int): Depth of the search
             nearby_opponents (list, optional): List of opponents that are near the player. Defaults to [].
+            randomize (bool, optional): Whether to start with a random option, so ties are broken randomly.
+                                        Defaults to True.
 
         Returns:
             Commands: The chosen command
@@ -99,11 +797,6 @@ class Game:
         score_list = []
         collision_cmds = []
 
-        pos = graph[0]
-        direction = graph[1]
-        speed = graph[2]
-        graph_dict = graph[3]
-
         for opp in nearby_opponents:
             cmds = self._calculate_collision_cmds(pos, direction, speed, opp[0], opp[1], opp[2])
             collision_cmds.extend(cmds)
@@ -117,19 +810,20 @@ class Game:
             collision_dict[command] = collision_count
 
         for command in Commands:
-            if graph[3][command] is not None:
+            if option_scores[command] is not None:
                 command_list.append(command)
-                cmd_score = self._calculate_score(graph_dict[command], depth - 1) - depth * self._xi * collision_dict[command]
+                cmd_score = option_scores[command] - depth * self._xi * collision_dict[command]
                 score_list.append(cmd_score)
 
         if len(command_list) == 0:
             return Commands.CHANGE_NOTHING
 
-        option = randint(0, len(command_list) - 1)
+        option = randint(0, len(command_list) - 1) if randomize else 0
         max_score = score_list[option]
         chosen_option = command_list[option]
+        at_max_speed = self._game_state.get_player().get_speed() > 9
         for command, score in zip(command_list, score_list):
-            if command == Commands.SPEED_UP and self._game_state.get_player().get_speed() > 9:
+            if command == Commands.SPEED_UP and at_max_speed:
                 continue
             if score > max_score:
                 max_score = score
@@ -146,31 +840,10 @@ class Game:
             speed ([type]): The snakes speed
 
         Returns:
-            The new position for each command
+            The new position for each command as tuple, in the order of Commands
         """
-        square_cn = [0, 0]
-        square_tl = [0, 0]
-        square_tr = [0, 0]
-        square_su = [0, 0]
-        square_sd = [0, 0]
-
-        # right and down are positive directions, left and up are negative
-        dir_factor = 1 if direction == Directions.DOWN or direction == Directions.RIGHT else -1
-
-        if direction == Directions.UP or direction == Directions.DOWN:
-            square_cn = [square[0], square[1] + speed * dir_factor]
-            square_tl = [square[0] + speed * dir_factor, square[1]]
-            square_tr = [square[0] - speed * dir_factor, square[1]]
-            square_su = [square[0], square[1] + (speed + 1) * dir_factor]
-            square_sd = [square[0], square[1] + (speed - 1) * dir_factor]
-        elif direction == Directions.LEFT or direction == Directions.RIGHT:
-            square_cn = [square[0] + speed * dir_factor, square[1]]
-            square_tl = [square[0], square[1] - speed * dir_factor]
-            square_tr = [square[0], square[1] + speed * dir_factor]
-            square_su = [square[0] + (speed + 1) * dir_factor, square[1]]
-            square_sd = [square[0] + (speed - 1) * dir_factor, square[1]]
-
-        return square_tl, square_tr, square_sd, square_su, square_cn
+        x, y = square[0], square[1]
+        return tuple((x + move.dx, y + move.dy) for move in get_moves(direction, speed))
 
     def _is_in_game_bounds(self, block):
         """Checks whether the given block is in the bounds of the game
@@ -183,8 +856,57 @@ class Game:
         """
         return not (block[0] < 0 or block[0] > self._game_state.get_width() - 1 or block[1] < 0 or block[1] > self._game_state.get_height() - 1)
 
-    def _check_if_reachable(self, start, target):
-        """Checks if the target is reachable from the start position
+    def _check_if_reachable(self, start, target, board=None, move_six=None):
+        """Checks if the target is reachable from the start position.
+        Without a board, the move is checked as one mask against the bitboard of the game state,
+        otherwise the cells between start and target are checked as one slice of the board.
+
+        Args:
+            start ([int, int]): starting position
+            target ([int, int]): target position
+            board (Board, optional): The board to check. Defaults to None (board of the game state).
+            move_six (bool, optional): Whether the move jumps. Defaults to None (phase of the current move).
+
+        Returns:
+            bool: True if the target is reachable, otherwise false
+        """
+
+        if not self._is_in_game_bounds(start) or not self._is_in_game_bounds(target):
+            return False
+
+        if move_six is None:
+            move_six = self._is_move_six()
+
+        if start[0] == target[0] and start[1] == target[1]:
+            return False
+        elif board is None:
+            if start[0] == target[0]:
+                direction = Directions.DOWN if start[1] < target[1] else Directions.UP
+                speed = abs(target[1] - start[1])
+            elif start[1] == target[1]:
+                direction = Directions.RIGHT if start[0] < target[0] else Directions.LEFT
+                speed = abs(target[0] - start[0])
+            else:
+                return False
+            return self._game_state.get_bitboard().is_move_free(start[0], start[1], direction, speed, move_six)
+        elif start[0] == target[0]:
+            # squares are in the same column
+            first = start[1] + (1 if start[1] < target[1] else -1)
+            if move_six:
+                return board.is_empty(start[0], first) and board.is_empty(target[0], target[1])
+            return board.is_column_segment_empty(start[0], min(first, target[1]), max(first, target[1]))
+        elif start[1] == target[1]:
+            # squares are in the same row
+            first = start[0] + (1 if start[0] < target[0] else -1)
+            if move_six:
+                return board.is_empty(first, start[1]) and board.is_empty(target[0], target[1])
+            return board.is_row_segment_empty(start[1], min(first, target[0]), max(first, target[0]))
+        else:
+            return False
+
+    def _check_if_reachable_scalar(self, start, target):
+        """Checks if the target is reachable from the start position cell by cell.
+        Reference implementation of _check_if_reachable
 
         Args:
             start ([int, int]): starting position
@@ -231,11 +953,7 @@ class Game:
         Returns:
             bool: True if there is a player, otherwise False
         """
-        board =  self._game_state.get_cells()
-        if board[square[1]][square[0]] == Textures.EMPTY:
-            return False
-        else:
-            return True
+        return not self._game_state.get_board().is_empty(square[0], square[1])
 
     def _calculate_collision_cmds(self, pos1, direction1, speed1, pos2, direction2, speed2):
         """Calculates all commands that lead to a collision in 
@@ -251,42 +969,38 @@ class Game:
 
         Returns:
             array: A list of all commands that result in a collision
-        """#
-        sn_tl, sn_tr, sn_sd, sn_su, sn_cn = self._generate_possible_fields(pos1, direction1, speed1)
-        opp_tl, opp_tr, opp_sd, opp_su, opp_cn = self._generate_possible_fields(pos2, direction2, speed2)
-        
-        all_fields_opp = set()
-        collison_cmds = []
+        """
+        jump = self._is_move_six()
 
-        for field in [opp_tl, opp_tr, opp_sd, opp_su, opp_cn]:
-            all_fields_opp.add(tuple(field))
-            for block in self._calculate_path(pos2, field):
-                all_fields_opp.add(tuple(block))
-        
+        all_fields_opp = {(pos2[0], pos2[1])}
+        for move in get_moves(direction2, speed2):
+            for dx, dy in move.jump_offsets if jump else move.offsets:
+                all_fields_opp.add((pos2[0] + dx, pos2[1] + dy))
+
+        collison_cmds = []
         opp_fields_len = len(all_fields_opp)
-        for index, field in enumerate([sn_tl, sn_tr, sn_sd, sn_su, sn_cn]):
-            cmd_path = self._calculate_path(pos1, field)
-            sum_lengths = len(cmd_path) + opp_fields_len 
-            cmd_path_set = set()
-            for block in cmd_path:
-                cmd_path_set.add(tuple(block))
-            union_set = all_fields_opp.union(cmd_path_set)
-            if len(union_set) != sum_lengths:
-                collison_cmds.append(Commands(index))
-        
+        for command, move in zip(Commands, get_moves(direction1, speed1)):
+            cmd_path = [(pos1[0], pos1[1])] + [(pos1[0] + dx, pos1[1] + dy) for dx, dy in (move.jump_offsets if jump else move.offsets)]
+            sum_lengths = len(cmd_path) + opp_fields_len
+            if len(all_fields_opp.union(cmd_path)) != sum_lengths:
+                collison_cmds.append(command)
+
         return collison_cmds
 
-    def _calculate_path(self, start, target):
+    def _calculate_path(self, start, target, move_six=None):
         """Calculates a path from start to the target
 
         Args:
             start ([int, int]): The start block
             target ([int, int]): The target block
+            move_six (bool, optional): Whether the move jumps. Defaults to None (phase of the current move).
 
         Returns:
             array: All the blocks on the calculated path
         """
         path = [start]
+        if move_six is None:
+            move_six = self._is_move_six()
 
         if not self._is_in_game_bounds(start):
             return path
@@ -296,7 +1010,7 @@ class Game:
         elif start[0] == target[0]:
             # squares are in the same column
             step = 1 if start[1] < target[1] else -1
-            if self._is_move_six():
+            if move_six:
                 path.append([start[0], start[1] + step])
                 path.append(target)
                 return path
@@ -307,7 +1021,7 @@ class Game:
         elif start[1] == target[1]:
             # squares are in the same row
             step = 1 if start[0] < target[0] else -1
-            if self._is_move_six():
+            if move_six:
                 path.append([start[0] + step, start[1]])
                 path.append(target)
                 return path
@@ -330,7 +1044,9 @@ class Game:
             int: The calculated score
         """
         graph_dict = graph[3] 
-        if depth == 1:
+        if depth < 1:
+            return 0
+        elif depth == 1:
             score = 0
             for command in Commands:
                 if graph_dict[command] is not None:
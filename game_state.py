@@ -1,13 +1,27 @@
+from bitboard import BitBoard
+from board import Board
+from collections import namedtuple
+from datetime import datetime, timezone
 from player import Player
-from enums.textures import Textures
+
+# immutable state of a game without the cells, cheap to pickle (players is a tuple of PlayerSnapshot)
+GameStateSnapshot = namedtuple('GameStateSnapshot', ['width', 'height', 'players', 'you', 'running', 'deadline'])
 
 class GameState:
 
-    def __init__(self, width, height, cells, players, you, running, deadline):
+    __slots__ = ('_width', '_height', '_cells', '_board', '_bitboard', '_bitboard_version', '_players', '_player_index', '_player', '_you', '_running', '_deadline')
+
+    def __init__(self, width, height, cells, players, you, running, deadline, board=None):
         self._width = width
         self._height = height
         self._cells = cells
+        self._board = board
+        self._bitboard = None
+        self._bitboard_version = None
         self._players = players
+        # players by id and the controlled player, so both are found without scanning the players
+        self._player_index = {player.get_id(): player for player in players}
+        self._player = self._player_index.get(you)
         self._you = you
         self._running = running
         self._deadline = deadline
@@ -29,13 +43,40 @@ class GameState:
         return self._height
 
     def get_cells(self):
-        """Returns the cells of the playing field as an two dimensional array of Textures
+        """Returns the cells of the playing field as an two dimensional array of Textures.
+        If the state was created with a compact board only, the array is built on the first call.
 
         Returns:
             2d array: The cells of the game with the dimension height * width
         """
+        if self._cells is None:
+            self._cells = self._board.to_textures()
         return self._cells
 
+    def get_board(self):
+        """Returns the cells of the playing field as compact board.
+        If the state was created with cells only, the board is built on the first call.
+
+        Returns:
+            Board: The board of the game
+        """
+        if self._board is None:
+            self._board = Board.from_cells(self._width, self._height, self._cells)
+        return self._board
+
+    def get_bitboard(self):
+        """Returns the occupancy of the playing field as bitboard. It is built on the first call
+        and built again if a cell of the board was changed since then.
+
+        Returns:
+            BitBoard: The bitboard of the game
+        """
+        board = self._board if self._board is not None else self.get_board()
+        if self._bitboard_version != board.get_version():
+            self._bitboard = BitBoard.from_board(board)
+            self._bitboard_version = board.get_version()
+        return self._bitboard
+
     def get_players(self):
         """Returns a list of all players in the current game
 
@@ -50,10 +91,18 @@ class GameState:
         Returns:
             Player: The player object, None if the player was not found
         """
-        for player in self.get_players():
-            if player.get_id() == self._you:
-                return player
-        return None
+        return self._player
+
+    def get_player_by_id(self, player_id):
+        """Returns the player with the given id
+
+        Args:
+            player_id (int): The id of the player
+
+        Returns:
+            Player: The player object, None if there is no player with that id
+        """
+        return self._player_index.get(player_id)
 
     def is_running(self):
         """Returns whether the game is still running
@@ -63,6 +112,25 @@ class GameState:
         """
         return self._running
 
+    def get_deadline(self):
+        """Returns the deadline for the next action as sent by the server
+
+        Returns:
+            str: The deadline (e.g. '2021-01-04T10:45:31Z'), empty if there is none
+        """
+        return self._deadline
+
+    def get_time_left(self):
+        """Returns the seconds left until the deadline
+
+        Returns:
+            float: Seconds until the deadline (negative if it has passed), None if the deadline is not valid
+        """
+        deadline = GameState.parse_deadline(self._deadline)
+        if deadline is None:
+            return None
+        return (deadline - datetime.now(timezone.utc)).total_seconds()
+
     def get_you(self):
         """Returns the players id
 
@@ -71,12 +139,55 @@ class GameState:
         """
         return self._you
 
+    def get_snapshot(self):
+        """Returns an immutable copy of the state without the cells
+
+        Returns:
+            GameStateSnapshot: The snapshot
+        """
+        return GameStateSnapshot(self._width, self._height, tuple(player.get_snapshot() for player in self._players),
+                                 self._you, self._running, self._deadline)
+
     @staticmethod
-    def from_dict(game_state_as_dict):
+    def from_snapshot(snapshot, board):
+        """Creates a GameState object from a snapshot and the board of the state
+
+        Args:
+            snapshot (GameStateSnapshot): The snapshot
+            board (Board): The board of the state
+
+        Returns:
+            GameState: The created GameState object
+        """
+        players = [Player.from_snapshot(player) for player in snapshot.players]
+        return GameState(snapshot.width, snapshot.height, None, players, snapshot.you, snapshot.running, snapshot.deadline, board=board)
+
+    @staticmethod
+    def parse_deadline(deadline):
+        """Parses the deadline sent by the server (e.g. '2021-01-04T10:45:31Z')
+
+        Args:
+            deadline (str): The deadline as string
+
+        Returns:
+            datetime: The deadline in UTC, None if it could not be parsed
+        """
+        try:
+            parsed = datetime.fromisoformat(deadline.replace('Z', '+00:00'))
+        except (AttributeError, ValueError):
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return parsed
+
+    @staticmethod
+    def from_dict(game_state_as_dict, board=None):
         """Creates and returns a GameState object from the given dictionary
 
         Args:
             game_state_as_dict ([dict]): the game state as dictionary
+            board (Board, optional): The board of the state, if it is already known. Defaults to None
+                                     (the board is created from the cells of the dictionary).
 
         Returns:
             [GameState]: The created GameState object
@@ -89,13 +200,19 @@ class GameState:
 
         deadline = game_state_as_dict['deadline'] if 'deadline' in game_state_as_dict else ''
 
+        width = game_state_as_dict['width']
+        height = game_state_as_dict['height']
+        if board is None:
+            board = Board.from_cells(width, height, game_state_as_dict['cells'])
+
         return GameState(
-            width=game_state_as_dict['width'],
-            height=game_state_as_dict['height'],
-            cells=[[Textures(x) for x in y] for y in game_state_as_dict['cells']],
+            width=width,
+            height=height,
+            cells=None,
             players=players,
             you=game_state_as_dict['you'],
             running=game_state_as_dict['running'],
-            deadline=deadline
+            deadline=deadline,
+            board=board
         )
         
\ No newline at end of file
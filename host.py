@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import os
+
+from main import play
+from recorder import GameRecorder
+from scheduler import FairExecutor
+from telemetry import Telemetry
+
+class BotHost:
+
+    def __init__(self, url, keys, workers=1, settings=None, time_url=None, telemetry_path=None, slow_turn_threshold=None, record_path=None):
+        """Plays several games at once in one event loop, one connection and one Game per key.
+        The searches of all games share a bounded pool of threads, which runs the search with the
+        nearest deadline first and cancels a running search with a later deadline for it, so a game
+        with slow searches can not delay the responses of the others.
+        The searches are pure Python and hold the GIL, so a second thread does not search faster
+        and only lets two searches share one core.
+
+        Args:
+            url (str): The url of the server
+            keys (list): The api key of each connection
+            workers (int, optional): Amount of searches which run at the same time. Defaults to 1.
+            settings (dict, optional): Keyword arguments for Game. Defaults to None (default settings).
+            time_url (str, optional): Time endpoint of the server to synchronize the clocks with. Defaults to None.
+            telemetry_path (str, optional): File of the per turn records, the index of the connection is added
+                                            to the name. Defaults to None (no records).
+            slow_turn_threshold (float, optional): Seconds of search after which a turn is profiled. Defaults to None.
+            record_path (str, optional): File of the recorded states, the index of the connection is added
+                                         to the name. Defaults to None (no recording).
+        """
+        self._url = url
+        self._keys = keys
+        self._workers = workers
+        self._settings = settings
+        self._time_url = time_url
+        self._telemetry_path = telemetry_path
+        self._slow_turn_threshold = slow_turn_threshold
+        self._record_path = record_path
+
+    async def run(self):
+        """Plays all games until they are over
+
+        Returns:
+            list: For each connection whether our player was alive at the end,
+                  or the exception if the connection failed
+        """
+        executor = FairExecutor(self._workers)
+        telemetries = [Telemetry(_connection_path(self._telemetry_path, index), slow_turn_threshold=self._slow_turn_threshold,
+                                 profile_directory=os.path.join('profiles', 'game_%s' % index))
+                       for index in range(len(self._keys))]
+        recorders = [GameRecorder(_connection_path(self._record_path, index)) if self._record_path else None
+                     for index in range(len(self._keys))]
+        try:
+            return await asyncio.gather(*[
+                play(self._url, key, settings=self._settings, executor=executor, time_url=self._time_url,
+                     telemetry=telemetries[index], recorder=recorders[index], name='game %s' % index)
+                for index, key in enumerate(self._keys)
+            ], return_exceptions=True)
+        finally:
+            # cancelled searches end at their next check, the games are closed already
+            executor.shutdown(wait=False, cancel_futures=True)
+            for telemetry in telemetries:
+                telemetry.close()
+            for recorder in recorders:
+                if recorder is not None:
+                    recorder.close()
+
+
+def _connection_path(path, index):
+    """Adds the index of a connection to a file name, e.g. turns.jsonl becomes turns_0.jsonl
+
+    Args:
+        path (str): The file name, may be None
+        index (int): The index of the connection
+
+    Returns:
+        str: The file name of the connection, None if path is None
+    """
+    if not path:
+        return None
+    root, extension = os.path.splitext(path)
+    return '%s_%s%s' % (root, index, extension)
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Plays several games at once, the keys are read from KEYS (comma separated) or KEY')
+    parser.add_argument('--connections', type=int, default=None, help='amount of connections, the keys are repeated if there are fewer')
+    parser.add_argument('--workers', type=int, default=1, help='searches at the same time, more than one only helps if the searches release the GIL')
+    args = parser.parse_args()
+
+    keys = os.environ['KEYS'].split(',') if os.environ.get('KEYS') else [os.environ['KEY']]
+    connections = args.connections if args.connections is not None else len(keys)
+    keys = [keys[index % len(keys)] for index in range(connections)]
+    # TELEMETRY, SLOW_TURN and RECORD as in main.py, with one file per connection
+    slow_turn = os.environ.get('SLOW_TURN')
+    host = BotHost(os.environ['URL'], keys, workers=args.workers, time_url=os.environ.get('TIME_URL'),
+                   telemetry_path=os.environ.get('TELEMETRY'), slow_turn_threshold=float(slow_turn) if slow_turn else None,
+                   record_path=os.environ.get('RECORD'))
+    print('alive at the end: %s' % asyncio.run(host.run()))
@@ -3,63 +3,205 @@
 import asyncio
 import json
 import os
+import time
 import websockets
 
+from board_tracker import BoardTracker
+from clock import ServerClock, fetch_server_time
+from concurrent.futures import ThreadPoolExecutor
+from decoder import decode_board, decode_game_state
 from game import Game
 from game_state import GameState
+from recorder import GameRecorder
+from scheduler import FairExecutor
+from telemetry import Telemetry
 
+# seconds before the deadline at which the best command found so far is sent instead
+RESPONSE_MARGIN = 0.2
 
-async def play():
+
+async def play(url, key, settings=None, executor=None, time_url=None, telemetry=None, recorder=None, name=None):
     """
     The main loop of the game. It creates a connection to the server,
     receives the state of the game and responds with the calculated action
-    """
 
-    url = os.environ['URL']
-    key = os.environ['KEY']
-
-    async with websockets.connect(f'{url}?key={key}') as websocket:
-        print('Waiting for initial state...', flush=True)
-        game = Game()
+    Args:
+        url (str): The url of the server
+        key (str): The api key
+        settings (dict, optional): Keyword arguments for Game. Defaults to None (default settings).
+        executor (Executor, optional): The executor of the searches, which may be shared by several games.
+                                       Defaults to None (a single thread for this game).
+        time_url (str, optional): Time endpoint of the server to synchronize the clock with. Defaults to None.
+        telemetry (Telemetry, optional): Receives the per turn records. Defaults to None (no records).
+        recorder (GameRecorder, optional): Records the states and the actions. Defaults to None.
+        name (str, optional): Prefix of the log messages. Defaults to None.
 
-        while True:
-            game_state_json = await websocket.recv()
-            game_state = convert_json_string_to_game_state(game_state_json)
+    Returns:
+        bool: Whether our player was still alive in the last received state
+    """
 
-            if not game_state.is_running():
-                print('game over')
-                break
-            if not game_state.get_player().is_active():
-                print('player died')
-                break
+    def log(message):
+        print(message if name is None else '[%s] %s' % (name, message), flush=True)
 
-            action = game.predict_move(game_state)
+    async with websockets.connect(f'{url}?key={key}') as websocket:
+        log('Waiting for initial state...')
+        clock = ServerClock()
+        if time_url:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, clock.synchronize, lambda: fetch_server_time(time_url))
+                log('clock offset %.3f s, latency %.3f s' % (clock.get_offset(), clock.get_latency()))
+            except (OSError, ValueError, KeyError) as error:
+                log('could not synchronize the clock: %s' % error)
+        game = Game(clock=clock, **(settings or dict()))
+        tracker = BoardTracker()
+        tick = 0
+        alive = False
+        own_executor = executor is None
+        if own_executor:
+            # a single thread, so a cancelled search has finished before the next one starts
+            executor = ThreadPoolExecutor(max_workers=1)
+
+        try:
+            while True:
+                game_state_json = await websocket.recv()
+                received = time.time()
+                tick += 1
+                decode_start = time.perf_counter()
+                game_state = convert_json_string_to_game_state(game_state_json, tracker=tracker)
+                decode_time = time.perf_counter() - decode_start
+                log('decoded state in %.2f ms' % (decode_time * 1000))
+
+                alive = game_state.get_player().is_active()
+                if not game_state.is_running() or not alive:
+                    log('game over' if not game_state.is_running() else 'player died')
+                    if recorder is not None:
+                        recorder.record(tick, game_state_json)
+                    break
+
+                clock.add_message(game_state.get_deadline(), received)
+                move = game.get_move_counter() + 1
+                action, timed_out = await predict_move_in_time(game, game_state, executor, telemetry=telemetry, clock=clock, log=log)
+
+                for player in game_state.get_players():
+                    if player.get_id() == game_state.get_you():
+                        log('WE: pos: %s, alive: %s' % (player.get_pos(), player.is_active()))
+                    else:
+                        log('id: %s, active: %s' % (player.get_id(), player.is_active()))
+
+                log('player still alive after %s moves' % game.get_move_counter())
+
+                action_json = json.dumps({'action': str(action)})
+                await websocket.send(action_json)
+                if telemetry is not None:
+                    telemetry.emit(create_turn_record(game, move, decode_time, action, clock.get_usable_time(game_state.get_deadline()), timed_out))
+                if recorder is not None:
+                    recorder.record(tick, game_state_json, action)
+        finally:
+            if own_executor:
+                executor.shutdown(wait=False)
+            game.close()
+    return alive
+
+async def play_from_environment():
+    """Plays one game with the configuration of the environment variables"""
+    # TELEMETRY: file of the per turn JSON lines, SLOW_TURN: seconds of search after which a turn is profiled
+    slow_turn = os.environ.get('SLOW_TURN')
+    telemetry = Telemetry(os.environ.get('TELEMETRY'), slow_turn_threshold=float(slow_turn) if slow_turn else None)
+    # RECORD: file to which every received state and the sent action are appended (see replay.py)
+    recorder = GameRecorder(os.environ['RECORD']) if os.environ.get('RECORD') else None
+    try:
+        # TIME_URL: time endpoint of the server, which is used to estimate the clock offset and the latency
+        await play(os.environ['URL'], os.environ['KEY'], time_url=os.environ.get('TIME_URL'), telemetry=telemetry, recorder=recorder)
+    finally:
+        telemetry.close()
+        if recorder is not None:
+            recorder.close()
+
+async def predict_move_in_time(game, game_state, executor, telemetry=None, clock=None, log=print):
+    """Calculates the next move in the executor, so the event loop keeps running during the search.
+    If the search does not finish until shortly before the deadline, it is cancelled
+    and the best command found so far is returned. If not even the first level was finished,
+    the command of the first level is calculated here (see Game.get_fallback_move).
 
-            for player in game_state.get_players():
-                if player.get_id() == game_state.get_you():
-                    print('WE: pos: %s, alive: %s' % (player.get_pos(), player.is_active()))
-                else:
-                    print('id: %s, active: %s' % (player.get_id(), player.is_active()))
+    Args:
+        game (Game): The game which calculates the move
+        game_state (GameState): The current state of the game
+        executor (Executor): The executor in which the search runs, a FairExecutor schedules by deadline
+        telemetry (Telemetry, optional): Profiles slow searches. Defaults to None.
+        clock (ServerClock, optional): Estimates the usable time. Defaults to None (local clock only).
+        log (callable, optional): Writes the message of a timed out search. Defaults to print.
 
-            print('player still alive after %s moves' % game.get_move_counter())
+    Returns:
+        (Commands, bool): The command for the next move and whether the search timed out
+    """
+    move = game.get_move_counter() + 1
+    time_left = clock.get_usable_time(game_state.get_deadline()) if clock is not None else game_state.get_time_left()
+    timeout = None if time_left is None else max(time_left - RESPONSE_MARGIN, 0)
+
+    if telemetry is not None:
+        function, args = telemetry.profile, (move, game.predict_move, game_state)
+    else:
+        function, args = game.predict_move, (game_state,)
+    if isinstance(executor, FairExecutor):
+        # the search with the nearest deadline runs first, searches of the same game one after another
+        deadline = float('inf') if timeout is None else time.monotonic() + timeout
+        # a search with a later deadline than a waiting one is cancelled and returns its best command so far
+        future = asyncio.wrap_future(executor.submit_with_deadline(deadline, game, function, *args, preempt=lambda: game.cancel(move)))
+    else:
+        future = asyncio.get_running_loop().run_in_executor(executor, function, *args)
+
+    try:
+        return await asyncio.wait_for(asyncio.shield(future), timeout), False
+    except asyncio.TimeoutError:
+        game.cancel(move)
+        action = game.get_best_move(move)
+        if action is None:
+            # the search has not finished its first level (e.g. it has not started), which is cheap to repeat here
+            action = game.get_fallback_move(game_state, move)
+        log('search timed out, sending fallback %s' % action)
+        return action, True
+
+def create_turn_record(game, move, decode_time, action, time_left, timed_out):
+    """Creates the telemetry record of a turn
 
-            action_json = json.dumps({'action': str(action)})
-            await websocket.send(action_json)
+    Args:
+        game (Game): The game which calculated the move
+        move (int): The number of the move
+        decode_time (float): Seconds spent decoding the state
+        action (Commands): The sent command
+        time_left (float): Usable seconds left until the deadline after sending (negative if late), None without deadline
+        timed_out (bool): Whether the fallback was sent because the search did not finish in time
 
-def convert_json_string_to_game_state(json_string):
-    """Converts the json string of the game state into an object of type [GameState] and returns it
+    Returns:
+        dict: The record, with the search statistics if the search finished in time
+    """
+    record = {'turn': move, 'action': str(action), 'decode_time': decode_time, 'deadline_margin': time_left, 'timed_out': timed_out}
+    # a timed out search may still finish before the record is created, its statistics do not belong to the sent action
+    if not timed_out:
+        stats = game.get_search_stats()
+        del stats['move']
+        record.update(stats)
+    return record
+
+def convert_json_string_to_game_state(json_string, tracker=None):
+    """Converts the json string of the game state into an object of type [GameState] and returns it.
+    The cells are parsed directly into the compact board.
 
     Args:
         json_string ([string]): game state as json string
+        tracker (BoardTracker, optional): Tracker which only applies the changes to the previous board.
+                                          The cells are only decoded on the ticks on which the tracker
+                                          verifies or rebuilds its board. Defaults to None (the cells are decoded).
 
     Returns:
         [GameState]: The converted GameState object
     """
-    game_state_as_dict = json.loads(json_string)
-
-    game_state = GameState.from_dict(game_state_as_dict)
+    if tracker is not None:
+        game_state_as_dict, _ = decode_game_state(json_string, decode_cells=False)
+        return tracker.update(game_state_as_dict, load_board=lambda: decode_board(json_string, game_state_as_dict['width'], game_state_as_dict['height']))
 
-    return game_state
+    game_state_as_dict, board = decode_game_state(json_string)
+    return GameState.from_dict(game_state_as_dict, board=board)
 
 if __name__ == '__main__':
-    asyncio.get_event_loop().run_until_complete(play())
+    asyncio.get_event_loop().run_until_complete(play_from_environment())
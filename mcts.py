@@ -0,0 +1,393 @@
+import math
+import time
+
+from array import array
+from random import Random
+from board import Board, np
+from enums.commands import Commands
+from enums.directions import Directions
+from moves import get_moves
+
+# the board copies of batched rollouts get an occupied border of the maximum speed, so no move leaves them
+BATCH_BORDER = 10
+
+class _Node:
+
+    def __init__(self, pos, direction, speed, trail):
+        """A state of the snake in the search tree
+
+        Args:
+            pos ([int, int]): The position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            trail (list): The cells filled by the move into this state
+        """
+        self.pos = pos
+        self.direction = direction
+        self.speed = speed
+        self.trail = trail
+        self.children = dict()
+        # commands which were not expanded yet, None until the node is visited
+        self.untried = None
+        self.visits = 0
+        self.reward = 0
+
+
+class MonteCarloSearch:
+
+    def __init__(self, game, exploration=1.4, rollout_depth=20, rollouts=8, iterations=500, seed=None):
+        """Creates a Monte Carlo tree search (UCT) for the snake. The opponents are part of the board only.
+        Each selected leaf is scored by several random rollouts, the reward is the share of moves survived.
+        With NumPy the rollouts of a leaf are played as one batch on a stack of board copies, otherwise
+        one after another on a compact copy of the board. The tree of the chosen move is kept for the next move.
+
+        Args:
+            game (Game): The game whose state and move generator are used
+            exploration (float, optional): Weight of the exploration term of UCT. Defaults to 1.4.
+            rollout_depth (int, optional): Maximum amount of moves of a rollout. Defaults to 20.
+            rollouts (int, optional): Amount of rollouts per selected leaf. Defaults to 8.
+            iterations (int, optional): Amount of selected leafs if there is no deadline. Defaults to 500.
+            seed (int, optional): Seed of the rollouts. Defaults to None.
+        """
+        self._game = game
+        self._exploration = exploration
+        self._rollout_depth = rollout_depth
+        self._rollouts = rollouts
+        self._iterations = iterations
+        self._random = Random(seed)
+        self._batch_random = np.random.default_rng(seed) if np is not None else None
+        # move tables of the batched rollouts as (padded width, tables), built for the width of the board
+        self._batch_tables = None
+        self._board = None
+        self._root = None
+        self._root_move = None
+        self._depth_reached = 0
+
+    def search(self, snake, search_end=None, nearby_opponents=[]):
+        """Searches until the search end (or the amount of iterations without search end) and chooses a command.
+        The best command so far is kept up to date in the game, so a cancelled search still has a command.
+
+        Args:
+            snake (Player): The controlled player
+            search_end (float, optional): Point in time (time.monotonic) at which the search stops. Defaults to None.
+            nearby_opponents (list, optional): List of opponents that are near the player. Defaults to [].
+
+        Returns:
+            Commands: The command with the highest mean reward, collisions with nearby opponents are avoided
+        """
+        move = self._game.get_move_counter()
+        self._root = self._reuse_root(snake, move)
+        self._root_move = move
+        self._depth_reached = 0
+
+        board = self._game._game_state.get_board()
+        self._board = Board(board.get_width(), board.get_height(), array('b', board.get_buffer().tobytes()))
+
+        iterations = 0
+        while True:
+            if search_end is not None:
+                if iterations > 0 and time.monotonic() >= search_end:
+                    break
+            elif iterations >= self._iterations:
+                break
+            if iterations > 0 and self._game._cancelled_move == move:
+                break
+            self._iterate()
+            iterations += 1
+            self._game._nodes_expanded += 1
+            self._game._best_move = self._best_command()
+
+        option_scores = {command: None for command in Commands}
+        for command, child in self._root.children.items():
+            if child.visits > 0:
+                option_scores[command] = child.reward / child.visits
+        return self._game._choose_option(snake.get_pos(), snake.get_direction(), snake.get_speed(), option_scores, 1,
+                                         nearby_opponents=nearby_opponents, randomize=False)
+
+    def get_depth_reached(self):
+        """Returns the depth of the deepest leaf expanded by the last search
+
+        Returns:
+            int: The depth below the root, 1 are the children of the root
+        """
+        return self._depth_reached
+
+    def _best_command(self):
+        """Returns the command of the root child with the highest mean reward
+
+        Returns:
+            Commands: The best command, None if no child was visited
+        """
+        best = None
+        best_value = -1
+        for command, child in self._root.children.items():
+            if child.visits > 0 and child.reward / child.visits > best_value:
+                best = command
+                best_value = child.reward / child.visits
+        return best
+
+    def _reuse_root(self, snake, move):
+        """Returns the subtree of the previous move which matches the current state of the snake,
+        or a new root if there is none
+
+        Args:
+            snake (Player): The controlled player
+            move (int): The number of the current move
+
+        Returns:
+            _Node: The root of the search
+        """
+        pos, direction, speed = snake.get_pos(), snake.get_direction(), snake.get_speed()
+        if self._root is not None and self._root_move == move - 1:
+            for child in self._root.children.values():
+                if child.pos[0] == pos[0] and child.pos[1] == pos[1] and child.direction == direction and child.speed == speed:
+                    return child
+        return _Node(pos, direction, speed, [])
+
+    def _iterate(self):
+        """Selects a leaf by UCT, expands it and scores it with several rollouts"""
+        node = self._root
+        path = [node]
+        filled = []
+        tick = 1
+
+        # selection, children which are not reachable on the current board are removed
+        while node.untried is not None and len(node.untried) == 0 and len(node.children) > 0:
+            command, child = self._select_child(node)
+            if not self._is_move_possible(node, child, tick):
+                del node.children[command]
+                continue
+            self._fill(child.trail, filled)
+            node = child
+            path.append(node)
+            tick += 1
+
+        # expansion
+        moves = {move[0]: move for move in self._generate_moves(node.pos, node.direction, node.speed, tick)}
+        if node.untried is None:
+            node.untried = list(moves)
+            self._random.shuffle(node.untried)
+        while len(node.untried) > 0:
+            move = moves.get(node.untried.pop())
+            if move is None:
+                continue
+            command, square, trail, direction, speed = move
+            child = _Node(square, direction, speed, trail)
+            node.children[command] = child
+            self._fill(trail, filled)
+            node = child
+            path.append(node)
+            tick += 1
+            break
+
+        self._depth_reached = max(self._depth_reached, len(path) - 1)
+
+        # several rollouts from the same leaf, without NumPy only the cells of the rollouts are reset in between
+        max_moves = len(path) - 1 + self._rollout_depth
+        if np is not None:
+            reward = float((len(path) - 1 + self._rollout_batch(node, tick, self._rollouts)).sum()) / max_moves
+        else:
+            reward = 0
+            for _ in range(self._rollouts):
+                reward += (len(path) - 1 + self._rollout(node, tick)) / max_moves
+
+        for visited in path:
+            visited.visits += self._rollouts
+            visited.reward += reward
+        self._clear(filled)
+
+    def _select_child(self, node):
+        """Selects the child with the highest upper confidence bound
+
+        Args:
+            node (_Node): A fully expanded node
+
+        Returns:
+            (Commands, _Node): The command and the selected child
+        """
+        log_visits = math.log(max(node.visits, 1))
+        best = None
+        best_value = -float('inf')
+        for command, child in node.children.items():
+            if child.visits == 0:
+                return command, child
+            value = child.reward / child.visits + self._exploration * math.sqrt(log_visits / child.visits)
+            if value > best_value:
+                best = (command, child)
+                best_value = value
+        return best
+
+    def _rollout(self, node, tick):
+        """Plays random moves from the given state until the snake dies or the rollout depth is reached
+
+        Args:
+            node (_Node): The start state
+            tick (int): The tick of the first move, 1 is the next move
+
+        Returns:
+            int: The amount of survived moves
+        """
+        filled = []
+        pos, direction, speed = node.pos, node.direction, node.speed
+        moves = 0
+        while moves < self._rollout_depth:
+            possible_moves = self._generate_moves(pos, direction, speed, tick + moves)
+            if len(possible_moves) == 0:
+                break
+            _, pos, trail, direction, speed = possible_moves[self._random.randrange(len(possible_moves))]
+            self._fill(trail, filled)
+            moves += 1
+        self._clear(filled)
+        return moves
+
+    def _rollout_batch(self, node, tick, count):
+        """Plays several rollouts from the given state at once, each on its own copy of the board.
+        Every step moves the heads of all rollouts which are still alive by one random possible move,
+        the cells of all commands of all rollouts are checked with one lookup.
+
+        Args:
+            node (_Node): The start state
+            tick (int): The tick of the first move, 1 is the next move
+            count (int): Amount of rollouts
+
+        Returns:
+            NumPy array: The amount of survived moves of each rollout
+        """
+        width, height = self._board.get_width(), self._board.get_height()
+        padded_width, padded_height = width + 2 * BATCH_BORDER, height + 2 * BATCH_BORDER
+        valid, next_states, targets, offsets, jump_offsets = self._get_batch_tables(padded_width)
+
+        occupied = np.ones((count, padded_height, padded_width), dtype=bool)
+        occupied[:, BATCH_BORDER:-BATCH_BORDER, BATCH_BORDER:-BATCH_BORDER] = \
+            np.frombuffer(self._board.get_buffer(), dtype=np.int8).reshape(height, width) != 0
+        occupied = occupied.reshape(-1)
+
+        rollouts = np.arange(count)
+        # the heads as index into the flat board copies, the state as direction * 11 + speed
+        heads = rollouts * padded_width * padded_height + (node.pos[1] + BATCH_BORDER) * padded_width + node.pos[0] + BATCH_BORDER
+        states = np.full(count, node.direction.value * 11 + min(node.speed, 10))
+        alive = np.ones(count, dtype=bool)
+        moves = np.zeros(count, dtype=np.int64)
+        for step in range(self._rollout_depth):
+            # the cells covered by each command of each rollout, shaped (rollouts, commands, cells)
+            cells = heads[:, np.newaxis, np.newaxis] + (jump_offsets if self._is_move_six(tick + step) else offsets)[states]
+            possible = valid[states] & alive[:, np.newaxis] & ~occupied[cells].any(axis=2)
+
+            alive = possible.any(axis=1)
+            if not alive.any():
+                break
+            # a uniform choice among the possible commands
+            keys = self._batch_random.random(possible.shape)
+            keys[~possible] = -1
+            chosen = keys.argmax(axis=1)
+            occupied[cells[rollouts, chosen][alive]] = True
+            heads = np.where(alive, heads + targets[states, chosen], heads)
+            states = np.where(alive, next_states[states, chosen], states)
+            moves += alive
+        return moves
+
+    def _get_batch_tables(self, padded_width):
+        """Returns the move tables of the batched rollouts for board copies of the given width.
+        The tables are indexed by state (direction * 11 + speed) and command.
+
+        Args:
+            padded_width (int): The width of the board copies with their border
+
+        Returns:
+            (NumPy array, ...): Whether the command is possible at all (speed 1 to 10), the state after the command,
+                                the offset of the target and the offsets of the covered cells on normal
+                                and on jump moves (padded to 10 cells by repeating the first cell)
+        """
+        if self._batch_tables is not None and self._batch_tables[0] == padded_width:
+            return self._batch_tables[1]
+
+        states = 4 * 11
+        valid = np.zeros((states, len(Commands)), dtype=bool)
+        next_states = np.zeros((states, len(Commands)), dtype=np.int64)
+        targets = np.zeros((states, len(Commands)), dtype=np.int64)
+        offsets = np.zeros((states, len(Commands), 10), dtype=np.int64)
+        jump_offsets = np.zeros((states, len(Commands), 10), dtype=np.int64)
+        for direction in Directions:
+            for speed in range(11):
+                state = direction.value * 11 + speed
+                for command, move in zip(Commands, get_moves(direction, speed)):
+                    if move.speed < 1 or move.speed > 10:
+                        continue
+                    valid[state, command.value] = True
+                    next_states[state, command.value] = move.direction.value * 11 + move.speed
+                    targets[state, command.value] = move.dy * padded_width + move.dx
+                    for table, cells in ((offsets, move.offsets), (jump_offsets, move.jump_offsets)):
+                        flat = [dy * padded_width + dx for dx, dy in cells]
+                        table[state, command.value] = flat + [flat[0]] * (10 - len(flat))
+        self._batch_tables = (padded_width, (valid, next_states, targets, offsets, jump_offsets))
+        return self._batch_tables[1]
+
+    def _generate_moves(self, pos, direction, speed, tick):
+        """Generates the possible moves on the board copy
+
+        Args:
+            pos ([int, int]): The position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            tick (int): The tick of the move, 1 is the next move
+
+        Returns:
+            list: (command, target, trail, new direction, new speed) of each possible move
+        """
+        move_six = self._is_move_six(tick)
+        moves = []
+        for command, square in zip(Commands, self._game._generate_possible_fields(pos, direction, speed)):
+            new_direction, new_speed = self._game._apply_command(direction, speed, command)
+            if new_speed < 1 or new_speed > 10 or not self._game._check_if_reachable(pos, square, board=self._board, move_six=move_six):
+                continue
+            trail = [(block[0], block[1]) for block in self._game._calculate_path(pos, square, move_six=move_six)[1:]]
+            moves.append((command, square, trail, new_direction, new_speed))
+        return moves
+
+    def _is_move_possible(self, node, child, tick):
+        """Checks whether the move from a node to its child is still possible on the board copy
+
+        Args:
+            node (_Node): The start state
+            child (_Node): The state after the move
+            tick (int): The tick of the move, 1 is the next move
+
+        Returns:
+            bool: True if the move is possible, otherwise False
+        """
+        move_six = self._is_move_six(tick)
+        return (1 <= child.speed <= 10) and self._game._check_if_reachable(node.pos, child.pos, board=self._board, move_six=move_six)
+
+    def _is_move_six(self, tick):
+        """Determines whether the move of the given tick jumps
+
+        Args:
+            tick (int): The tick of the move, 1 is the next move
+
+        Returns:
+            bool: Whether the move is a sixth move
+        """
+        # the move of the given tick happens at move number (move counter + tick - 1)
+        return (self._game.get_move_counter() + tick - 1) % 6 == 0
+
+    def _fill(self, trail, filled):
+        """Fills the empty cells of a trail on the board copy
+
+        Args:
+            trail (list): The cells as tuples
+            filled (list): Receives the cells which were filled, so they can be cleared again
+        """
+        for x, y in trail:
+            if self._board.is_empty(x, y):
+                self._board.set_value(x, y, 1)
+                filled.append((x, y))
+
+    def _clear(self, filled):
+        """Empties the given cells on the board copy
+
+        Args:
+            filled (list): The cells filled by _fill, the list is emptied
+        """
+        for x, y in filled:
+            self._board.set_value(x, y, 0)
+        filled.clear()
@@ -0,0 +1,227 @@
+from enums.commands import Commands
+
+# score of a won or lost game, a crash into an opponent in the same round counts half
+WIN_SCORE = 1000
+
+class MinimaxSearch:
+
+    def __init__(self, game, max_opponents=1, radius=10):
+        """Creates a paranoid minimax search with alpha-beta pruning. Every round the snake moves first (max),
+        then each opponent moves (min) as if all opponents played against the snake. Moves are ordered by
+        killer moves and the history heuristic, so cutoffs happen early. The move generator and the
+        reachability checks of the given game are used.
+
+        Args:
+            game (Game): The game whose state and move generator are used
+            max_opponents (int, optional): Amount of nearest opponents which are searched. Defaults to 1.
+            radius (int, optional): Opponents further away (plus the own speed) are ignored. Defaults to 10.
+        """
+        self._game = game
+        self._max_opponents = max_opponents
+        self._radius = radius
+        self._occupied = set()
+        # commands which caused a cutoff, for each remaining depth and player (0 is the snake)
+        self._killers = dict()
+        # sum of depth * depth of all cutoffs, for each player and command
+        self._history = dict()
+        self._move = None
+
+    def search(self, snake, depth):
+        """Searches the given amount of rounds and returns the best command of the snake
+
+        Args:
+            snake (Player): The controlled player
+            depth (int): Amount of rounds to search
+
+        Returns:
+            Commands: The chosen command, CHANGE_NOTHING if every command is lost
+        """
+        # killers and history are kept for the deeper searches of the same move
+        if self._move != self._game.get_move_counter():
+            self._killers = dict()
+            self._history = dict()
+            self._move = self._game.get_move_counter()
+
+        self._occupied = set()
+        opponents = self._find_opponents(snake)
+        alpha = -float('inf')
+        best_command = Commands.CHANGE_NOTHING
+        for command, square, trail, direction, speed in self._order(self._generate_moves(snake.get_pos(), snake.get_direction(), snake.get_speed()), depth, 0):
+            score = self._min_value((square, direction, speed), opponents, 0, trail, depth, alpha, float('inf'))
+            if score > alpha:
+                alpha = score
+                best_command = command
+        return best_command
+
+    def _find_opponents(self, snake):
+        """Returns the states of the nearest active opponents
+
+        Args:
+            snake (Player): The controlled player
+
+        Returns:
+            list: [pos, direction, speed] of each searched opponent
+        """
+        pos = snake.get_pos()
+        radius = self._radius + snake.get_speed()
+        opponents = []
+        for player in self._game._game_state.get_players():
+            if player.get_id() == snake.get_id() or not player.is_active():
+                continue
+            distance = abs(player.get_x() - pos[0]) + abs(player.get_y() - pos[1])
+            if abs(player.get_x() - pos[0]) <= radius and abs(player.get_y() - pos[1]) <= radius:
+                opponents.append((distance, [player.get_pos(), player.get_direction(), player.get_speed()]))
+        opponents.sort(key=lambda opponent: opponent[0])
+        return [opponent for _, opponent in opponents[:self._max_opponents]]
+
+    def _max_value(self, snake, opponents, depth, alpha, beta):
+        """Scores a state at the start of a round, where the snake moves
+
+        Args:
+            snake (list): [pos, direction, speed] of the snake
+            opponents (list): [pos, direction, speed] of each opponent, None for dead opponents
+            depth (int): Remaining rounds
+            alpha (float): Score the snake is already guaranteed
+            beta (float): Score the opponents are already guaranteed
+
+        Returns:
+            float: The score of the state
+        """
+        self._game._check_search_end()
+        self._game._nodes_expanded += 1
+
+        if len(opponents) > 0 and all(opponent is None for opponent in opponents):
+            # earlier wins are better
+            return WIN_SCORE + depth
+        moves = self._generate_moves(*snake)
+        if len(moves) == 0:
+            # later losses are better
+            return -WIN_SCORE - depth
+        if depth == 0:
+            return self._evaluate(moves, opponents)
+
+        value = -float('inf')
+        for move in self._order(moves, depth, 0):
+            command, square, trail, direction, speed = move
+            value = max(value, self._min_value((square, direction, speed), opponents, 0, trail, depth, alpha, beta))
+            if value >= beta:
+                self._store_cutoff(command, depth, 0)
+                break
+            alpha = max(alpha, value)
+        return value
+
+    def _min_value(self, snake, opponents, index, round_trail, depth, alpha, beta):
+        """Scores a state in which the opponent with the given index moves.
+        The cells of the snakes move in this round are not occupied yet, an opponent
+        crossing them crashes into the snake.
+
+        Args:
+            snake (list): [pos, direction, speed] of the snake after its move
+            opponents (list): [pos, direction, speed] of each opponent, None for dead opponents
+            index (int): Index of the moving opponent
+            round_trail (list): The cells filled by the snake in this round
+            depth (int): Remaining rounds, including this one
+            alpha (float): Score the snake is already guaranteed
+            beta (float): Score the opponents are already guaranteed
+
+        Returns:
+            float: The score of the state
+        """
+        if index == len(opponents):
+            self._occupied.update(round_trail)
+            value = self._max_value(snake, opponents, depth - 1, alpha, beta)
+            self._occupied.difference_update(round_trail)
+            return value
+
+        opponent = opponents[index]
+        if opponent is None:
+            return self._min_value(snake, opponents, index + 1, round_trail, depth, alpha, beta)
+
+        self._game._nodes_expanded += 1
+        moves = self._generate_moves(*opponent)
+        if len(moves) == 0:
+            remaining = opponents[:index] + [None] + opponents[index + 1:]
+            return self._min_value(snake, remaining, index + 1, round_trail, depth, alpha, beta)
+
+        value = float('inf')
+        for move in self._order(moves, depth, index + 1):
+            command, square, trail, direction, speed = move
+            if not set(round_trail).isdisjoint(trail):
+                score = -WIN_SCORE / 2
+            else:
+                self._occupied.update(trail)
+                remaining = opponents[:index] + [[square, direction, speed]] + opponents[index + 1:]
+                score = self._min_value(snake, remaining, index + 1, round_trail, depth, alpha, beta)
+                self._occupied.difference_update(trail)
+            value = min(value, score)
+            if value <= alpha:
+                self._store_cutoff(command, depth, index + 1)
+                break
+            beta = min(beta, value)
+        return value
+
+    def _evaluate(self, moves, opponents):
+        """Scores a state at the end of the search by the mobility of the snake and the opponents
+
+        Args:
+            moves (list): The possible moves of the snake
+            opponents (list): [pos, direction, speed] of each opponent, None for dead opponents
+
+        Returns:
+            float: The score of the state
+        """
+        score = len(moves)
+        for opponent in opponents:
+            if opponent is not None:
+                score -= len(self._generate_moves(*opponent)) / len(opponents)
+        return score
+
+    def _generate_moves(self, pos, direction, speed):
+        """Generates the possible moves of a snake, which neither leave the board nor cross
+        an occupied cell or a cell filled earlier in the search
+
+        Args:
+            pos ([int, int]): The position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+
+        Returns:
+            list: (command, target, trail, new direction, new speed) of each possible move
+        """
+        moves = []
+        for command, square in zip(Commands, self._game._generate_possible_fields(pos, direction, speed)):
+            new_direction, new_speed = self._game._apply_command(direction, speed, command)
+            if new_speed < 1 or new_speed > 10 or not self._game._check_if_reachable(pos, square):
+                continue
+            trail = [(block[0], block[1]) for block in self._game._calculate_path(pos, square)[1:]]
+            if self._occupied.isdisjoint(trail):
+                moves.append((command, square, trail, new_direction, new_speed))
+        return moves
+
+    def _order(self, moves, depth, player):
+        """Orders the moves so killer moves come first, then by the history heuristic
+
+        Args:
+            moves (list): The moves of _generate_moves
+            depth (int): Remaining rounds
+            player (int): 0 for the snake, index + 1 for an opponent
+
+        Returns:
+            list: The ordered moves
+        """
+        killers = self._killers.get((depth, player), [])
+        return sorted(moves, key=lambda move: (move[0] not in killers, -self._history.get((player, move[0]), 0)))
+
+    def _store_cutoff(self, command, depth, player):
+        """Remembers a command which caused a cutoff
+
+        Args:
+            command (Commands): The command
+            depth (int): Remaining rounds
+            player (int): 0 for the snake, index + 1 for an opponent
+        """
+        killers = self._killers.setdefault((depth, player), [])
+        if command not in killers:
+            killers.insert(0, command)
+            del killers[2:]
+        self._history[(player, command)] = self._history.get((player, command), 0) + depth * depth
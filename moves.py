@@ -0,0 +1,83 @@
+from collections import namedtuple
+from enums.commands import Commands
+from enums.directions import Directions
+
+# the effect of a command: the target relative to the start, the new direction and speed
+# and the passed cells relative to the start, on normal moves and on jump moves (every sixth move)
+Move = namedtuple('Move', ['dx', 'dy', 'direction', 'speed', 'offsets', 'jump_offsets'])
+
+DIRECTION_VECTORS = {
+    Directions.UP: (0, -1),
+    Directions.RIGHT: (1, 0),
+    Directions.DOWN: (0, 1),
+    Directions.LEFT: (-1, 0)
+}
+
+# speeds above 10 are reached inside the search (speeding up at speed 10), faster ones are built on demand
+MAX_TABLE_SPEED = 20
+
+def build_move(direction, speed, command):
+    """Calculates the effect of a command
+
+    Args:
+        direction (Directions): The snakes direction
+        speed (int): The snakes speed
+        command (Commands): The executed command
+
+    Returns:
+        Move: The effect of the command
+    """
+    new_direction, new_speed = direction, speed
+    if command == Commands.SLOW_DOWN:
+        new_speed -= 1
+    elif command == Commands.SPEED_UP:
+        new_speed += 1
+    elif command == Commands.TURN_LEFT:
+        new_direction = Directions((direction.value - 1) % 4)
+    elif command == Commands.TURN_RIGHT:
+        new_direction = Directions((direction.value + 1) % 4)
+
+    vx, vy = DIRECTION_VECTORS[new_direction]
+    offsets = tuple((vx * step, vy * step) for step in range(1, new_speed + 1))
+    # a jump only passes the first and the last cell, like Game._calculate_path both are kept at speed 1
+    jump_offsets = (offsets[0], offsets[-1]) if new_speed > 0 else offsets
+    return Move(vx * new_speed, vy * new_speed, new_direction, new_speed, offsets, jump_offsets)
+
+# built once at import time, indexed by (direction, speed, command)
+MOVES = {(direction, speed, command): build_move(direction, speed, command)
+         for direction in Directions for speed in range(0, MAX_TABLE_SPEED + 1) for command in Commands}
+
+# the moves of all commands in the order of Commands, indexed by (direction, speed)
+MOVE_LISTS = {(direction, speed): tuple(MOVES[(direction, speed, command)] for command in Commands)
+              for direction in Directions for speed in range(0, MAX_TABLE_SPEED + 1)}
+
+def get_move(direction, speed, command):
+    """Returns the effect of a command from the table
+
+    Args:
+        direction (Directions): The snakes direction
+        speed (int): The snakes speed
+        command (Commands): The executed command
+
+    Returns:
+        Move: The effect of the command
+    """
+    move = MOVES.get((direction, speed, command))
+    if move is None:
+        move = build_move(direction, speed, command)
+    return move
+
+def get_moves(direction, speed):
+    """Returns the effects of all commands from the table
+
+    Args:
+        direction (Directions): The snakes direction
+        speed (int): The snakes speed
+
+    Returns:
+        tuple: The Move of each command, in the order of Commands
+    """
+    moves = MOVE_LISTS.get((direction, speed))
+    if moves is None:
+        moves = tuple(build_move(direction, speed, command) for command in Commands)
+    return moves
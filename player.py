@@ -1,7 +1,13 @@
+from collections import namedtuple
 from enums.directions import Directions
 
+# immutable state of a player, cheap to pickle
+PlayerSnapshot = namedtuple('PlayerSnapshot', ['player_id', 'x', 'y', 'direction', 'speed', 'active'])
+
 class Player:
 
+    __slots__ = ('_player_id', '_x', '_y', '_direction', '_speed', '_active')
+
     def __init__(self, player_id, x, y, direction, speed, active):
         self._player_id = player_id
         self._x = x
@@ -66,6 +72,26 @@ class Player:
         """
         return self._active
 
+    def get_snapshot(self):
+        """Returns an immutable copy of the player
+
+        Returns:
+            PlayerSnapshot: The snapshot
+        """
+        return PlayerSnapshot(self._player_id, self._x, self._y, self._direction, self._speed, self._active)
+
+    @staticmethod
+    def from_snapshot(snapshot):
+        """Creates a player object from a snapshot
+
+        Args:
+            snapshot (PlayerSnapshot): The snapshot
+
+        Returns:
+            Player: The created Player object
+        """
+        return Player(*snapshot)
+
     @staticmethod
     def from_dict(player_as_dict, player_id):
         """Creates and returns a player object from the given dictionary
@@ -0,0 +1,105 @@
+import os
+import struct
+import zlib
+
+from enums.commands import Commands
+
+# tick, action (-1 without action) and length of the compressed state of each record
+_HEADER = struct.Struct('<Ibi')
+
+class GameRecorder:
+
+    def __init__(self, path):
+        """Appends the received states and the sent actions of a game to a file.
+        Every record is a small header followed by the zlib compressed json string of the state.
+
+        Args:
+            path (str): The path of the file
+        """
+        self._file = open(path, 'ab')
+
+    def record(self, tick, json_string, action=None):
+        """Appends one state and the action sent for it
+
+        Args:
+            tick (int): The number of the tick
+            json_string (str): The state as received from the server
+            action (Commands, optional): The sent action. Defaults to None (no action was sent).
+        """
+        data = zlib.compress(json_string.encode() if isinstance(json_string, str) else json_string)
+        self._file.write(_HEADER.pack(tick, -1 if action is None else action.value, len(data)))
+        self._file.write(data)
+        self._file.flush()
+
+    def close(self):
+        """Closes the file"""
+        self._file.close()
+
+
+class GameReader:
+
+    def __init__(self, path):
+        """Reads a file written by GameRecorder. Only the headers are read when opening,
+        the states are decompressed when they are requested.
+
+        Args:
+            path (str): The path of the file
+        """
+        self._file = open(path, 'rb')
+        # offset of the compressed state and the action for each tick
+        self._index = dict()
+        self._ticks = []
+        self._build_index()
+
+    def get_ticks(self):
+        """Returns the recorded ticks in the order of the file
+
+        Returns:
+            list: The ticks
+        """
+        return list(self._ticks)
+
+    def read(self, tick):
+        """Reads the state and the action of a tick
+
+        Args:
+            tick (int): The number of the tick
+
+        Returns:
+            (str, Commands): The json string of the state and the sent action (None if there was none)
+        """
+        offset, length, action = self._index[tick]
+        self._file.seek(offset)
+        return zlib.decompress(self._file.read(length)).decode(), action
+
+    def __iter__(self):
+        """Iterates over the records in the order of the file
+
+        Returns:
+            iterator: (tick, json string, action) of each record, see read
+        """
+        for tick in self._ticks:
+            json_string, action = self.read(tick)
+            yield tick, json_string, action
+
+    def close(self):
+        """Closes the file"""
+        self._file.close()
+
+    def _build_index(self):
+        """Reads the headers of all records and stores the offset of each compressed state.
+        A later record of the same tick replaces the earlier one.
+        """
+        size = os.fstat(self._file.fileno()).st_size
+        offset = 0
+        # a partially written record at the end is ignored
+        while offset + _HEADER.size <= size:
+            self._file.seek(offset)
+            tick, action, length = _HEADER.unpack(self._file.read(_HEADER.size))
+            offset += _HEADER.size
+            if offset + length > size:
+                break
+            if tick not in self._index:
+                self._ticks.append(tick)
+            self._index[tick] = (offset, length, None if action == -1 else Commands(action))
+            offset += length
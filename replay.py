@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import random
+import time
+
+from decoder import decode_game_state
+from game import Game
+from game_state import GameState
+from recorder import GameReader
+from utils import percentile
+
+def replay(path, settings=None, seed=0):
+    """Feeds the recorded states of a game through a new Game in the recorded order.
+    The deadlines are removed, so the decisions do not depend on the replay speed.
+
+    Args:
+        path (str): The file written by GameRecorder
+        settings (dict, optional): Keyword arguments for Game. Defaults to None (default settings).
+        seed (int, optional): Seed of the random tie breaking. Defaults to 0.
+
+    Returns:
+        list: For each replayed tick a dict with the recorded and the replayed command,
+              whether they differ ('diff') and the latency of predict_move in seconds
+    """
+    random.seed(seed)
+    game = Game(**(settings or {}))
+    reader = GameReader(path)
+    results = []
+    try:
+        for tick, json_string, action in reader:
+            game_state_as_dict, board = decode_game_state(json_string)
+            game_state_as_dict['deadline'] = ''
+            game_state = GameState.from_dict(game_state_as_dict, board=board)
+            if not game_state.is_running() or not game_state.get_player().is_active():
+                continue
+
+            start = time.perf_counter()
+            command = game.predict_move(game_state)
+            latency = time.perf_counter() - start
+            results.append({
+                'tick': tick,
+                'recorded': None if action is None else str(action),
+                'replayed': str(command),
+                'diff': action is not None and command != action,
+                'latency': latency
+            })
+    finally:
+        reader.close()
+        game.close()
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Replays a recorded game and reports decision diffs and latency per tick')
+    parser.add_argument('path')
+    parser.add_argument('--depth', type=int, default=7)
+    parser.add_argument('--tau', type=float, default=0.1)
+    parser.add_argument('--xi', type=float, default=0.4)
+    parser.add_argument('--engine', default='expectation')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default=None, help='file for the results of all ticks as json')
+    args = parser.parse_args()
+
+    results = replay(args.path, {'depth': args.depth, 'tau': args.tau, 'xi': args.xi, 'engine': args.engine}, seed=args.seed)
+    for result in results:
+        if result['diff']:
+            print('tick %s: recorded %s, replayed %s' % (result['tick'], result['recorded'], result['replayed']))
+    if results:
+        latencies = [result['latency'] for result in results]
+        print('%s ticks, %s diffs, p50 %.1f ms, p99 %.1f ms' % (len(results), sum(result['diff'] for result in results),
+                                                               percentile(latencies, 0.5) * 1000, percentile(latencies, 0.99) * 1000))
+
+    if args.output is not None:
+        with open(args.output, 'w') as output:
+            json.dump(results, output, indent=2)
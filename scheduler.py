@@ -0,0 +1,151 @@
+import threading
+
+from concurrent.futures import Executor, Future
+
+class FairExecutor(Executor):
+
+    def __init__(self, workers):
+        """A bounded pool of threads which runs the task with the earliest deadline first.
+        Tasks with the same key never run at the same time, a task waits until the previous
+        task of its key has finished (e.g. the cancelled search of the same game).
+        A running task is not interrupted by the scheduler, so if a task arrives while all threads
+        are busy and a running task has a later deadline, that task is asked to stop early
+        through its preempt callback (e.g. Game.cancel), otherwise a slow task could starve the others.
+
+        Args:
+            workers (int): Amount of threads
+        """
+        self._condition = threading.Condition()
+        # [deadline, sequence number, key, function, args, kwargs, preempt, future] of each waiting task
+        self._tasks = []
+        self._running_keys = set()
+        # the running tasks, their preempt callback is removed once it was called
+        self._running_tasks = []
+        self._preemptions = 0
+        self._sequence = 0
+        self._shutdown = False
+        self._threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self._threads:
+            thread.start()
+
+    def submit(self, fn, *args, **kwargs):
+        """Schedules a task without deadline and key, it runs after all tasks with a deadline"""
+        return self.submit_with_deadline(float('inf'), None, fn, *args, **kwargs)
+
+    def submit_with_deadline(self, deadline, key, fn, *args, preempt=None, **kwargs):
+        """Schedules a task
+
+        Args:
+            deadline (float): Point in time (time.monotonic) until which the task should be finished
+            key (hashable): Tasks with the same key run one after another, None for independent tasks
+            fn (callable): The function to call
+            *args: The arguments of the function
+            preempt (callable, optional): Makes the running task return early, called at most once
+                                          when a task with an earlier deadline has to wait for it.
+                                          Defaults to None (the task always runs to its end).
+
+        Returns:
+            Future: The future of the result
+        """
+        future = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new tasks after shutdown')
+            task = [deadline, self._sequence, key, fn, args, kwargs, preempt, future]
+            self._tasks.append(task)
+            self._sequence += 1
+            self._preempt_for(task)
+            self._condition.notify()
+        return future
+
+    def get_waiting_count(self):
+        """Returns the amount of tasks which have not started yet
+
+        Returns:
+            int: Amount of waiting tasks
+        """
+        with self._condition:
+            return len(self._tasks)
+
+    def get_preemption_count(self):
+        """Returns how often a running task was asked to stop for a task with an earlier deadline
+
+        Returns:
+            int: Amount of preemptions
+        """
+        with self._condition:
+            return self._preemptions
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._condition:
+            self._shutdown = True
+            if cancel_futures:
+                for task in self._tasks:
+                    task[-1].cancel()
+                self._tasks = []
+            self._condition.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _next_task(self):
+        """Removes and returns the waiting task with the earliest deadline whose key is not running,
+        must be called with the condition held
+
+        Returns:
+            list: The task, None if no task can run
+        """
+        best = None
+        for task in self._tasks:
+            if task[2] is not None and task[2] in self._running_keys:
+                continue
+            if best is None or task[:2] < best[:2]:
+                best = task
+        if best is not None:
+            self._tasks.remove(best)
+        return best
+
+    def _preempt_for(self, task):
+        """Asks the running task with the latest deadline to stop early if the given task would
+        have to wait for it, must be called with the condition held
+
+        Args:
+            task (list): The waiting task
+        """
+        if len(self._running_tasks) < len(self._threads) or task[2] is not None and task[2] in self._running_keys:
+            return
+        candidates = [running for running in self._running_tasks if running[6] is not None]
+        if len(candidates) == 0:
+            return
+        latest = max(candidates, key=lambda running: running[:2])
+        if latest[0] > task[0]:
+            preempt, latest[6] = latest[6], None
+            self._preemptions += 1
+            preempt()
+
+    def _work(self):
+        while True:
+            with self._condition:
+                task = self._next_task()
+                while task is None:
+                    if self._shutdown and len(self._tasks) == 0:
+                        return
+                    self._condition.wait()
+                    task = self._next_task()
+                if task[2] is not None:
+                    self._running_keys.add(task[2])
+                self._running_tasks.append(task)
+
+            _, _, key, fn, args, kwargs, _, future = task
+            try:
+                if future.set_running_or_notify_cancel():
+                    try:
+                        future.set_result(fn(*args, **kwargs))
+                    except BaseException as error:
+                        future.set_exception(error)
+            finally:
+                with self._condition:
+                    self._running_keys.discard(key)
+                    self._running_tasks.remove(task)
+                    # tasks waiting for this key can run now
+                    self._condition.notify_all()
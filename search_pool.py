@@ -0,0 +1,125 @@
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from enums.commands import Commands
+from board import Board, np
+
+# shared memory blocks attached by the current worker process, by name
+_attached_memory = {}
+
+class SearchPool:
+
+    def __init__(self, workers):
+        """Creates a pool of worker processes which score the root commands of a search in parallel.
+        The processes are started once and reused for every move.
+
+        Args:
+            workers (int): Amount of worker processes
+        """
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._memory = None
+
+    def score_options(self, game, pos, direction, speed, depth):
+        """Calculates the score of every command at the given state, one worker task per command.
+        The board of the game is copied into shared memory once and read by all workers.
+
+        Args:
+            game (Game): The game whose state and settings are used
+            pos ([int, int]): The current position of the snakes head
+            direction (Directions): The snakes direction
+            speed (int): The snakes speed
+            depth (int): Depth of the search
+
+        Returns:
+            dict: The score for each command, None if the command is not possible
+        """
+        board = game._game_state.get_board()
+        snapshot = game._game_state.get_snapshot()
+        self._share_board(board)
+
+        futures = dict()
+        for command in Commands:
+            futures[command] = self._executor.submit(
+                _score_option, self._memory.name, snapshot, board.is_numpy(), game.get_settings(), game.get_move_counter(), game._search_end, game._opponent_reach, pos, direction, speed, command, depth)
+        # wait for all tasks, so no worker reads the shared memory while it is overwritten for the next move
+        wait(futures.values())
+
+        option_scores = dict()
+        for command, future in futures.items():
+            score, nodes, hits, misses = future.result()
+            option_scores[command] = score
+            game._nodes_expanded += nodes
+            game._transpositions.add_counts(hits, misses)
+        return option_scores
+
+    def close(self):
+        """Shuts down the worker processes and releases the shared memory"""
+        self._executor.shutdown()
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+    def _share_board(self, board):
+        """Copies the cells of the board into the shared memory, which is (re)allocated if the size changed
+
+        Args:
+            board (Board): The board to share
+        """
+        size = board.get_width() * board.get_height()
+        if self._memory is None or self._memory.size < size:
+            if self._memory is not None:
+                self._memory.close()
+                self._memory.unlink()
+            self._memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        buffer = board.get_buffer()
+        self._memory.buf[:size] = buffer.tobytes() if board.is_numpy() else array('b', buffer).tobytes()
+
+
+def _attach_board(memory_name, width, height, use_numpy):
+    """Creates a board which reads the cells directly from the shared memory
+
+    Args:
+        memory_name (str): Name of the shared memory block
+        width (int): The width of the board
+        height (int): The height of the board
+        use_numpy (bool): Whether the board is backed by a NumPy array
+
+    Returns:
+        Board: The board backed by the shared memory
+    """
+    memory = _attached_memory.get(memory_name)
+    if memory is None:
+        for name in list(_attached_memory):
+            _attached_memory.pop(name).close()
+        memory = shared_memory.SharedMemory(name=memory_name)
+        _attached_memory[memory_name] = memory
+
+    if use_numpy:
+        cells = np.ndarray((height, width), dtype=np.int8, buffer=memory.buf)
+    else:
+        cells = memory.buf.cast('b')[:width * height]
+    return Board(width, height, cells)
+
+
+def _score_option(memory_name, snapshot, use_numpy, settings, move_counter, search_end, opponent_reach, pos, direction, speed, command, depth):
+    """Scores a single root command in a worker process
+
+    Returns:
+        (float, int, int, int): The score (None if the command is not possible), the expanded nodes
+                                and the hits and misses of the transposition table
+    """
+    from game import Game
+    from game_state import GameState
+
+    board = _attach_board(memory_name, snapshot.width, snapshot.height, use_numpy)
+    game = Game(game_state=GameState.from_snapshot(snapshot, board), **settings)
+    game._move_counter = move_counter
+    game._search_end = search_end
+    game._opponent_reach = opponent_reach
+    # the evaluator is passed by name and prepared from the shared board
+    if game._evaluator is not None:
+        game._evaluator.prepare(game._game_state)
+
+    score = game._score_option(pos, direction, speed, command, depth)
+    return score, game._nodes_expanded, game._transpositions.get_hits(), game._transpositions.get_misses()
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import json
+import time
+
+from datetime import datetime, timedelta, timezone
+from random import Random
+from board import Board
+from game_state import GameState
+from moves import get_move
+from player import Player
+from enums.commands import Commands
+from enums.directions import Directions
+from enums.textures import Textures
+
+class Simulator:
+
+    def __init__(self, width, height, players, cells=None, round_counter=1):
+        """Creates a simulation of a spe_ed game
+
+        Args:
+            width (int): The width of the playing field
+            height (int): The height of the playing field
+            players (list): List of Player objects, their ids are used as cell values
+            cells (2d array, optional): The cells of the playing field. Defaults to None (empty field with the players heads).
+            round_counter (int, optional): The number of the next round. Defaults to 1.
+        """
+        self._width = width
+        self._height = height
+        self._round = round_counter
+        # [x, y, direction, speed, active] for each player id
+        self._players = dict()
+        for player in players:
+            self._players[player.get_id()] = [player.get_x(), player.get_y(), player.get_direction(), player.get_speed(), player.is_active()]
+
+        if cells is None:
+            self._board = Board.from_cells(width, height, [[0] * width for _ in range(height)], use_numpy=False)
+            for player_id, (x, y, _, _, _) in self._players.items():
+                self._board.set_value(x, y, player_id)
+        else:
+            self._board = Board.from_cells(width, height, cells, use_numpy=False)
+
+    def get_round(self):
+        """Returns the number of the next round
+
+        Returns:
+            int: The round number
+        """
+        return self._round
+
+    def get_board(self):
+        """Returns the board of the simulation, which is changed by every step
+
+        Returns:
+            Board: The board
+        """
+        return self._board
+
+    def get_players(self):
+        """Returns a list of all players in the current state
+
+        Returns:
+            array: Array of Player objects
+        """
+        return [Player(player_id, x, y, direction, speed, active)
+                for player_id, (x, y, direction, speed, active) in self._players.items()]
+
+    def get_active_player_ids(self):
+        """Returns the ids of all players which are still alive
+
+        Returns:
+            list: The player ids
+        """
+        return [player_id for player_id, player in self._players.items() if player[4]]
+
+    def is_running(self):
+        """Returns whether the game is still running. A game with several players ends
+        when at most one player is alive, a game with a single player when the player died.
+
+        Returns:
+            bool: True if the game is running, otherwise False
+        """
+        active_players = len(self.get_active_player_ids())
+        return active_players > 1 or (active_players == 1 and len(self._players) == 1)
+
+    def get_game_state(self, you, deadline=''):
+        """Returns the current state from the view of the given player.
+        The board is copied, so the state does not change with the next step.
+
+        Args:
+            you (int): The id of the player
+            deadline (str, optional): The deadline of the state. Defaults to ''.
+
+        Returns:
+            GameState: The state of the game
+        """
+        return GameState(self._width, self._height, None, self.get_players(), you, self.is_running(), deadline, board=self._board.copy())
+
+    def to_dict(self, you, deadline=''):
+        """Returns the current state from the view of the given player in the format sent by the server
+
+        Args:
+            you (int): The id of the player
+            deadline (str, optional): The deadline of the state. Defaults to ''.
+
+        Returns:
+            dict: The state of the game
+        """
+        players = dict()
+        for player_id, (x, y, direction, speed, active) in self._players.items():
+            players[str(player_id)] = {'x': x, 'y': y, 'direction': str(direction), 'speed': speed, 'active': active}
+        buffer = self._board.get_buffer().tolist()
+        return {
+            'width': self._width,
+            'height': self._height,
+            'cells': [buffer[y * self._width:(y + 1) * self._width] for y in range(self._height)],
+            'players': players,
+            'you': you,
+            'running': self.is_running(),
+            'deadline': deadline
+        }
+
+    def step(self, actions):
+        """Executes one round. All players move at the same time, players without an action die.
+        A player dies if it leaves the playing field, reaches a speed outside of 1 to 10 or moves
+        into an occupied cell. Cells reached by several players in the same round are marked
+        as MULTIPLE_PLAYERS and all of these players die.
+
+        Args:
+            actions (dict): The command for each player id
+        """
+        jump = self._round % 6 == 0
+        paths = dict()
+
+        for player_id in self.get_active_player_ids():
+            player = self._players[player_id]
+            command = actions.get(player_id)
+            if command is None:
+                player[4] = False
+                continue
+
+            direction, speed = Simulator._apply_command(player[2], player[3], command)
+            player[2] = direction
+            player[3] = speed
+            if speed < 1 or speed > 10:
+                player[4] = False
+                continue
+
+            paths[player_id] = self._calculate_path(player, jump)
+
+        # cut every path at the first cell outside of the field or occupied before this round
+        crashes = set()
+        for player_id, path in paths.items():
+            for index, (x, y) in enumerate(path):
+                if x < 0 or x >= self._width or y < 0 or y >= self._height:
+                    paths[player_id] = path[:index]
+                    crashes.add(player_id)
+                    break
+                if not self._board.is_empty(x, y):
+                    paths[player_id] = path[:index + 1]
+                    crashes.add(player_id)
+                    break
+
+        claims = dict()
+        for path in paths.values():
+            for cell in path:
+                claims[cell] = claims.get(cell, 0) + 1
+
+        for player_id, path in paths.items():
+            player = self._players[player_id]
+            for index, (x, y) in enumerate(path):
+                player[0], player[1] = x, y
+                if claims[(x, y)] > 1 or (player_id in crashes and index == len(path) - 1 and not self._board.is_empty(x, y)):
+                    self._board.set_value(x, y, Textures.MULTIPLE_PLAYERS.value)
+                    crashes.add(player_id)
+                    break
+                self._board.set_value(x, y, player_id)
+            if player_id in crashes:
+                player[4] = False
+
+        self._round += 1
+
+    def _calculate_path(self, player, jump):
+        """Calculates the cells a player moves over in this round
+
+        Args:
+            player (list): [x, y, direction, speed, active] of the player, direction and speed already updated
+            jump (bool): Whether the cells between the first and the last one are skipped
+
+        Returns:
+            list: The reached cells as tuples, in the order of the movement
+        """
+        x, y, direction, speed = player[0], player[1], player[2], player[3]
+        move = get_move(direction, speed, Commands.CHANGE_NOTHING)
+        offsets = move.jump_offsets if jump and speed > 2 else move.offsets
+        return [(x + dx, y + dy) for dx, dy in offsets]
+
+    @staticmethod
+    def _apply_command(direction, speed, command):
+        """Calculates direction and speed of a player after the given command
+
+        Args:
+            direction (Directions): The players direction
+            speed (int): The players speed
+            command (Commands): The executed command
+
+        Returns:
+            (Directions, int): The new direction and the new speed
+        """
+        move = get_move(direction, speed, command)
+        return move.direction, move.speed
+
+    @staticmethod
+    def create(width, height, player_count, seed=None):
+        """Creates a simulation with players at random free positions and random directions
+
+        Args:
+            width (int): The width of the playing field
+            height (int): The height of the playing field
+            player_count (int): Amount of players (at most 6)
+            seed (int, optional): Seed of the random positions. Defaults to None.
+
+        Returns:
+            Simulator: The created simulation
+        """
+        rng = Random(seed)
+        positions = rng.sample(range(width * height), player_count)
+        players = [Player(index + 1, position % width, position // width, Directions(rng.randint(0, 3)), 1, True)
+                   for index, position in enumerate(positions)]
+        return Simulator(width, height, players)
+
+    @staticmethod
+    def from_game_state(game_state, round_counter=1):
+        """Creates a simulation which continues from the given state
+
+        Args:
+            game_state (GameState): The state of the game
+            round_counter (int, optional): The number of the next round. Defaults to 1.
+
+        Returns:
+            Simulator: The created simulation
+        """
+        return Simulator(game_state.get_width(), game_state.get_height(), game_state.get_players(),
+                         cells=game_state.get_board().to_textures(), round_counter=round_counter)
+
+
+def play_match(games, width, height, seed=None, max_rounds=10000, on_decision=None):
+    """Plays a match between the given games in-process
+
+    Args:
+        games (list): One Game object per player
+        width (int): The width of the playing field
+        height (int): The height of the playing field
+        seed (int, optional): Seed of the start positions. Defaults to None.
+        max_rounds (int, optional): Amount of rounds after which the match is stopped. Defaults to 10000.
+        on_decision (callable, optional): Called with the player id and the seconds of predict_move
+                                          after every decision. Defaults to None.
+
+    Returns:
+        int: The id of the winner (index in games + 1), None if no player or several players survived
+    """
+    simulator = Simulator.create(width, height, len(games), seed=seed)
+    while simulator.is_running() and simulator.get_round() <= max_rounds:
+        actions = dict()
+        for player_id in simulator.get_active_player_ids():
+            start = time.perf_counter()
+            actions[player_id] = games[player_id - 1].predict_move(simulator.get_game_state(player_id))
+            if on_decision is not None:
+                on_decision(player_id, time.perf_counter() - start)
+        simulator.step(actions)
+
+    active_players = simulator.get_active_player_ids()
+    return active_players[0] if len(active_players) == 1 else None
+
+
+class LocalServer:
+
+    def __init__(self, simulator, timeout=5):
+        """Creates a websocket server which runs the simulation like the spe_ed server.
+        Every connection controls one player, in the order of the player ids.
+
+        Args:
+            simulator (Simulator): The simulation to run
+            timeout (float, optional): Seconds each player has to respond. Defaults to 5.
+        """
+        self._simulator = simulator
+        self._timeout = timeout
+        self._player_ids = [player.get_id() for player in simulator.get_players()]
+        self._connections = dict()
+        self._all_connected = asyncio.Event()
+        self._finished = asyncio.Event()
+
+    async def serve(self, host='localhost', port=8081):
+        """Waits for all players, runs the game and returns when it is over
+
+        Args:
+            host (str, optional): The host to listen on. Defaults to 'localhost'.
+            port (int, optional): The port to listen on. Defaults to 8081.
+
+        Returns:
+            list: The ids of the players which are still alive
+        """
+        import websockets
+
+        async with websockets.serve(self._handle_connection, host, port):
+            await self._all_connected.wait()
+            await self.run()
+        return self._simulator.get_active_player_ids()
+
+    async def run(self):
+        """Runs the game with the connected players until it is over"""
+        while self._simulator.is_running():
+            deadline = datetime.now(timezone.utc) + timedelta(seconds=self._timeout)
+            deadline_str = deadline.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+            active_ids = self._simulator.get_active_player_ids()
+            results = await asyncio.gather(*[self._request_action(player_id, deadline_str) for player_id in active_ids])
+            self._simulator.step(dict(zip(active_ids, results)))
+
+        for player_id, websocket in self._connections.items():
+            await websocket.send(json.dumps(self._simulator.to_dict(player_id)))
+        self._finished.set()
+
+    async def _request_action(self, player_id, deadline):
+        """Sends the state to a player and waits for its action
+
+        Returns:
+            Commands: The action of the player, None if it did not respond in time
+        """
+        websocket = self._connections[player_id]
+        await websocket.send(json.dumps(self._simulator.to_dict(player_id, deadline)))
+        try:
+            message = await asyncio.wait_for(websocket.recv(), self._timeout)
+            return Commands.from_str(json.loads(message)['action'])
+        except (asyncio.TimeoutError, KeyError, NotImplementedError, ValueError):
+            return None
+
+    async def _handle_connection(self, websocket, path=None):
+        if len(self._connections) == len(self._player_ids):
+            await websocket.close()
+            return
+        self._connections[self._player_ids[len(self._connections)]] = websocket
+        if len(self._connections) == len(self._player_ids):
+            self._all_connected.set()
+        await self._finished.wait()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local spe_ed server, connect with URL=ws://<host>:<port> KEY=<anything>')
+    parser.add_argument('--width', type=int, default=40)
+    parser.add_argument('--height', type=int, default=40)
+    parser.add_argument('--players', type=int, default=2)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--timeout', type=float, default=5)
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--port', type=int, default=8081)
+    args = parser.parse_args()
+
+    server = LocalServer(Simulator.create(args.width, args.height, args.players, seed=args.seed), timeout=args.timeout)
+    print('alive at the end: %s' % asyncio.run(server.serve(args.host, args.port)))
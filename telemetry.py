@@ -0,0 +1,72 @@
+import cProfile
+import json
+import os
+import threading
+import time
+
+class Telemetry:
+
+    def __init__(self, output=None, slow_turn_threshold=None, profile_directory='profiles'):
+        """Writes one JSON object per turn and profiles slow turns.
+        If a threshold is set, every profiled call runs under cProfile (which slows it down),
+        but the profile is only written if the call took longer than the threshold.
+
+        Args:
+            output (str or file, optional): Path of the JSON lines file or an open text file. Defaults to None (no records).
+            slow_turn_threshold (float, optional): Seconds after which a call counts as slow. Defaults to None (no profiling).
+            profile_directory (str, optional): Directory of the profiles of slow calls. Defaults to 'profiles'.
+        """
+        self._owns_output = isinstance(output, str)
+        self._output = open(output, 'a') if self._owns_output else output
+        self._slow_turn_threshold = slow_turn_threshold
+        self._profile_directory = profile_directory
+        # records are written from the event loop, profiles from the executor
+        self._lock = threading.Lock()
+
+    def emit(self, record):
+        """Writes a record as one line of JSON, with the current time added
+
+        Args:
+            record (dict): The values of the turn
+        """
+        if self._output is None:
+            return
+        line = json.dumps(dict(record, timestamp=time.time()))
+        with self._lock:
+            self._output.write(line + '\n')
+            self._output.flush()
+
+    def profile(self, turn, function, *args):
+        """Calls the function and writes a cProfile dump of the call if it was slow.
+        Has to be called in the thread which runs the function, cProfile only sees that thread.
+
+        Args:
+            turn (int): The number of the turn, used in the name of the dump
+            function (callable): The function to call
+            *args: The arguments of the function
+
+        Returns:
+            The result of the function
+        """
+        if self._slow_turn_threshold is None:
+            return function(*args)
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            return function(*args)
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            if elapsed > self._slow_turn_threshold:
+                os.makedirs(self._profile_directory, exist_ok=True)
+                path = os.path.join(self._profile_directory, 'turn_%s.prof' % turn)
+                profiler.dump_stats(path)
+                self.emit({'turn': turn, 'slow_turn': elapsed, 'profile': path})
+
+    def close(self):
+        """Closes the output, if it was opened from a path"""
+        if self._owns_output and self._output is not None:
+            self._output.close()
+            self._output = None
@@ -0,0 +1,28 @@
+import unittest
+
+from benchmark import create_game_state_dict, run_case
+from game_state import GameState
+
+class BenchmarkTest(unittest.TestCase):
+
+    def test_create_game_state_dict(self):
+        state_dict = create_game_state_dict(30, 20, 4, 0.2, 3, seed=5)
+
+        self.assertTrue(state_dict == create_game_state_dict(30, 20, 4, 0.2, 3, seed=5))
+        self.assertTrue(len(state_dict['players']) == 4)
+        self.assertTrue(state_dict['players']['1']['speed'] == 3)
+
+        game_state = GameState.from_dict(state_dict)
+        player = game_state.get_player()
+        self.assertTrue(game_state.get_board().get_value(player.get_x(), player.get_y()) == 1)
+
+        occupied = sum(1 for row in state_dict['cells'] for cell in row if cell != 0)
+        self.assertTrue(60 <= occupied <= 180)
+
+    def test_run_case(self):
+        case = run_case(10, 10, 2, 0.1, 1, 2, repeat=2)
+
+        for name in ['from_dict', 'predict_move', 'calculate_graph']:
+            self.assertTrue(case[name]['p50_ms'] <= case[name]['p99_ms'])
+            self.assertTrue(case[name]['peak_memory_kib'] > 0)
+        self.assertTrue(case['from_dict']['nodes_per_second'] is None)
@@ -0,0 +1,53 @@
+import unittest
+
+from random import Random
+from bitboard import BitBoard, SEGMENT_MASKS
+from board import Board, np
+from enums.directions import Directions
+
+class BitBoardTest(unittest.TestCase):
+
+    def _create_board(self, width, height, use_numpy):
+        rng = Random(3)
+        cells = [[rng.choice([0, 0, 0, 1, 2, -1]) for _ in range(width)] for _ in range(height)]
+        return Board.from_cells(width, height, cells, use_numpy=use_numpy)
+
+    def test_from_board(self):
+        for use_numpy in [False, True] if np is not None else [False]:
+            board = self._create_board(70, 9, use_numpy)
+            bitboard = BitBoard.from_board(board)
+
+            for y in range(9):
+                for x in range(70):
+                    self.assertTrue(bitboard.is_empty(x, y) == board.is_empty(x, y))
+
+        self.assertTrue(BitBoard.from_board(self._create_board(70, 9, False)) == bitboard)
+
+    def test_is_move_free(self):
+        width, height = 13, 11
+        board = self._create_board(width, height, False)
+        bitboard = BitBoard.from_board(board)
+        vectors = {Directions.UP: (0, -1), Directions.RIGHT: (1, 0), Directions.DOWN: (0, 1), Directions.LEFT: (-1, 0)}
+
+        for y in range(height):
+            for x in range(width):
+                for direction, (dx, dy) in vectors.items():
+                    for speed in range(1, 13):
+                        if not (0 <= x + dx * speed < width and 0 <= y + dy * speed < height):
+                            continue
+                        for jump in [False, True]:
+                            steps = [1, speed] if jump else range(1, speed + 1)
+                            expected = all(board.is_empty(x + dx * step, y + dy * step) for step in steps)
+                            self.assertTrue(bitboard.is_move_free(x, y, direction, speed, jump) == expected)
+
+        self.assertTrue(len(SEGMENT_MASKS) == 4 * 11 * 2)
+
+    def test_fill(self):
+        bitboard = BitBoard.from_board(Board.from_cells(4, 4, [[0] * 4 for _ in range(4)], use_numpy=False))
+
+        bitboard.fill(2, 1)
+
+        self.assertFalse(bitboard.is_empty(2, 1))
+        self.assertFalse(bitboard.is_move_free(2, 3, Directions.UP, 2, False))
+        self.assertTrue(bitboard.is_move_free(2, 3, Directions.UP, 3, True))
+        self.assertFalse(bitboard.is_move_free(0, 1, Directions.RIGHT, 3, False))
@@ -0,0 +1,55 @@
+import unittest
+
+from board import Board, np
+from enums.textures import Textures
+
+class BoardTest(unittest.TestCase):
+
+    def test_from_cells(self):
+        cells = [[0,0,0,0,3],[0,0,1,0,0],[2,0,0,0,-1]]
+
+        for use_numpy in [False, True] if np is not None else [False]:
+            board = Board.from_cells(5, 3, cells, use_numpy=use_numpy)
+
+            self.assertTrue(board.is_numpy() == use_numpy)
+            self.assertTrue(board.get_width() == 5)
+            self.assertTrue(board.get_height() == 3)
+            self.assertTrue(board.get_value(4, 0) == 3)
+            self.assertTrue(board.get_value(4, 2) == -1)
+            self.assertTrue(board.is_empty(0, 0))
+            self.assertFalse(board.is_empty(2, 1))
+            self.assertTrue(board.to_textures()[1][2] == Textures.SNAKE_1)
+            self.assertTrue(board.to_textures()[2][4] == Textures.MULTIPLE_PLAYERS)
+
+    def test_from_textures(self):
+        cells = [[Textures.EMPTY, Textures.WALL], [Textures.SNAKE_2, Textures.EMPTY]]
+
+        board = Board.from_cells(2, 2, cells, use_numpy=False)
+
+        self.assertTrue(board.get_value(1, 0) == 7)
+        self.assertTrue(board.get_value(0, 1) == 2)
+        self.assertTrue(board.to_textures() == cells)
+
+    def test_copy(self):
+        board = Board.from_cells(2, 2, [[0, 0], [0, 0]], use_numpy=False)
+        board_copy = board.copy()
+
+        board_copy.set_value(1, 1, 4)
+
+        self.assertTrue(board.is_empty(1, 1))
+        self.assertTrue(board_copy.get_value(1, 1) == 4)
+
+    def test_segment_empty(self):
+        cells = [[0,0,0,0,3],[0,0,1,0,0],[2,0,0,0,0]]
+
+        for use_numpy in [False, True] if np is not None else [False]:
+            board = Board.from_cells(5, 3, cells, use_numpy=use_numpy)
+
+            self.assertTrue(board.is_row_segment_empty(0, 0, 3))
+            self.assertFalse(board.is_row_segment_empty(0, 0, 4))
+            self.assertTrue(board.is_row_segment_empty(1, 3, 4))
+            self.assertFalse(board.is_row_segment_empty(1, 2, 2))
+            self.assertTrue(board.is_column_segment_empty(1, 0, 2))
+            self.assertFalse(board.is_column_segment_empty(0, 0, 2))
+            self.assertTrue(board.is_column_segment_empty(4, 1, 2))
+            self.assertFalse(board.is_column_segment_empty(4, 0, 0))
@@ -0,0 +1,94 @@
+import json
+import unittest
+
+from random import Random
+from board import Board
+from board_tracker import BoardTracker
+from decoder import decode_board, decode_game_state
+from game_state import GameState
+from simulator import Simulator
+from enums.commands import Commands
+
+class BoardTrackerTest(unittest.TestCase):
+
+    def test_update_matches_full_board(self):
+        rng = Random(8)
+        simulator = Simulator.create(20, 20, 4, seed=8)
+        tracker = BoardTracker()
+
+        while simulator.is_running():
+            state_dict = simulator.to_dict(1)
+            game_state = tracker.update(state_dict)
+
+            self.assertTrue(game_state.get_board() == GameState.from_dict(state_dict).get_board())
+            self.assertTrue(len(game_state.get_players()) == 4)
+
+            simulator.step({player_id: Commands(rng.choice([0, 1, 4, 4, 4])) for player_id in simulator.get_active_player_ids()})
+
+        self.assertTrue(tracker.get_update_count() > 10)
+        self.assertTrue(tracker.get_rebuild_count() == 1)
+
+    def test_update_decodes_cells_only_to_verify(self):
+        rng = Random(8)
+        simulator = Simulator.create(20, 20, 4, seed=8)
+        tracker = BoardTracker(verify_interval=5)
+        loaded = []
+
+        def load_board(json_string):
+            loaded.append(tracker.get_update_count())
+            return decode_board(json_string, 20, 20)
+
+        while simulator.is_running():
+            state_dict = simulator.to_dict(1)
+            json_string = json.dumps(state_dict)
+            decoded_dict, board = decode_game_state(json_string, decode_cells=False)
+            game_state = tracker.update(decoded_dict, load_board=lambda: load_board(json_string))
+
+            self.assertTrue(board is None)
+            # the moved cells get the id of their player, so only the occupancy is compared
+            self.assertTrue(game_state.get_bitboard() == GameState.from_dict(state_dict).get_bitboard())
+
+            simulator.step({player_id: Commands(rng.choice([0, 1, 4, 4, 4])) for player_id in simulator.get_active_player_ids()})
+
+        self.assertTrue(tracker.get_update_count() > 10)
+        self.assertTrue(all(update == 1 or update % 5 == 0 for update in loaded))
+
+    def test_rebuild_on_inconsistent_state(self):
+        simulator = Simulator.create(10, 10, 2, seed=1)
+        tracker = BoardTracker()
+        tracker.update(simulator.to_dict(1))
+
+        state_dict = simulator.to_dict(1)
+        state_dict['players']['1']['x'] = (state_dict['players']['1']['x'] + 1) % 10
+        state_dict['players']['1']['y'] = (state_dict['players']['1']['y'] + 1) % 10
+        game_state = tracker.update(state_dict)
+
+        self.assertTrue(tracker.get_rebuild_count() == 2)
+        self.assertTrue(game_state.get_board() == Board.from_cells(10, 10, state_dict['cells']))
+
+    def test_verify_interval(self):
+        simulator = Simulator.create(10, 10, 2, seed=1)
+        tracker = BoardTracker(verify_interval=2)
+        tracker.update(simulator.to_dict(1))
+
+        # a change which is not caused by a move
+        state_dict = simulator.to_dict(1)
+        state_dict['cells'][0][0] = 7 if state_dict['cells'][0][0] == 0 else 0
+        game_state = tracker.update(state_dict)
+
+        self.assertTrue(tracker.get_rebuild_count() == 2)
+        self.assertTrue(game_state.get_board() == Board.from_cells(10, 10, state_dict['cells']))
+
+    def test_verify_by_default(self):
+        simulator = Simulator.create(10, 10, 2, seed=1)
+        tracker = BoardTracker()
+        tracker.update(simulator.to_dict(1))
+
+        state_dict = simulator.to_dict(1)
+        state_dict['cells'][0][0] = 7 if state_dict['cells'][0][0] == 0 else 0
+        for _ in range(20):
+            game_state = tracker.update(state_dict)
+
+        self.assertTrue(tracker.get_rebuild_count() == 2)
+        self.assertTrue(game_state.get_board() == Board.from_cells(10, 10, state_dict['cells']))
+        self.assertRaises(TypeError, hash, game_state.get_board())
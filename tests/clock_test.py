@@ -0,0 +1,83 @@
+import json
+import threading
+import time
+import unittest
+
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from clock import ServerClock, fetch_server_time
+from game import Game
+from game_state import GameState
+
+def _format(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+class ClockTest(unittest.TestCase):
+
+    def test_time_samples(self):
+        clock = ServerClock()
+        # the server is 2 seconds ahead, the second sample has the shortest round trip
+        clock.add_time_sample(1002.3, 1000.0, 1000.4)
+        clock.add_time_sample(1012.1, 1010.0, 1010.2)
+        clock.add_time_sample(1022.5, 1020.0, 1021.0)
+
+        self.assertTrue(abs(clock.get_offset() - 2.0) < 1e-9)
+        self.assertTrue(abs(clock.get_latency() - 0.1) < 1e-9)
+
+        deadline = _format(1100)
+        self.assertTrue(abs(clock.get_usable_time(deadline, now=1090.0) - 7.9) < 1e-9)
+        # a late response is reported as such, callers clamp their timeouts
+        self.assertTrue(abs(clock.get_usable_time(deadline, now=1099.0) + 1.1) < 1e-9)
+        self.assertTrue(clock.get_usable_time('') is None)
+
+    def test_message_bounds_offset(self):
+        clock = ServerClock()
+        clock.add_time_sample(1005.0, 1000.0, 1000.0)
+
+        # a state received at 1000 with a deadline at 1003 means the server clock is at most 3 seconds ahead
+        clock.add_message(_format(1003), 1000.0)
+        clock.add_message('', 1000.0)
+
+        self.assertTrue(clock.get_offset() == 3.0)
+
+    def test_synchronize_with_local_stand_in(self):
+        clock = ServerClock()
+        clock.synchronize(time.time)
+
+        self.assertTrue(abs(clock.get_offset()) < 0.01)
+        self.assertTrue(clock.get_latency() < 0.01)
+
+    def test_fetch_server_time(self):
+        class TimeHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = json.dumps({'time': '2021-01-04T10:45:31Z', 'milliseconds': 250}).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('localhost', 0), TimeHandler)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        try:
+            server_time = fetch_server_time('http://localhost:%s/' % server.server_port)
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+        self.assertTrue(server_time == datetime(2021, 1, 4, 10, 45, 31, tzinfo=timezone.utc).timestamp() + 0.25)
+
+    def test_game_uses_clock(self):
+        clock = ServerClock()
+        clock.add_time_sample(time.time() + 20, time.time() - 0.5, time.time() + 0.5)
+        deadline = _format(time.time() + 30)
+        game_state = GameState(3, 3, [[0, 0, 0], [0, 1, 0], [0, 0, 0]], [], 1, True, deadline)
+
+        game = Game(game_state=game_state, clock=clock)
+
+        self.assertTrue(game._calculate_time_left() < 10.5)
+        self.assertTrue(game_state.get_time_left() > 28)
@@ -0,0 +1,62 @@
+import json
+import unittest
+
+from unittest import mock
+from benchmark import create_game_state_dict
+from decoder import decode_board, decode_game_state
+from game_state import GameState
+import decoder
+
+class DecoderTest(unittest.TestCase):
+
+    def test_decode_game_state(self):
+        state_dict = create_game_state_dict(12, 7, 3, 0.3, 2, seed=4)
+        state_dict['cells'][0][0] = -1
+
+        for json_string in [json.dumps(state_dict), json.dumps(state_dict, indent=4)]:
+            for use_numpy in [False, True] if decoder.np is not None else [False]:
+                with mock.patch.object(decoder, 'np', decoder.np if use_numpy else None):
+                    decoded_dict, board = decode_game_state(json_string)
+
+                self.assertTrue(board.is_numpy() == use_numpy)
+                self.assertTrue(board == GameState.from_dict(state_dict).get_board())
+                self.assertTrue(decoded_dict['players'] == state_dict['players'])
+                self.assertTrue(decoded_dict['width'] == 12 and decoded_dict['height'] == 7)
+
+    def test_decode_cells_later(self):
+        state_dict = create_game_state_dict(12, 7, 3, 0.3, 2, seed=4)
+        json_string = json.dumps(state_dict)
+
+        decoded_dict, board = decode_game_state(json_string, decode_cells=False)
+
+        self.assertTrue(board is None)
+        self.assertTrue(decoded_dict['players'] == state_dict['players'])
+        self.assertTrue(decode_board(json_string, 12, 7) == GameState.from_dict(state_dict).get_board())
+
+    def test_decode_without_orjson(self):
+        state_dict = create_game_state_dict(5, 3, 2, 0.3, 1, seed=1)
+
+        with mock.patch.object(decoder, 'orjson', None):
+            decoded_dict, board = decode_game_state(json.dumps(state_dict))
+
+        self.assertTrue(decoded_dict['you'] == 1)
+        self.assertTrue(board == GameState.from_dict(state_dict).get_board())
+
+    def test_decode_formatting(self):
+        json_string = '{"width": 0, "height": 0, "players": {}, "cells": [ ], "you": 1, "running": false}'
+        decoded_dict, board = decode_game_state(json_string)
+
+        self.assertFalse(decoded_dict['running'])
+        self.assertTrue(board.get_width() == 0)
+
+        json_string = '{"width": 2, "height": 1, "cells" : [ [0, 3] ], "players": {}, "you": 1, "running": true}'
+        decoded_dict, board = decode_game_state(json_string)
+
+        self.assertTrue(board.get_value(1, 0) == 3)
+
+    def test_decode_out_of_range(self):
+        json_string = '{"width": 2, "height": 1, "cells": [[0, 300]], "players": {}, "you": 1, "running": true}'
+
+        for use_numpy in [False, True] if decoder.np is not None else [False]:
+            with mock.patch.object(decoder, 'np', decoder.np if use_numpy else None):
+                self.assertRaises(ValueError, decode_game_state, json_string)
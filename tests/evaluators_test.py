@@ -0,0 +1,74 @@
+import unittest
+
+from board import Board, np
+from evaluators import FloodFillEvaluator, VoronoiEvaluator, calculate_distances, create_evaluator
+from game import Game
+from game_state import GameState
+from player import Player
+from enums.commands import Commands
+from enums.directions import Directions
+
+class EvaluatorsTest(unittest.TestCase):
+
+    def _create_game_state(self, use_numpy):
+        # player 1 is at (1, 1) in a pocket, player 2 at (5, 3) in the open part of the field
+        cells = [
+            [0, 0, 0, 7, 0, 0, 0],
+            [0, 1, 0, 7, 0, 0, 0],
+            [0, 0, 0, 7, 0, 0, 0],
+            [7, 7, 0, 7, 0, 2, 0],
+            [0, 0, 0, 0, 0, 0, 0]
+        ]
+        players = [Player(1, 1, 1, Directions.DOWN, 1, True), Player(2, 5, 3, Directions.UP, 1, True)]
+        board = Board.from_cells(7, 5, cells, use_numpy=use_numpy)
+        return GameState(7, 5, None, players, 1, True, '', board=board)
+
+    def _board_types(self):
+        return [False, True] if np is not None else [False]
+
+    def test_calculate_distances(self):
+        for use_numpy in self._board_types():
+            board = self._create_game_state(use_numpy).get_board()
+
+            distances = calculate_distances(board, [(1, 1)], 3, center=(1, 1))
+            if use_numpy:
+                distances = {(x, y): int(distances[y, x]) for y in range(5) for x in range(7) if distances[y, x] <= 3}
+
+            self.assertTrue(distances[(1, 1)] == 0)
+            self.assertTrue(distances[(2, 2)] == 2)
+            self.assertTrue(distances[(2, 3)] == 3)
+            self.assertTrue((2, 4) not in distances)
+            self.assertTrue((4, 0) not in distances)
+            self.assertTrue(len(distances) == 10)
+
+    def test_flood_fill(self):
+        for use_numpy in self._board_types():
+            evaluator = FloodFillEvaluator(radius=3)
+            evaluator.prepare(self._create_game_state(use_numpy))
+
+            # 9 free cells within 3 steps, out of 24 cells within the radius
+            self.assertTrue(evaluator.evaluate([1, 1]) == 5 * 9 / 24)
+            self.assertTrue(evaluator.evaluate([4, 1]) > evaluator.evaluate([1, 1]))
+
+    def test_voronoi(self):
+        for use_numpy in self._board_types():
+            evaluator = VoronoiEvaluator(radius=4)
+            evaluator.prepare(self._create_game_state(use_numpy))
+
+            flood_fill = FloodFillEvaluator(radius=4)
+            flood_fill.prepare(self._create_game_state(use_numpy))
+
+            # the opponent reaches the open part first, only the pocket belongs to player 1
+            self.assertTrue(evaluator.evaluate([1, 1]) < flood_fill.evaluate([1, 1]))
+            self.assertTrue(evaluator.evaluate([5, 4]) > 0)
+
+    def test_game_with_evaluator(self):
+        game_state = self._create_game_state(np is not None)
+
+        for name in ['flood_fill', 'voronoi']:
+            game = Game(depth=3, evaluator=name)
+            self.assertTrue(game.predict_move(game_state) in Commands)
+            self.assertTrue(game.get_settings()['evaluator'] == name)
+
+        with self.assertRaises(ValueError):
+            create_evaluator('unknown')
@@ -1,8 +1,11 @@
+import pickle
 import unittest
 
+from datetime import datetime, timedelta, timezone
 from game_state import GameState
 from player import Player
 from enums.directions import Directions
+from enums.textures import Textures
 
 class GameStateTest(unittest.TestCase):
 
@@ -48,6 +51,10 @@ class GameStateTest(unittest.TestCase):
         self.assertTrue(gs.get_player().get_id() == 1)
         self.assertTrue(gs.is_running() == True)
         self.assertTrue(len(gs.get_players()) == 3)
+        self.assertTrue(gs.get_deadline() == "2021-01-04T10: 45: 31Z")
+        self.assertTrue(gs.get_cells()[0][4] == Textures.SNAKE_3)
+        self.assertTrue(gs.get_cells()[1][1] == Textures.EMPTY)
+        self.assertFalse(gs.get_board().is_empty(4, 0))
 
     def test_getters(self):
         gs = GameState(4, 4, [[0, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 0], [0, 0, 0, 0]], [Player(1, 2, 1, Directions.RIGHT, 1, True)], 1, True, '')
@@ -57,4 +64,55 @@ class GameStateTest(unittest.TestCase):
         self.assertTrue(gs.get_player().get_id() == 1)
         self.assertTrue(gs.is_running() == True)
         self.assertTrue(len(gs.get_players()) == 1)
-               
\ No newline at end of file
+        self.assertTrue(gs.get_board().get_value(2, 1) == 1)
+
+    def test_parse_deadline(self):
+        deadline = GameState.parse_deadline("2021-01-04T10:45:31Z")
+        self.assertTrue(deadline == datetime(2021, 1, 4, 10, 45, 31, tzinfo=timezone.utc))
+
+        self.assertTrue(GameState.parse_deadline("2021-01-04T10: 45: 31Z") is None)
+        self.assertTrue(GameState.parse_deadline("") is None)
+
+    def test_get_time_left(self):
+        deadline = (datetime.now(timezone.utc) + timedelta(seconds=30)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        gs = GameState(1, 1, [[0]], [], 1, True, deadline)
+        self.assertTrue(28 < gs.get_time_left() <= 30)
+
+        gs = GameState(1, 1, [[0]], [], 1, True, '')
+        self.assertTrue(gs.get_time_left() is None)
+
+    def test_player_lookup(self):
+        players = [Player(1, 0, 0, Directions.UP, 1, True), Player(3, 2, 1, Directions.RIGHT, 1, False)]
+        gs = GameState(4, 4, [[0 for _ in range(4)] for _ in range(4)], players, 3, True, '')
+
+        self.assertTrue(gs.get_player() is players[1])
+        self.assertTrue(gs.get_player_by_id(1) is players[0])
+        self.assertTrue(gs.get_player_by_id(2) is None)
+        self.assertTrue(GameState(1, 1, [[0]], [], 1, True, '').get_player() is None)
+
+    def test_snapshot(self):
+        players = [Player(1, 0, 0, Directions.UP, 1, True), Player(2, 2, 1, Directions.RIGHT, 3, False)]
+        gs = GameState(4, 4, [[0, 0, 0, 0], [0, 0, 2, 0], [0, 0, 0, 0], [0, 0, 0, 0]], players, 2, True, '2021-01-04T10:45:31Z')
+
+        snapshot = gs.get_snapshot()
+        copy = GameState.from_snapshot(pickle.loads(pickle.dumps(snapshot)), gs.get_board())
+
+        self.assertTrue(snapshot.players[1].speed == 3)
+        self.assertTrue(copy.get_snapshot() == snapshot)
+        self.assertTrue(copy.get_player().get_direction() == Directions.RIGHT)
+        self.assertTrue(copy.get_board().get_value(2, 1) == 2)
+        with self.assertRaises(AttributeError):
+            snapshot.width = 5
+        with self.assertRaises(AttributeError):
+            gs.extra = 1
+
+    def test_bitboard_follows_board_changes(self):
+        gs = GameState(4, 4, [[0 for _ in range(4)] for _ in range(4)], [Player(1, 0, 0, Directions.UP, 1, True)], 1, True, '')
+
+        bitboard = gs.get_bitboard()
+        self.assertTrue(gs.get_bitboard() is bitboard)
+        self.assertTrue(bitboard.is_empty(2, 1))
+
+        gs.get_board().set_value(2, 1, 3)
+        self.assertFalse(gs.get_bitboard().is_empty(2, 1))
+        self.assertRaises(TypeError, hash, bitboard)
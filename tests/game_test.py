@@ -1,7 +1,12 @@
 import unittest
 
+from datetime import datetime, timedelta, timezone
+from random import Random, seed
+
 from game_state import GameState
-from game import Game
+from game import Game, UNREACHED
+from moves import get_move
+from player import Player
 from enums.directions import Directions
 from enums.commands import Commands
 
@@ -266,6 +271,22 @@ class GameTest(unittest.TestCase):
         result = game._check_if_reachable([2, 1], [2, 3])
         self.assertTrue(result)
 
+    def test_check_if_reachable_matches_scalar(self):
+        rng = Random(42)
+        width, height = 12, 9
+        cells = [[rng.choice([0, 0, 0, 1, 2, 7]) for _ in range(width)] for _ in range(height)]
+        game_state = GameState(width, height, cells, [], 1, True, '')
+        game = Game(game_state=game_state)
+
+        for move_counter in [5, 6]:
+            game._move_counter = move_counter
+            for x in range(width):
+                for y in range(height):
+                    for direction in Directions:
+                        for speed in range(1, 11):
+                            for target in game._generate_possible_fields([x, y], direction, speed):
+                                self.assertTrue(game._check_if_reachable([x, y], target) == game._check_if_reachable_scalar([x, y], target))
+
     def test_predict_move(self):
         game_state_dict = {
             "width": 5,
@@ -347,3 +368,272 @@ class GameTest(unittest.TestCase):
         predicted_move = game.predict_move(game_state)
 
         self.assertTrue(predicted_move == Commands.CHANGE_NOTHING)
+
+    def test_predict_move_iterative_deepening(self):
+        game_state_dict = {
+            "width": 5,
+            "height": 4,
+            "cells": [
+                [0,0,0,0,0],
+                [1,1,1,2,0],
+                [0,0,2,2,0],
+                [0,0,0,0,0]
+            ],
+            "players": {
+                "1": {
+                    "x": 2,
+                    "y": 1,
+                    "direction": "right",
+                    "speed": 1,
+                    "active": True
+                },
+                "2": {
+                    "x": 3,
+                    "y": 1,
+                    "direction": "up",
+                    "speed": 1,
+                    "active": True
+                }
+            },
+            "you": 1,
+            "running": True,
+            "deadline": (datetime.now(timezone.utc) + timedelta(seconds=60)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        }
+
+        game = Game(iterative_deepening=True, max_depth=4)
+        predicted_move = game.predict_move(GameState.from_dict(game_state_dict))
+        stats = game.get_search_stats()
+
+        self.assertTrue(predicted_move == Commands.TURN_LEFT)
+        self.assertTrue(stats['depth'] == 4)
+        self.assertTrue(stats['nodes'] > 0)
+        self.assertTrue(stats['time_left'] > 0)
+
+        # a deadline in the past still finishes the first level
+        game_state_dict["deadline"] = (datetime.now(timezone.utc) - timedelta(seconds=1)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        game = Game(iterative_deepening=True, max_depth=4)
+        predicted_move = game.predict_move(GameState.from_dict(game_state_dict))
+        stats = game.get_search_stats()
+
+        self.assertTrue(predicted_move == Commands.TURN_LEFT)
+        self.assertTrue(stats['depth'] == 1)
+        self.assertTrue(stats['time_left'] < 0)
+
+    def test_transposition_table(self):
+        width, height = 15, 15
+        cells = [[0 for _ in range(width)] for _ in range(height)]
+        cells[7][7] = 1
+        game_state = GameState(width, height, cells, [Player(1, 7, 7, Directions.RIGHT, 1, True)], 1, True, '')
+
+        seed(3)
+        game = Game(depth=4)
+        cached_move = game.predict_move(game_state)
+        cached_stats = game.get_search_stats()
+
+        seed(3)
+        game = Game(depth=4, transposition_size=0)
+        uncached_move = game.predict_move(game_state)
+        uncached_stats = game.get_search_stats()
+
+        self.assertTrue(cached_move == uncached_move)
+        self.assertTrue(cached_stats['cache_hits'] > 0)
+        self.assertTrue(cached_stats['nodes'] < uncached_stats['nodes'])
+        self.assertTrue(uncached_stats['cache_hits'] == 0)
+
+    def test_score_options_matches_graph(self):
+        rng = Random(7)
+        width, height = 10, 10
+        cells = [[rng.choice([0, 0, 0, 0, 1, 7]) for _ in range(width)] for _ in range(height)]
+        cells[5][5] = 1
+        game_state = GameState(width, height, cells, [Player(1, 5, 5, Directions.UP, 2, True)], 1, True, '')
+
+        for transposition_size in [0, 100000]:
+            game = Game(game_state=game_state, transposition_size=transposition_size)
+            for move_counter in [5, 6]:
+                game._move_counter = move_counter
+                for depth in range(1, 6):
+                    for direction in Directions:
+                        graph = game._calculate_graph([5, 5], direction, 2, depth)
+                        expected = game._score_graph_options(graph, depth)
+                        self.assertTrue(game._score_options([5, 5], direction, 2, depth) == expected)
+
+    def test_track_own_trail(self):
+        width, height = 3, 3
+        cells = [[1,0,0],[0,0,0],[0,0,0]]
+        game_state = GameState(width, height, cells, [Player(1, 0, 0, Directions.RIGHT, 1, True)], 1, True, '')
+
+        game = Game(game_state=game_state, track_own_trail=True)
+        game._move_counter = 1
+
+        # right, right, down, left and then up would cross the cell reached with the first move
+        game._trail = {(1, 0), (2, 0), (2, 1)}
+        self.assertTrue(game._calculate_trail([1, 1], [1, 0]) is None)
+        self.assertTrue(game._calculate_trail([1, 1], [1, 2]) == [(1, 2)])
+        self.assertTrue(game._calculate_trail([1, 1], [0, 1]) == [(0, 1)])
+        game._trail = set()
+
+        tracked_scores = game._score_options([0, 0], Directions.RIGHT, 1, 5)
+
+        game = Game(game_state=game_state)
+        game._move_counter = 1
+        untracked_scores = game._score_options([0, 0], Directions.RIGHT, 1, 5)
+
+        self.assertTrue(tracked_scores[Commands.CHANGE_NOTHING] < untracked_scores[Commands.CHANGE_NOTHING])
+
+    def test_track_own_trail_transpositions(self):
+        rng = Random(3)
+        width, height = 8, 8
+        cells = [[rng.choice([0, 0, 0, 0, 1]) for _ in range(width)] for _ in range(height)]
+        cells[4][4] = 1
+        game_state = GameState(width, height, cells, [Player(1, 4, 4, Directions.UP, 1, True)], 1, True, '')
+
+        uncached = Game(game_state=game_state, track_own_trail=True, transposition_size=0)
+        uncached._move_counter = 1
+        expected = uncached._score_options([4, 4], Directions.UP, 1, 6)
+
+        game = Game(game_state=game_state, track_own_trail=True)
+        game._move_counter = 1
+        self.assertTrue(game._score_options([4, 4], Directions.UP, 1, 6) == expected)
+        hits = game._transpositions.get_hits()
+        # the same states with the same trail are read from the table
+        self.assertTrue(game._score_options([4, 4], Directions.UP, 1, 6) == expected)
+        self.assertTrue(game._transpositions.get_hits() > hits)
+        self.assertTrue(game._trail_hash == 0 and len(game._trail) == 0)
+
+    def test_calculate_opponent_reach(self):
+        width, height = 6, 6
+        cells = [[0 for _ in range(width)] for _ in range(height)]
+        cells[0][0] = 2
+        cells[5][5] = 1
+        players = [Player(1, 5, 5, Directions.UP, 1, True), Player(2, 0, 0, Directions.RIGHT, 1, True)]
+        game_state = GameState(width, height, cells, players, 1, True, '')
+
+        game = Game(game_state=game_state, opponent_plies=1)
+        game._move_counter = 1
+        reach = game._calculate_opponent_reach(game_state.get_player())
+        self.assertTrue({index: tick for index, tick in enumerate(reach) if tick != UNREACHED} == {6: 1, 1: 1, 2: 1})
+
+        game = Game(game_state=game_state, opponent_plies=2)
+        game._move_counter = 1
+        reach = game._calculate_opponent_reach(game_state.get_player())
+        self.assertTrue(reach[1] == 1)
+        self.assertTrue(reach[4] == 2)
+        self.assertTrue(reach[1 * width + 1] == 2)
+        self.assertTrue(reach[5 * width + 5] == UNREACHED)
+
+    def test_get_fallback_move(self):
+        width, height = 6, 6
+        cells = [[0 for _ in range(width)] for _ in range(height)]
+        cells[2][2] = 1
+        cells[1][2] = 7
+        cells[5][2] = 2
+        players = [Player(1, 2, 2, Directions.RIGHT, 1, True), Player(2, 2, 5, Directions.UP, 1, True)]
+        game_state = GameState(width, height, cells, players, 1, True, '')
+        game = Game()
+
+        # turning left is blocked, turning right may collide with the opponent and slowing down stops
+        self.assertTrue(game.get_fallback_move(game_state, 1) == Commands.SPEED_UP)
+        # the state of the game is not used
+        self.assertTrue(game.get_move_counter() == 0)
+
+        # a possible command which may collide is better than none
+        cells[2][3] = 7
+        cells[2][4] = 7
+        game_state = GameState(width, height, cells, players, 1, True, '')
+        self.assertTrue(game.get_fallback_move(game_state, 1) == Commands.TURN_RIGHT)
+
+        cells[3][2] = 7
+        game_state = GameState(width, height, cells, players, 1, True, '')
+        self.assertTrue(game.get_fallback_move(game_state, 1) == Commands.CHANGE_NOTHING)
+
+    def test_contested_moves(self):
+        width, height = 6, 6
+        cells = [[0 for _ in range(width)] for _ in range(height)]
+        cells[0][0] = 2
+        cells[3][2] = 1
+        players = [Player(1, 2, 3, Directions.UP, 1, True), Player(2, 0, 0, Directions.RIGHT, 1, True)]
+        game_state = GameState(width, height, cells, players, 1, True, '')
+
+        game = Game(game_state=game_state)
+        game._move_counter = 1
+        scores = game._score_options([2, 3], Directions.UP, 1, 4)
+
+        game = Game(game_state=game_state, opponent_plies=3)
+        game._move_counter = 1
+        game._opponent_reach = game._calculate_opponent_reach(game_state.get_player())
+        contested_scores = game._score_options([2, 3], Directions.UP, 1, 4)
+
+        move = get_move(Directions.UP, 1, Commands.CHANGE_NOTHING)
+        self.assertTrue(game._is_contested([2, 2], move, 2))
+        self.assertFalse(game._is_contested([2, 2], move, 1))
+        self.assertTrue(contested_scores[Commands.CHANGE_NOTHING] < scores[Commands.CHANGE_NOTHING])
+        self.assertTrue(contested_scores[Commands.SLOW_DOWN] is None)
+
+        self.assertTrue(Game(opponent_plies=3).predict_move(game_state) in Commands)
+
+    def test_score_graph_options_with_settings(self):
+        rng = Random(5)
+        width, height = 10, 10
+        cells = [[rng.choice([0, 0, 0, 0, 0, 7]) for _ in range(width)] for _ in range(height)]
+        cells[5][5] = 1
+        cells[1][1] = 2
+        players = [Player(1, 5, 5, Directions.UP, 1, True), Player(2, 1, 1, Directions.RIGHT, 1, True)]
+        game_state = GameState(width, height, cells, players, 1, True, '')
+
+        for settings in [{'track_own_trail': True}, {'opponent_plies': 3}, {'evaluator': 'flood_fill'},
+                         {'track_own_trail': True, 'opponent_plies': 2, 'evaluator': 'voronoi'}]:
+            games = []
+            for _ in range(2):
+                game = Game(game_state=game_state, **settings)
+                game._move_counter = 6
+                if game._opponent_plies > 0:
+                    game._opponent_reach = game._calculate_opponent_reach(game_state.get_player())
+                if game._evaluator is not None:
+                    game._evaluator.prepare(game_state)
+                games.append(game)
+
+            graph = games[0]._calculate_graph([5, 5], Directions.UP, 1, 5)
+            self.assertTrue(games[0]._score_graph_options(graph, 5) == games[1]._score_options([5, 5], Directions.UP, 1, 5))
+
+    def test_reuse_tree(self):
+        width, height = 12, 12
+        cells = [[0 for _ in range(width)] for _ in range(height)]
+        cells[6][6] = 1
+        cells[2][3] = 2
+        players = [Player(1, 6, 6, Directions.UP, 1, True), Player(2, 3, 2, Directions.RIGHT, 1, True)]
+        game_state = GameState(width, height, cells, players, 1, True, '')
+
+        game = Game(game_state=game_state, depth=4, reuse_tree=True)
+        game._move_counter = 1
+        game._build_tree([6, 6], Directions.UP, 1, 4)
+
+        # the snake moved up, the opponent filled a cell in front of it
+        cells = [row[:] for row in cells]
+        cells[5][6] = 1
+        cells[2][4] = 2
+        cells[3][6] = 2
+        players = [Player(1, 6, 5, Directions.UP, 1, True), Player(2, 4, 2, Directions.RIGHT, 1, True)]
+        next_state = GameState(width, height, cells, players, 1, True, '')
+        game._game_state = next_state
+        game._move_counter = 2
+        game._nodes_expanded = 0
+        game._graph_transpositions.clear()
+        graph = game._build_tree([6, 5], Directions.UP, 1, 4)
+
+        fresh_game = Game(game_state=next_state, depth=4)
+        fresh_game._move_counter = 2
+        fresh_graph = fresh_game._calculate_graph([6, 5], Directions.UP, 1, 4)
+
+        self.assertTrue(game._score_graph_options(graph, 4) == fresh_game._score_graph_options(fresh_graph, 4))
+        self.assertTrue(game._nodes_expanded < fresh_game._nodes_expanded)
+
+        # the graph is only reused in the next move and only if neither of both moves jumps
+        self.assertTrue(game._reuse_subtree([6, 5], Directions.UP, 1, 4) is None)
+        game._move_counter = 3
+        self.assertTrue(game._reuse_subtree([6, 4], Directions.UP, 1, 4) is not None)
+        game._move_counter = 6
+        self.assertTrue(game._reuse_subtree([6, 4], Directions.UP, 1, 4) is None)
+        game._move_counter = 3
+        self.assertTrue(game._reuse_subtree([6, 4], Directions.UP, 2, 4) is None)
+
+        self.assertTrue(Game(depth=3, reuse_tree=True).predict_move(game_state) in Commands)
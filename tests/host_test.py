@@ -0,0 +1,34 @@
+import asyncio
+import os
+import tempfile
+import unittest
+
+from host import BotHost
+from recorder import GameReader
+from simulator import LocalServer, Simulator
+
+class HostTest(unittest.TestCase):
+
+    def test_run(self):
+        async def run():
+            server = LocalServer(Simulator.create(8, 8, 3, seed=1), timeout=3)
+            serve = asyncio.ensure_future(server.serve(port=18082))
+            await asyncio.sleep(0.1)
+            host = BotHost('ws://localhost:18082', ['a', 'b', 'c'], settings={'depth': 2},
+                           telemetry_path=os.path.join(directory, 'turns.jsonl'), record_path=os.path.join(directory, 'game.rec'))
+            return await host.run(), await serve
+
+        with tempfile.TemporaryDirectory() as directory:
+            results, alive = asyncio.run(run())
+
+            # one telemetry and one recording per connection
+            for index in range(3):
+                with open(os.path.join(directory, 'turns_%s.jsonl' % index)) as turns:
+                    self.assertTrue(len(turns.readlines()) > 0)
+                reader = GameReader(os.path.join(directory, 'game_%s.rec' % index))
+                self.assertTrue(len(reader.get_ticks()) > 0)
+                reader.close()
+
+        self.assertTrue(len(results) == 3 and all(isinstance(result, bool) for result in results))
+        self.assertTrue(len(alive) <= 1)
+        self.assertTrue(sum(results) == len(alive))
@@ -0,0 +1,142 @@
+import asyncio
+import threading
+import time
+import unittest
+
+from board_tracker import BoardTracker
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from game import Game
+from main import convert_json_string_to_game_state, create_turn_record, predict_move_in_time
+from scheduler import FairExecutor
+from enums.commands import Commands
+
+class SlowGame(Game):
+
+    def _evaluate(self, pos, direction, speed, depth):
+        self._check_search_end()
+        time.sleep(0.01)
+        return super()._evaluate(pos, direction, speed, depth)
+
+class MainTest(unittest.TestCase):
+
+    def _create_game_state_json(self, deadline):
+        return '''{
+            "width": 5,
+            "height": 4,
+            "cells": [[0,0,0,0,0],[1,1,1,0,0],[0,0,0,0,0],[0,0,0,0,0]],
+            "players": {"1": {"x": 2, "y": 1, "direction": "right", "speed": 1, "active": true}},
+            "you": 1,
+            "running": true,
+            "deadline": "%s"
+        }''' % deadline.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+    def test_convert_json_string_to_game_state(self):
+        game_state = convert_json_string_to_game_state(self._create_game_state_json(datetime.now(timezone.utc)))
+
+        self.assertTrue(game_state.get_width() == 5)
+        self.assertTrue(game_state.get_player().get_pos() == [2, 1])
+
+    def test_convert_json_string_with_tracker(self):
+        tracker = BoardTracker()
+        json_string = self._create_game_state_json(datetime.now(timezone.utc))
+        first = convert_json_string_to_game_state(json_string, tracker=tracker)
+        second = convert_json_string_to_game_state(json_string.replace('"x": 2', '"x": 3').replace('[0,0,0,0,0],[1,1,1,0,0]', '[0,0,0,0,0],[1,1,1,1,0]'), tracker=tracker)
+
+        self.assertTrue(first.get_board().get_value(3, 1) == 0)
+        self.assertTrue(second.get_board().get_value(3, 1) == 1)
+        self.assertTrue(tracker.get_update_count() == 2 and tracker.get_rebuild_count() == 1)
+
+    def test_predict_move_in_time(self):
+        game_state = convert_json_string_to_game_state(self._create_game_state_json(datetime.now(timezone.utc) + timedelta(seconds=60)))
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        action, timed_out = asyncio.run(predict_move_in_time(Game(depth=3), game_state, executor))
+
+        self.assertTrue(action in Commands)
+        self.assertFalse(timed_out)
+        executor.shutdown()
+
+    def test_predict_move_in_time_fallback(self):
+        game_state = convert_json_string_to_game_state(self._create_game_state_json(datetime.now(timezone.utc)))
+        executor = ThreadPoolExecutor(max_workers=1)
+        game = SlowGame(depth=20)
+
+        start = time.monotonic()
+        messages = []
+        action, timed_out = asyncio.run(predict_move_in_time(game, game_state, executor, log=messages.append))
+        executor.shutdown()
+
+        self.assertTrue(messages == ['search timed out, sending fallback %s' % action])
+        self.assertTrue(action in [Commands.CHANGE_NOTHING, Commands.TURN_LEFT, Commands.TURN_RIGHT, Commands.SPEED_UP])
+        self.assertTrue(time.monotonic() - start < 5)
+        self.assertTrue(game.get_move_counter() == 1)
+        self.assertTrue(timed_out)
+
+    def test_predict_move_in_time_fallback_without_search(self):
+        game_state = convert_json_string_to_game_state(self._create_game_state_json(datetime.now(timezone.utc)))
+        executor = ThreadPoolExecutor(max_workers=1)
+        # the executor is still busy (e.g. with the search of the previous move), so the search never starts
+        release = threading.Event()
+        executor.submit(release.wait)
+        game = Game(depth=3)
+
+        try:
+            action, timed_out = asyncio.run(predict_move_in_time(game, game_state, executor, log=lambda message: None))
+        finally:
+            release.set()
+            executor.shutdown()
+
+        # the first level is calculated on the event loop instead of sending CHANGE_NOTHING blindly
+        self.assertTrue(timed_out)
+        self.assertTrue(action == Commands.TURN_LEFT)
+
+    def test_slow_search_does_not_starve_other_game(self):
+        slow_game = SlowGame(depth=20)
+        cheap_game = Game(depth=2)
+        slow_state = convert_json_string_to_game_state(self._create_game_state_json(datetime.now(timezone.utc) + timedelta(seconds=7)))
+        cheap_state = convert_json_string_to_game_state(self._create_game_state_json(datetime.now(timezone.utc) + timedelta(seconds=4)))
+        executor = FairExecutor(1)
+
+        async def play_both():
+            slow = asyncio.ensure_future(predict_move_in_time(slow_game, slow_state, executor, log=lambda message: None))
+            # the slow search is running when the search with the earlier deadline arrives
+            await asyncio.sleep(0.1)
+            start = time.monotonic()
+            cheap = await predict_move_in_time(cheap_game, cheap_state, executor, log=lambda message: None)
+            return await slow, cheap, time.monotonic() - start
+
+        try:
+            (slow_action, slow_timed_out), (cheap_action, cheap_timed_out), cheap_time = asyncio.run(play_both())
+        finally:
+            executor.shutdown()
+
+        # the slow search was cancelled and answered with its first level, the cheap one was searched
+        self.assertFalse(cheap_timed_out)
+        self.assertTrue(cheap_game.get_move_counter() == 1 and cheap_game.get_search_stats()['depth'] == 2)
+        self.assertTrue(cheap_time < 2)
+        self.assertFalse(slow_timed_out)
+        self.assertTrue(slow_game.get_search_stats()['depth'] == 1)
+        self.assertTrue(executor.get_preemption_count() == 1)
+
+    def test_create_turn_record(self):
+        game_state = convert_json_string_to_game_state(self._create_game_state_json(datetime.now(timezone.utc) + timedelta(seconds=60)))
+        game = Game(depth=3)
+        game.predict_move(game_state)
+
+        record = create_turn_record(game, 1, 0.002, Commands.TURN_LEFT, 59.5, False)
+
+        self.assertTrue(record['turn'] == 1 and record['action'] == 'turn_left')
+        self.assertFalse(record['timed_out'])
+        self.assertTrue(record['depth'] == 3 and record['nodes'] > 0 and record['search_time'] > 0)
+        # the depth-first search does not build a graph
+        self.assertTrue('graph_time' not in record)
+
+        # the search finished after the fallback was sent
+        record = create_turn_record(game, 1, 0.002, Commands.CHANGE_NOTHING, None, True)
+        self.assertTrue(record['timed_out'] and 'nodes' not in record)
+
+        game = Game(depth=3, reuse_tree=True)
+        game.predict_move(game_state)
+        record = create_turn_record(game, 1, 0.002, Commands.TURN_LEFT, 59.5, False)
+        self.assertTrue(record['graph_time'] > 0 and record['search_time'] >= record['graph_time'] + record['scoring_time'] - 1e-9)
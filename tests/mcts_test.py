@@ -0,0 +1,126 @@
+import unittest
+
+from array import array
+from random import Random
+from unittest import mock
+from board import Board, np
+from datetime import datetime, timedelta, timezone
+from game import Game
+from game_state import GameState
+from mcts import MonteCarloSearch, _Node
+import mcts
+from player import Player
+from enums.commands import Commands
+from enums.directions import Directions
+
+class MonteCarloSearchTest(unittest.TestCase):
+
+    def _create_game(self, cells, players):
+        game_state = GameState(len(cells[0]), len(cells), cells, players, 1, True, '')
+        game = Game(game_state=game_state, engine='mcts')
+        game._move_counter = 1
+        return game, game_state
+
+    def test_avoids_dead_end(self):
+        # moving up leads into a pocket of two cells, turning right leads into the open field
+        cells = [
+            [7, 0, 7, 0, 0, 0, 0, 0],
+            [7, 0, 7, 0, 0, 0, 0, 0],
+            [0, 1, 0, 0, 0, 0, 0, 0],
+            [7, 7, 7, 7, 7, 7, 7, 7]
+        ]
+        game, game_state = self._create_game(cells, [Player(1, 1, 2, Directions.UP, 1, True)])
+
+        search = MonteCarloSearch(game, iterations=200, seed=0)
+        command = search.search(game_state.get_player())
+
+        self.assertTrue(command == Commands.TURN_RIGHT)
+        self.assertTrue(game._nodes_expanded == 200)
+        # the best command so far is available for a cancelled search
+        self.assertTrue(game.get_best_move(1) == Commands.TURN_RIGHT)
+        self.assertTrue(search.get_depth_reached() > 1)
+
+    def test_batched_rollouts_match_sequential(self):
+        if np is None:
+            return
+        rng = Random(3)
+        cells = [[7 if rng.random() < 0.25 else 0 for _ in range(15)] for _ in range(12)]
+        cells[6][7] = 1
+        game, game_state = self._create_game(cells, [Player(1, 7, 6, Directions.UP, 2, True)])
+        node = _Node([7, 6], Directions.UP, 2, [])
+
+        # the third move jumps
+        for move_counter in [1, 4]:
+            game._move_counter = move_counter
+            search = MonteCarloSearch(game, seed=1)
+            search._board = Board(15, 12, array('b', game_state.get_board().get_buffer().tobytes()))
+            sequential = sum(search._rollout(node, 1) for _ in range(2000)) / 2000
+            batched = search._rollout_batch(node, 1, 2000)
+
+            self.assertTrue(abs(sequential - batched.mean()) < 0.5)
+            self.assertTrue(batched.min() >= 0 and batched.max() <= 20)
+            # the board copy is not changed by the batch
+            self.assertTrue(search._board == game_state.get_board())
+
+    def test_search_without_numpy(self):
+        cells = [
+            [7, 0, 7, 0, 0, 0, 0, 0],
+            [7, 0, 7, 0, 0, 0, 0, 0],
+            [0, 1, 0, 0, 0, 0, 0, 0],
+            [7, 7, 7, 7, 7, 7, 7, 7]
+        ]
+        game, game_state = self._create_game(cells, [Player(1, 1, 2, Directions.UP, 1, True)])
+
+        with mock.patch.object(mcts, 'np', None):
+            search = MonteCarloSearch(game, iterations=200, seed=0)
+            self.assertTrue(search.search(game_state.get_player()) == Commands.TURN_RIGHT)
+
+    def test_reuses_subtree(self):
+        cells = [[0 for _ in range(10)] for _ in range(10)]
+        cells[5][5] = 1
+        game, game_state = self._create_game(cells, [Player(1, 5, 5, Directions.UP, 1, True)])
+
+        search = MonteCarloSearch(game, iterations=100, seed=0)
+        command = search.search(game_state.get_player())
+        child = search._root.children[command]
+        visits = child.visits
+
+        # the state after the chosen command
+        cells[child.pos[1]][child.pos[0]] = 1
+        next_state = GameState(10, 10, cells, [Player(1, child.pos[0], child.pos[1], child.direction, child.speed, True)], 1, True, '')
+        game._game_state = next_state
+        game._move_counter = 2
+        search.search(next_state.get_player())
+
+        self.assertTrue(search._root is child)
+        self.assertTrue(child.visits == visits + 100 * 8)
+
+        # a state which does not match any child starts a new tree
+        game._move_counter = 3
+        search.search(game_state.get_player())
+        self.assertTrue(search._root.visits == 100 * 8)
+
+    def test_board_is_not_changed(self):
+        cells = [[0 for _ in range(6)] for _ in range(6)]
+        cells[3][3] = 1
+        game, game_state = self._create_game(cells, [Player(1, 3, 3, Directions.LEFT, 1, True)])
+        board = game_state.get_board().copy()
+
+        search = MonteCarloSearch(game, iterations=50, seed=1)
+        search.search(game_state.get_player())
+
+        self.assertTrue(game_state.get_board() == board)
+        self.assertTrue(search._board.get_buffer().tobytes() == board.get_buffer().tobytes())
+
+    def test_predict_move_until_deadline(self):
+        cells = [[0 for _ in range(10)] for _ in range(10)]
+        cells[5][5] = 1
+        deadline = (datetime.now(timezone.utc) + timedelta(seconds=0.8)).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        game_state = GameState(10, 10, cells, [Player(1, 5, 5, Directions.UP, 1, True)], 1, True, deadline)
+
+        game = Game(engine='mcts', safety_margin=0.6)
+
+        self.assertTrue(game.predict_move(game_state) in Commands)
+        self.assertTrue(game.get_search_stats()['nodes'] > 0)
+        self.assertTrue(game.get_search_stats()['time_left'] > 0.3)
+        self.assertTrue(game.get_search_stats()['depth'] > 1)
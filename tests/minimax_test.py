@@ -0,0 +1,74 @@
+import unittest
+
+from game import Game
+from game_state import GameState
+from minimax import MinimaxSearch, WIN_SCORE
+from player import Player
+from enums.commands import Commands
+from enums.directions import Directions
+
+class MinimaxTest(unittest.TestCase):
+
+    def _create_game(self, cells, players, depth=3):
+        game_state = GameState(len(cells[0]), len(cells), cells, players, 1, True, '')
+        game = Game(game_state=game_state, depth=depth, engine='minimax')
+        game._move_counter = 1
+        return game, game_state
+
+    def test_avoids_dead_end(self):
+        # moving up leads into a pocket of two cells, turning right leads into the open field
+        cells = [
+            [7, 0, 7, 0, 0, 0],
+            [7, 0, 7, 0, 0, 0],
+            [0, 1, 0, 0, 0, 0],
+            [7, 7, 7, 7, 7, 7]
+        ]
+        game, game_state = self._create_game(cells, [Player(1, 1, 2, Directions.UP, 1, True)], depth=4)
+
+        command = game._search(game_state.get_player(), 4, [])
+
+        self.assertTrue(command == Commands.TURN_RIGHT)
+
+    def test_avoids_contested_cell(self):
+        # the opponent can reach the cell in front of the snake in the next round
+        cells = [[0 for _ in range(7)] for _ in range(5)]
+        cells[2][1] = 1
+        cells[0][3] = 2
+        players = [Player(1, 1, 2, Directions.RIGHT, 1, True), Player(2, 3, 0, Directions.DOWN, 2, True)]
+        game, game_state = self._create_game(cells, players, depth=2)
+
+        search = MinimaxSearch(game)
+        command = search.search(game_state.get_player(), 2)
+
+        self.assertTrue(command not in [Commands.SPEED_UP, Commands.CHANGE_NOTHING])
+        self.assertTrue(game._nodes_expanded > 0)
+
+    def test_opponent_without_moves(self):
+        # every move of the opponent leads into a wall, while the snake can still move up
+        cells = [
+            [7, 7, 7, 7, 7],
+            [7, 2, 7, 0, 7],
+            [7, 0, 0, 1, 7],
+            [7, 7, 7, 7, 7]
+        ]
+        players = [Player(1, 3, 2, Directions.UP, 1, True), Player(2, 1, 1, Directions.UP, 1, True)]
+        game, game_state = self._create_game(cells, players, depth=2)
+
+        search = MinimaxSearch(game)
+        search._occupied = set()
+        score = search._max_value([[3, 2], Directions.UP, 1], [[[1, 1], Directions.UP, 1]], 2, -float('inf'), float('inf'))
+
+        self.assertTrue(score >= WIN_SCORE)
+
+    def test_predict_move(self):
+        cells = [[0 for _ in range(10)] for _ in range(10)]
+        cells[5][5] = 1
+        cells[2][2] = 2
+        players = [Player(1, 5, 5, Directions.UP, 1, True), Player(2, 2, 2, Directions.RIGHT, 1, True)]
+        game_state = GameState(10, 10, cells, players, 1, True, '')
+
+        game = Game(depth=3, engine='minimax')
+
+        self.assertTrue(game.predict_move(game_state) in Commands)
+        self.assertTrue(game.get_search_stats()['depth'] == 3)
+        self.assertTrue(game.get_settings()['engine'] == 'minimax')
@@ -0,0 +1,30 @@
+import unittest
+
+from moves import MOVES, MAX_TABLE_SPEED, build_move, get_move, get_moves
+from enums.commands import Commands
+from enums.directions import Directions
+
+class MovesTest(unittest.TestCase):
+
+    def test_build_move(self):
+        move = build_move(Directions.UP, 3, Commands.TURN_LEFT)
+
+        self.assertTrue(move.direction == Directions.LEFT)
+        self.assertTrue(move.speed == 3)
+        self.assertTrue((move.dx, move.dy) == (-3, 0))
+        self.assertTrue(move.offsets == ((-1, 0), (-2, 0), (-3, 0)))
+        self.assertTrue(move.jump_offsets == ((-1, 0), (-3, 0)))
+
+        move = build_move(Directions.DOWN, 2, Commands.SPEED_UP)
+        self.assertTrue(move.direction == Directions.DOWN and move.speed == 3 and move.dy == 3)
+
+        move = build_move(Directions.RIGHT, 1, Commands.SLOW_DOWN)
+        self.assertTrue(move.speed == 0 and move.offsets == () and (move.dx, move.dy) == (0, 0))
+
+    def test_table(self):
+        self.assertTrue(len(MOVES) == 4 * (MAX_TABLE_SPEED + 1) * 5)
+        self.assertTrue(get_move(Directions.LEFT, 4, Commands.TURN_RIGHT) is MOVES[(Directions.LEFT, 4, Commands.TURN_RIGHT)])
+        self.assertTrue(get_move(Directions.LEFT, 40, Commands.CHANGE_NOTHING) == build_move(Directions.LEFT, 40, Commands.CHANGE_NOTHING))
+        self.assertTrue([move.direction for move in get_moves(Directions.UP, 1)] ==
+                        [Directions.LEFT, Directions.RIGHT, Directions.UP, Directions.UP, Directions.UP])
+        self.assertTrue(len(get_moves(Directions.UP, 25)) == 5)
@@ -40,4 +40,12 @@ class PlayerTest(unittest.TestCase):
         self.assertTrue(pos[0] == 20 and pos[1] == 30)
 
         self.assertTrue(p.is_active() == True)
-        
\ No newline at end of file
+        
+    def test_snapshot(self):
+        p = Player(2, 5, 6, Directions.LEFT, 4, False)
+
+        snapshot = p.get_snapshot()
+
+        self.assertTrue(snapshot.x == 5 and snapshot.direction == Directions.LEFT and snapshot.active == False)
+        self.assertTrue(Player.from_snapshot(snapshot).get_snapshot() == snapshot)
+        self.assertFalse(hasattr(p, '__dict__'))
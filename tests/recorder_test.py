@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+
+from recorder import GameReader, GameRecorder
+from enums.commands import Commands
+
+class RecorderTest(unittest.TestCase):
+
+    def test_record_and_read(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'game.rec')
+            recorder = GameRecorder(path)
+            recorder.record(1, '{"width": 2, "cells": [[0, 0]]}', Commands.TURN_LEFT)
+            recorder.record(2, '{"width": 2, "cells": [[0, 1]]}', Commands.SPEED_UP)
+            recorder.record(3, '{"running": false}')
+            recorder.close()
+
+            reader = GameReader(path)
+            self.assertTrue(reader.get_ticks() == [1, 2, 3])
+            self.assertTrue(reader.read(2) == ('{"width": 2, "cells": [[0, 1]]}', Commands.SPEED_UP))
+            self.assertTrue(list(reader)[2] == (3, '{"running": false}', None))
+            reader.close()
+
+    def test_partial_record(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'game.rec')
+            recorder = GameRecorder(path)
+            recorder.record(1, '{"a": 1}', Commands.TURN_LEFT)
+            recorder.record(2, '{"a": 2}' * 50, Commands.TURN_LEFT)
+            recorder.close()
+            with open(path, 'r+b') as file:
+                file.truncate(os.path.getsize(path) - 3)
+
+            reader = GameReader(path)
+            self.assertTrue(reader.get_ticks() == [1])
+            reader.close()
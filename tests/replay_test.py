@@ -0,0 +1,52 @@
+import json
+import os
+import random
+import tempfile
+import unittest
+
+from game import Game
+from recorder import GameRecorder
+from replay import replay
+from simulator import Simulator
+
+class ReplayTest(unittest.TestCase):
+
+    def _record_game(self, path, seed, max_ticks=15):
+        random.seed(seed)
+        game = Game(depth=3)
+        simulator = Simulator.create(12, 12, 1, seed=4)
+        recorder = GameRecorder(path)
+        tick = 0
+        while simulator.is_running() and tick < max_ticks:
+            tick += 1
+            action = game.predict_move(simulator.get_game_state(1))
+            recorder.record(tick, json.dumps(simulator.to_dict(1)), action)
+            simulator.step({1: action})
+        recorder.close()
+        return tick
+
+    def test_replay(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'game.rec')
+            ticks = self._record_game(path, 5)
+
+            results = replay(path, {'depth': 3}, seed=5)
+
+            self.assertTrue(len(results) == ticks)
+            self.assertTrue(not any(result['diff'] for result in results))
+            self.assertTrue(all(result['latency'] >= 0 for result in results))
+
+            # a different depth changes decisions
+            results = replay(path, {'depth': 1}, seed=5)
+            self.assertTrue(any(result['diff'] for result in results))
+
+    def test_replay_mcts_is_reproducible(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'game.rec')
+            self._record_game(path, 5, max_ticks=2)
+
+            # the seed of the search tree is drawn from the seeded random module
+            first = replay(path, {'engine': 'mcts'}, seed=3)
+            second = replay(path, {'engine': 'mcts'}, seed=3)
+
+            self.assertTrue([result['replayed'] for result in first] == [result['replayed'] for result in second])
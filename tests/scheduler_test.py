@@ -0,0 +1,83 @@
+import threading
+import time
+import unittest
+
+from scheduler import FairExecutor
+
+class SchedulerTest(unittest.TestCase):
+
+    def test_earliest_deadline_first(self):
+        executor = FairExecutor(1)
+        started = threading.Event()
+        release = threading.Event()
+        order = []
+
+        def block():
+            started.set()
+            release.wait(5)
+
+        executor.submit_with_deadline(0, None, block)
+        started.wait(5)
+        futures = [executor.submit_with_deadline(deadline, None, order.append, deadline) for deadline in [3, 1, 2]]
+        futures.append(executor.submit(order.append, 'no deadline'))
+        release.set()
+        for future in futures:
+            future.result(5)
+        executor.shutdown()
+
+        self.assertTrue(order == [1, 2, 3, 'no deadline'])
+
+    def test_same_key_runs_one_after_another(self):
+        executor = FairExecutor(4)
+        lock = threading.Lock()
+        running = []
+        overlaps = []
+
+        def task(key):
+            with lock:
+                overlaps.append(key in running)
+                running.append(key)
+            time.sleep(0.02)
+            with lock:
+                running.remove(key)
+
+        futures = [executor.submit_with_deadline(index, index % 2, task, index % 2) for index in range(8)]
+        for future in futures:
+            future.result(5)
+        executor.shutdown()
+
+        self.assertTrue(len(overlaps) == 8 and not any(overlaps))
+
+    def test_preempt_running_task_with_later_deadline(self):
+        executor = FairExecutor(1)
+        started = threading.Event()
+        stop = threading.Event()
+
+        def search():
+            started.set()
+            # runs until it is preempted
+            stop.wait(5)
+            return 'preempted' if stop.is_set() else 'finished'
+
+        slow = executor.submit_with_deadline(10, 'slow', search, preempt=stop.set)
+        started.wait(5)
+        # a later deadline waits, an earlier one stops the running task
+        late = executor.submit_with_deadline(20, 'late', str, 'late')
+        self.assertFalse(stop.is_set())
+        cheap = executor.submit_with_deadline(5, 'cheap', str, 'cheap')
+
+        self.assertTrue(slow.result(5) == 'preempted')
+        self.assertTrue(cheap.result(5) == 'cheap' and late.result(5) == 'late')
+        self.assertTrue(executor.get_preemption_count() == 1)
+        executor.shutdown()
+
+    def test_exception(self):
+        executor = FairExecutor(1)
+
+        future = executor.submit_with_deadline(1, 'game', int, 'x')
+
+        self.assertRaises(ValueError, future.result, 5)
+        # the key is released after the failed task
+        self.assertTrue(executor.submit_with_deadline(2, 'game', int, '2').result(5) == 2)
+        executor.shutdown()
+        self.assertRaises(RuntimeError, executor.submit, int)
@@ -0,0 +1,94 @@
+import time
+import unittest
+
+from datetime import datetime, timedelta, timezone
+from random import Random, seed
+from board import Board, np
+from game import Game, SearchTimeout
+from game_state import GameState
+from player import Player
+from search_pool import SearchPool
+from enums.directions import Directions
+
+class SearchPoolTest(unittest.TestCase):
+
+    def _create_game_state(self, use_numpy):
+        rng = Random(11)
+        width, height = 20, 15
+        cells = [[rng.choice([0, 0, 0, 0, 0, 2, 7]) for _ in range(width)] for _ in range(height)]
+        cells[7][10] = 1
+        board = Board.from_cells(width, height, cells, use_numpy=use_numpy)
+        return GameState(width, height, None, [Player(1, 10, 7, Directions.LEFT, 2, True)], 1, True, '', board=board)
+
+    def test_score_options_matches_serial(self):
+        for use_numpy in [False, True] if np is not None else [False]:
+            game_state = self._create_game_state(use_numpy)
+
+            game = Game(game_state=game_state, depth=5)
+            search_pool = SearchPool(2)
+            try:
+                for move_counter in [5, 6]:
+                    game._move_counter = move_counter
+                    expected = game._score_options([10, 7], Directions.LEFT, 2, 5)
+                    result = search_pool.score_options(game, [10, 7], Directions.LEFT, 2, 5)
+                    self.assertTrue(result == expected)
+            finally:
+                search_pool.close()
+
+    def test_evaluator_matches_serial(self):
+        game_state = self._create_game_state(np is not None)
+
+        game = Game(game_state=game_state, depth=3, evaluator='voronoi')
+        game._move_counter = 1
+        game._evaluator.prepare(game_state)
+        search_pool = SearchPool(2)
+        try:
+            expected = game._score_options([10, 7], Directions.LEFT, 2, 3)
+            self.assertTrue(search_pool.score_options(game, [10, 7], Directions.LEFT, 2, 3) == expected)
+            # only the name of the evaluator is sent to the workers
+            self.assertTrue(game.get_settings()['evaluator'] == 'voronoi')
+        finally:
+            search_pool.close()
+
+    def test_predict_move_matches_serial(self):
+        game_state = self._create_game_state(False)
+
+        serial_game = Game()
+        parallel_game = Game(workers=2)
+        try:
+            for _ in range(3):
+                seed(1)
+                serial_move = serial_game.predict_move(game_state)
+                seed(1)
+                parallel_move = parallel_game.predict_move(game_state)
+                self.assertTrue(serial_move == parallel_move)
+            self.assertTrue(serial_game.get_search_stats()['nodes'] > 0)
+            self.assertTrue(parallel_game.get_search_stats()['nodes'] > 0)
+        finally:
+            parallel_game.close()
+
+    def test_predict_move_stops_workers_at_deadline(self):
+        # a full depth search on an open board takes far longer than the deadline
+        cells = [[0 for _ in range(40)] for _ in range(40)]
+        cells[20][20] = 1
+        deadline = (datetime.now(timezone.utc) + timedelta(seconds=1.5)).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        game_state = GameState(40, 40, cells, [Player(1, 20, 20, Directions.UP, 1, True)], 1, True, deadline)
+        game = Game(depth=14, workers=2, safety_margin=0.5)
+        try:
+            start = time.monotonic()
+            game.predict_move(game_state)
+            # the workers stop at the deadline minus the safety margin and the first level is used
+            self.assertTrue(time.monotonic() - start < 2)
+            self.assertTrue(game.get_search_stats()['depth'] == 1)
+        finally:
+            game.close()
+
+    def test_timeout(self):
+        game = Game(game_state=self._create_game_state(False), workers=2)
+        game._move_counter = 1
+        game._search_end = time.monotonic() - 1
+        try:
+            with self.assertRaises(SearchTimeout):
+                game._search(game._game_state.get_player(), 5, [])
+        finally:
+            game.close()
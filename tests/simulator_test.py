@@ -0,0 +1,107 @@
+import asyncio
+import json
+import unittest
+
+from game import Game
+from player import Player
+from simulator import LocalServer, Simulator, play_match
+from enums.commands import Commands
+from enums.directions import Directions
+from enums.textures import Textures
+
+class SimulatorTest(unittest.TestCase):
+
+    def test_step(self):
+        simulator = Simulator(10, 5, [Player(1, 0, 0, Directions.RIGHT, 1, True), Player(2, 9, 4, Directions.UP, 1, True)])
+
+        simulator.step({1: Commands.SPEED_UP, 2: Commands.TURN_LEFT})
+
+        players = simulator.get_players()
+        self.assertTrue(players[0].get_pos() == [2, 0] and players[0].get_speed() == 2)
+        self.assertTrue(players[1].get_pos() == [8, 4] and players[1].get_direction() == Directions.LEFT)
+        self.assertTrue(simulator.get_board().get_value(1, 0) == 1)
+        self.assertTrue(simulator.get_board().get_value(2, 0) == 1)
+        self.assertTrue(simulator.get_board().get_value(8, 4) == 2)
+        self.assertTrue(simulator.get_round() == 2)
+        self.assertTrue(simulator.is_running())
+
+    def test_jump(self):
+        simulator = Simulator(10, 1, [Player(1, 0, 0, Directions.RIGHT, 5, True)], round_counter=6)
+        simulator.get_board().set_value(3, 0, 7)
+
+        simulator.step({1: Commands.CHANGE_NOTHING})
+
+        self.assertTrue(simulator.get_players()[0].get_pos() == [5, 0])
+        self.assertTrue(simulator.get_board().get_value(1, 0) == 1)
+        self.assertTrue(simulator.get_board().get_value(2, 0) == 0)
+        self.assertTrue(simulator.get_board().get_value(5, 0) == 1)
+        self.assertTrue(simulator.is_running())
+
+    def test_deaths(self):
+        simulator = Simulator(5, 5, [
+            Player(1, 0, 0, Directions.UP, 1, True),
+            Player(2, 4, 4, Directions.DOWN, 10, True),
+            Player(3, 2, 2, Directions.RIGHT, 1, True),
+            Player(4, 2, 3, Directions.LEFT, 1, True)
+        ])
+
+        simulator.step({1: Commands.CHANGE_NOTHING, 2: Commands.SPEED_UP, 3: Commands.CHANGE_NOTHING})
+
+        # out of bounds, too fast and no action
+        self.assertTrue(simulator.get_active_player_ids() == [3])
+        self.assertFalse(simulator.is_running())
+
+    def test_simultaneous_collision(self):
+        simulator = Simulator(5, 1, [Player(1, 0, 0, Directions.RIGHT, 2, True), Player(2, 4, 0, Directions.LEFT, 2, True)])
+
+        simulator.step({1: Commands.CHANGE_NOTHING, 2: Commands.CHANGE_NOTHING})
+
+        self.assertTrue(simulator.get_active_player_ids() == [])
+        self.assertTrue(simulator.get_board().get_value(2, 0) == Textures.MULTIPLE_PLAYERS.value)
+
+    def test_game_state(self):
+        simulator = Simulator.create(8, 6, 3, seed=1)
+
+        game_state = simulator.get_game_state(2)
+        state_dict = simulator.to_dict(2)
+
+        self.assertTrue(game_state.get_player().get_id() == 2)
+        self.assertTrue(len(game_state.get_players()) == 3)
+        self.assertTrue(len(state_dict['cells']) == 6 and len(state_dict['cells'][0]) == 8)
+        self.assertTrue(state_dict['players']['2']['direction'] in ['up', 'right', 'down', 'left'])
+
+        copy = Simulator.from_game_state(game_state)
+        self.assertTrue(copy.to_dict(2) == state_dict)
+
+    def test_play_match(self):
+        decisions = []
+        winner = play_match([Game(depth=2), Game(depth=2)], 10, 10, seed=3, on_decision=lambda player_id, seconds: decisions.append((player_id, seconds)))
+
+        self.assertTrue(winner in [None, 1, 2])
+        self.assertTrue(len(decisions) > 0 and all(player_id in [1, 2] and seconds >= 0 for player_id, seconds in decisions))
+
+    def test_local_server(self):
+        import websockets
+
+        async def client(port, moves):
+            async with websockets.connect('ws://localhost:%s' % port) as websocket:
+                while True:
+                    state = json.loads(await websocket.recv())
+                    if not state['running']:
+                        return state
+                    moves.append(state['players'][str(state['you'])])
+                    await websocket.send(json.dumps({'action': 'change_nothing'}))
+
+        async def run():
+            server = LocalServer(Simulator(6, 1, [Player(1, 0, 0, Directions.RIGHT, 1, True)]), timeout=1)
+            moves = []
+            serve = asyncio.ensure_future(server.serve(port=18081))
+            await asyncio.sleep(0.1)
+            final_state = await client(18081, moves)
+            return await serve, moves, final_state
+
+        alive, moves, final_state = asyncio.run(run())
+
+        self.assertTrue(alive == [])
+        self.assertTrue([move['x'] for move in moves] == [0, 1, 2, 3, 4, 5])
+        self.assertFalse(final_state['players']['1']['active'])
@@ -0,0 +1,43 @@
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from telemetry import Telemetry
+
+class TelemetryTest(unittest.TestCase):
+
+    def test_emit(self):
+        output = io.StringIO()
+        telemetry = Telemetry(output)
+
+        telemetry.emit({'turn': 1, 'nodes': 20})
+        telemetry.emit({'turn': 2, 'nodes': 30})
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertTrue(len(records) == 2)
+        self.assertTrue(records[1]['nodes'] == 30)
+        self.assertTrue('timestamp' in records[0])
+
+        # without output nothing is written
+        Telemetry().emit({'turn': 1})
+
+    def test_profile_slow_turn(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'turns.jsonl')
+            profiles = os.path.join(directory, 'profiles')
+            telemetry = Telemetry(path, slow_turn_threshold=0.05, profile_directory=profiles)
+
+            self.assertTrue(telemetry.profile(1, sum, [1, 2]) == 3)
+            telemetry.profile(2, time.sleep, 0.1)
+            telemetry.close()
+
+            self.assertTrue(os.listdir(profiles) == ['turn_2.prof'])
+            with open(path) as output:
+                records = [json.loads(line) for line in output]
+            self.assertTrue(records[0]['turn'] == 2 and records[0]['slow_turn'] > 0.05)
+
+        # without threshold the function is only called
+        self.assertTrue(Telemetry().profile(1, sum, [1, 2]) == 3)
@@ -0,0 +1,41 @@
+import unittest
+
+from tournament import parameter_grid, play_timed_match, run_tournament, wilson_interval
+
+class TournamentTest(unittest.TestCase):
+
+    def test_parameter_grid(self):
+        grid = parameter_grid({'depth': [2, 3], 'tau': [0.1], 'xi': [0.2, 0.4]})
+
+        self.assertTrue(len(grid) == 4)
+        self.assertTrue({'depth': 3, 'tau': 0.1, 'xi': 0.2} in grid)
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(50, 100)
+        self.assertTrue(abs(low - 0.4038) < 0.001 and abs(high - 0.5962) < 0.001)
+
+        self.assertTrue(wilson_interval(0, 10)[0] == 0)
+        self.assertTrue(wilson_interval(10, 10)[1] == 1)
+        self.assertTrue(wilson_interval(0, 0) == (0, 1))
+
+    def test_play_timed_match(self):
+        winner, decision_times, decisions = play_timed_match([{'depth': 2}, {'depth': 2}], 10, 10, seed=3)
+
+        self.assertTrue(winner in [None, 0, 1])
+        self.assertTrue(decisions[0] > 0 and decision_times[0] > 0)
+
+        # the same seed plays the same match
+        self.assertTrue(play_timed_match([{'depth': 2}, {'depth': 2}], 10, 10, seed=3)[2] == decisions)
+
+    def test_run_tournament(self):
+        configurations = [{'depth': 1}, {'depth': 3}]
+
+        results = run_tournament(configurations, 4, 10, 10, workers=2, seed=1)
+
+        self.assertTrue(len(results) == 2)
+        for result in results:
+            self.assertTrue(result['games'] == 4)
+            self.assertTrue(result['wins'] + result['draws'] + result['losses'] == 4)
+            self.assertTrue(result['win_rate_interval'][0] <= result['win_rate'] <= result['win_rate_interval'][1])
+            self.assertTrue(result['mean_latency'] > 0)
+        self.assertTrue(results[0]['wins'] == results[1]['losses'])
@@ -0,0 +1,43 @@
+import unittest
+
+from transposition_table import TranspositionTable
+
+class TranspositionTableTest(unittest.TestCase):
+
+    def test_get_and_put(self):
+        table = TranspositionTable(max_size=10)
+
+        self.assertTrue(table.get((1, 2)) is None)
+        table.put((1, 2), 'a')
+        self.assertTrue(table.get((1, 2)) == 'a')
+
+        self.assertTrue(table.get_hits() == 1)
+        self.assertTrue(table.get_misses() == 1)
+        self.assertTrue(len(table) == 1)
+
+        table.clear()
+
+        self.assertTrue(len(table) == 0)
+        self.assertTrue(table.get_hits() == 0)
+        self.assertTrue(table.get_misses() == 0)
+
+    def test_lru_eviction(self):
+        table = TranspositionTable(max_size=2)
+
+        table.put('a', 1)
+        table.put('b', 2)
+        table.get('a')
+        table.put('c', 3)
+
+        self.assertTrue(len(table) == 2)
+        self.assertTrue(table.get('a') == 1)
+        self.assertTrue(table.get('b') is None)
+        self.assertTrue(table.get('c') == 3)
+
+    def test_disabled(self):
+        table = TranspositionTable(max_size=0)
+
+        table.put('a', 1)
+
+        self.assertTrue(len(table) == 0)
+        self.assertTrue(table.get('a') is None)
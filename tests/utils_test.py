@@ -0,0 +1,16 @@
+import unittest
+
+from utils import parse_list, percentile
+
+class UtilsTest(unittest.TestCase):
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+
+        self.assertTrue(percentile(values, 0.5) == 50)
+        self.assertTrue(percentile(values, 0.99) == 99)
+        self.assertTrue(percentile([3], 0.99) == 3)
+
+    def test_parse_list(self):
+        self.assertTrue(parse_list('3,5,7', int) == [3, 5, 7])
+        self.assertTrue(parse_list('0.1', float) == [0.1])
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+
+import argparse
+import itertools
+import math
+import random
+
+from concurrent.futures import ProcessPoolExecutor
+from game import Game
+from simulator import play_match
+from utils import parse_list
+
+def parameter_grid(grid):
+    """Creates every combination of the given parameter values
+
+    Args:
+        grid (dict): The values of each parameter, e.g. {'depth': [3, 5], 'tau': [0.1]}
+
+    Returns:
+        list: The keyword arguments for Game of each combination
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*[grid[name] for name in names])]
+
+def wilson_interval(successes, trials, z=1.96):
+    """Calculates the Wilson score interval of a share
+
+    Args:
+        successes (int): Amount of successes
+        trials (int): Amount of trials
+        z (float, optional): Quantile of the normal distribution. Defaults to 1.96 (95 %).
+
+    Returns:
+        (float, float): Lower and upper bound, (0, 1) without trials
+    """
+    if trials == 0:
+        return 0.0, 1.0
+    share = successes / trials
+    denominator = 1 + z * z / trials
+    center = (share + z * z / (2 * trials)) / denominator
+    spread = z * math.sqrt(share * (1 - share) / trials + z * z / (4 * trials * trials)) / denominator
+    return max(0.0, center - spread), min(1.0, center + spread)
+
+def play_timed_match(settings, width, height, seed, max_rounds=1000):
+    """Plays a match between games with the given settings and measures their decisions
+
+    Args:
+        settings (list): Keyword arguments for Game of each player
+        width (int): The width of the playing field
+        height (int): The height of the playing field
+        seed (int): Seed of the start positions and of the random tie breaking
+        max_rounds (int, optional): Amount of rounds after which the match is stopped. Defaults to 1000.
+
+    Returns:
+        (int, list, list): The index of the winner in settings (None if no player or several survived),
+                           the seconds spent deciding and the amount of decisions of each player
+    """
+    random.seed(seed)
+    games = [Game(**game_settings) for game_settings in settings]
+    decision_times = [0.0] * len(games)
+    decisions = [0] * len(games)
+
+    def count_decision(player_id, seconds):
+        decision_times[player_id - 1] += seconds
+        decisions[player_id - 1] += 1
+
+    try:
+        winner = play_match(games, width, height, seed=seed, max_rounds=max_rounds, on_decision=count_decision)
+    finally:
+        for game in games:
+            game.close()
+    return None if winner is None else winner - 1, decision_times, decisions
+
+def _play_pairing(task):
+    first, second, settings, width, height, seed, max_rounds = task
+    winner, decision_times, decisions = play_timed_match(settings, width, height, seed, max_rounds)
+    return first, second, winner, decision_times, decisions
+
+def run_tournament(configurations, matches, width, height, workers=0, seed=0, max_rounds=1000):
+    """Plays every pair of configurations against each other. The start positions of a pair
+    are swapped every match, so both configurations start from the same positions equally often.
+
+    Args:
+        configurations (list): Keyword arguments for Game of each configuration
+        matches (int): Amount of matches per pair
+        width (int): The width of the playing field
+        height (int): The height of the playing field
+        workers (int, optional): Amount of worker processes, 0 plays in this process. Defaults to 0.
+        seed (int, optional): Seed of the first match. Defaults to 0.
+        max_rounds (int, optional): Amount of rounds after which a match is a draw. Defaults to 1000.
+
+    Returns:
+        list: For each configuration the settings, games, wins, draws, losses, the win rate,
+              its 95 % Wilson interval and the mean decision latency in seconds
+    """
+    tasks = []
+    for first, second in itertools.combinations(range(len(configurations)), 2):
+        for match in range(matches):
+            # the same start positions for two matches, once for each seat order
+            match_seed = seed + match // 2
+            if match % 2 == 0:
+                tasks.append((first, second, [configurations[first], configurations[second]], width, height, match_seed, max_rounds))
+            else:
+                tasks.append((second, first, [configurations[second], configurations[first]], width, height, match_seed, max_rounds))
+
+    if workers > 0:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_play_pairing, tasks))
+    else:
+        outcomes = [_play_pairing(task) for task in tasks]
+
+    results = [{'settings': configuration, 'games': 0, 'wins': 0, 'draws': 0, 'losses': 0, 'decision_time': 0.0, 'decisions': 0}
+               for configuration in configurations]
+    for first, second, winner, decision_times, decisions in outcomes:
+        for seat, index in enumerate([first, second]):
+            result = results[index]
+            result['games'] += 1
+            result['decision_time'] += decision_times[seat]
+            result['decisions'] += decisions[seat]
+            if winner is None:
+                result['draws'] += 1
+            elif winner == seat:
+                result['wins'] += 1
+            else:
+                result['losses'] += 1
+
+    for result in results:
+        result['win_rate'] = result['wins'] / result['games'] if result['games'] else 0.0
+        result['win_rate_interval'] = wilson_interval(result['wins'], result['games'])
+        result['mean_latency'] = result['decision_time'] / result['decisions'] if result['decisions'] else None
+        del result['decision_time']
+        del result['decisions']
+    return results
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Plays local matches between all combinations of the given parameters')
+    parser.add_argument('--depth', default='3,5')
+    parser.add_argument('--tau', default='0.1')
+    parser.add_argument('--xi', default='0.4')
+    parser.add_argument('--matches', type=int, default=20, help='matches per pair of configurations')
+    parser.add_argument('--size', default='30x30')
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--max-rounds', type=int, default=1000)
+    args = parser.parse_args()
+
+    configurations = parameter_grid({
+        'depth': parse_list(args.depth, int),
+        'tau': parse_list(args.tau, float),
+        'xi': parse_list(args.xi, float)
+    })
+    width, height = parse_list(args.size.replace('x', ','), int)
+    results = run_tournament(configurations, args.matches, width, height, workers=args.workers, seed=args.seed, max_rounds=args.max_rounds)
+
+    for result in sorted(results, key=lambda result: result['win_rate'], reverse=True):
+        low, high = result['win_rate_interval']
+        latency = result['mean_latency'] * 1000 if result['mean_latency'] is not None else float('nan')
+        print('%s: win rate %.2f (%.2f - %.2f), %s games, %s draws, %.1f ms per decision' % (
+            result['settings'], result['win_rate'], low, high, result['games'], result['draws'], latency))
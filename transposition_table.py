@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+class TranspositionTable:
+
+    def __init__(self, max_size=100000):
+        self._max_size = max_size
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key):
+        """Returns the entry stored for the given key and marks it as recently used
+
+        Args:
+            key (tuple): The key of the entry
+
+        Returns:
+            The stored entry, None if there is no entry for the key
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        """Stores an entry for the given key. If the table is full, the least recently used entry is evicted
+
+        Args:
+            key (tuple): The key of the entry
+            entry: The entry to store, must not be None
+        """
+        if self._max_size <= 0:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Removes all entries and resets the hit and miss counters"""
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def add_counts(self, hits, misses):
+        """Adds lookups of other tables (e.g. in worker processes) to the counters
+
+        Args:
+            hits (int): Amount of hits to add
+            misses (int): Amount of misses to add
+        """
+        self._hits += hits
+        self._misses += misses
+
+    def get_hits(self):
+        """Returns the number of successful lookups since the last clear
+
+        Returns:
+            int: Amount of hits
+        """
+        return self._hits
+
+    def get_misses(self):
+        """Returns the number of failed lookups since the last clear
+
+        Returns:
+            int: Amount of misses
+        """
+        return self._misses
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,27 @@
+import math
+
+def percentile(values, share):
+    """Returns the value below which the given share of the values lies (nearest rank)
+
+    Args:
+        values (list): The measured values
+        share (float): The share between 0 and 1
+
+    Returns:
+        float: The percentile
+    """
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, math.ceil(share * len(ordered)) - 1))
+    return ordered[index]
+
+def parse_list(value, convert):
+    """Parses a comma separated list of command line values
+
+    Args:
+        value (str): The values, e.g. '3,5,7'
+        convert (callable): Converts a single value, e.g. int
+
+    Returns:
+        list: The converted values
+    """
+    return [convert(x) for x in value.split(',')]